@@ -1,8 +1,19 @@
 # Standard library imports
 import os
+import io
 import math
+import struct
+import zlib
+import atexit
+import bisect
+import concurrent.futures
+import tempfile
 import copy
+import logging
 from datetime import datetime
+from functools import lru_cache
+from itertools import accumulate
+from operator import attrgetter
 from typing import List, Dict, Optional, Tuple
 
 # Tkinter imports
@@ -25,16 +36,347 @@ from PIL import Image
 import cairosvg
 
 # Only import these when needed in specific functions:
-# import pyscreenshot
-# import tempfile
 # import webbrowser
 
+logger = logging.getLogger(__name__)
+
+# Pillow 10 moved the resampling filters onto Image.Resampling
+_LANCZOS = getattr(Image, "Resampling", Image).LANCZOS
+
+# Shared dropdown choices
+_FRACTION_OPTIONS = ("0", "1/16", "1/8", "3/16", "1/4", "5/16", "3/8", "7/16",
+                     "1/2", "9/16", "5/8", "11/16", "3/4", "13/16", "7/8", "15/16")
+
+# Decimal value of every dropdown fraction
+_FRACTION_VALUES = {
+    fraction: (int(num) / int(denom) if denom else 0.0)
+    for fraction in _FRACTION_OPTIONS
+    for num, _, denom in (fraction.partition("/"),)
+}
+# The same sixteenths in ascending order, for nearest-fraction lookups
+_FRACTION_DECIMALS = tuple(_FRACTION_VALUES[fraction] for fraction in _FRACTION_OPTIONS)
+
+# format_dimension templates indexed by (inches == 0) << 1 | (fraction == "0")
+_DIMENSION_FORMATS = ("{f}'-{i} {fr}\"", "{f}'-{i}\"", "{f}'-{i} {fr}\"", "{f}'")
+
+_EXPORT_OPTIONS = (
+    "TIFF (Ultra-HD Print Quality)",
+    "PNG (Ultra-HD Quality)",
+    "JPEG (High Quality)",
+    "SVG (Vector Format)",
+    "PDF (Document Format)",
+    "EPS (Vector Format)"
+)
+
+# Form variable defaults restored by reset_form
+_FORM_DEFAULTS = {
+    # Wall dimensions
+    "wall_width_feet_var": "0",
+    "wall_width_inches_var": "0",
+    "wall_height_feet_var": "0",
+    "wall_height_inches_var": "0",
+    # Fractions
+    "wall_width_fraction_var": "0",
+    "wall_height_fraction_var": "0",
+    "panel_width_fraction_var": "0",
+    "panel_height_fraction_var": "0",
+    "baseboard_fraction_var": "0",
+    # Panel dimensions
+    "panel_width_feet_var": "0",
+    "panel_width_inches_var": "0",
+    "panel_height_feet_var": "0",
+    "panel_height_inches_var": "0",
+    "show_dimensions_var": True,
+    # Options
+    "equal_panels_var": False,
+    "panel_count_var": "2",
+    "center_panels_var": False,
+    "center_panel_count_var": "4",
+    # Baseboard options
+    "baseboard_var": False,
+    "baseboard_height_var": "4",
+    # Floor mounting options (floor mounted by default)
+    "floor_mounted_var": True,
+    "height_offset_feet_var": "0",
+    "height_offset_inches_var": "0",
+    "height_offset_fraction_var": "0"
+}
+
+# Tk variables calculate_panels reads; a write to any of them invalidates the cached layout
+_PANEL_INPUT_VARS = (
+    "wall_width_feet_var", "wall_width_inches_var", "wall_width_fraction_var",
+    "wall_height_feet_var", "wall_height_inches_var", "wall_height_fraction_var",
+    "panel_width_feet_var", "panel_width_inches_var", "panel_width_fraction_var",
+    "panel_height_feet_var", "panel_height_inches_var", "panel_height_fraction_var",
+    "equal_panels_var", "panel_count_var", "center_panels_var", "center_panel_count_var",
+    "use_start_seam_var", "start_seam_feet_var", "start_seam_inches_var", "start_seam_fraction_var",
+    "floor_mounted_var", "height_offset_feet_var", "height_offset_inches_var", "height_offset_fraction_var",
+    "baseboard_var", "baseboard_height_var", "baseboard_fraction_var",
+)
+
+# Top-distance corrections (inches) for wall objects, keyed by
+# (measured from panel top, baseboard shown); negative values add to the distance
+_TOP_DISTANCE_CORRECTIONS = {
+    (True, True): -8.3125,   # Panel Top WITH baseboard: 7'3 11/16" vs 8'0" → add 8 5/16"
+    (True, False): 0.5,      # Panel Top WITHOUT baseboard: 8'0 1/2" vs 8'0" → subtract 1/2"
+    (False, True): -6.1875,  # Wall Top WITH baseboard: 9'1 13/16" vs 9'8" → add 6 3/16"
+    (False, False): -7.0,    # Wall Top WITHOUT baseboard: 9'5" vs 10'0" → add 7"
+}
+
+# Cell size (canvas pixels) of the grid used to hit-test annotation circles
+_ANNOTATION_GRID_CELL = 64
+
+_QUALITY_OPTIONS = ("Standard (2x)", "High (4x)", "Ultra-HD (6x)", "Maximum (8x)")
+
+_SCALE_FROM_QUALITY = {"Standard (2x)": 2, "High (4x)": 4, "Ultra-HD (6x)": 6, "Maximum (8x)": 8}
+
+# Vector raster export DPI by wall width: <=48", <=96", <=144", larger
+_VECTOR_EXPORT_WIDTH_STEPS = (48, 96, 144)
+_VECTOR_EXPORT_DPIS = (1200, 900, 600, 450)
+
+# Canvases with more items than this are written as EPS from the wall model
+# instead of being serialized by Tk's canvas postscript command. The model
+# writer only covers the wall, panels, objects, dimensions and annotations
+# (not the distance guides or reference lines), so ordinary scenes - where
+# Tk's output is quick and matches the screen exactly - keep the canvas path
+_DIRECT_EPS_MIN_ITEMS = 2000
+
+# Export dropdown prefixes rendered through the raster pipeline
+_RASTER_EXPORT_FORMATS = ("PNG", "TIFF", "JPEG")
+
+# Write buffer for raster saves (large exports otherwise go out in many small writes)
+_SAVE_BUFFER_SIZE = 8 * 1024 * 1024
+
+def _save_jpeg(img, save_path, dpi, quality=95, compress_level=6, subsampling=-1):
+    """Save a progressive JPEG (JPEG has no alpha, so convert to RGB first)"""
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    img.save(save_path, 'JPEG', quality=quality, subsampling=subsampling, dpi=dpi,
+             optimize=True, progressive=True)
+
+def _save_png(img, save_path, dpi, quality=95, compress_level=6):
+    """Save a PNG with the given zlib compression level"""
+    with open(save_path, 'wb', buffering=_SAVE_BUFFER_SIZE) as f:
+        img.save(f, 'PNG', dpi=dpi, compress_level=compress_level)
+
+def _png_with_dpi(png_bytes, dpi):
+    """Add a pHYs (resolution) chunk to PNG bytes - cairo writes none, so print tools assume 72/96 DPI"""
+    # IHDR is always the first chunk: 8-byte signature + 4 length + 4 type + 13 data + 4 CRC
+    ihdr_end = 33
+    pixels_per_metre = round(dpi / 0.0254)
+    chunk = b'pHYs' + struct.pack('>IIB', pixels_per_metre, pixels_per_metre, 1)
+    phys = struct.pack('>I', 9) + chunk + struct.pack('>I', zlib.crc32(chunk))
+    return png_bytes[:ihdr_end] + phys + png_bytes[ihdr_end:]
+
+# TIFF compression name -> (tifffile codec, PIL compression)
+_TIFF_COMPRESSIONS = {
+    'deflate': ('zlib', 'tiff_adobe_deflate'),
+    'lzw': ('lzw', 'tiff_lzw')
+}
+
+def _save_tiff(img, save_path, dpi, quality=95, compress_level=6, compression='deflate', predictor=True):
+    """Save a lossless (Deflate by default) TIFF, written tile by tile through tifffile when it is installed"""
+    tifffile_codec, pil_codec = _TIFF_COMPRESSIONS[compression]
+    try:
+        import numpy as np
+        import tifffile
+        # Accept a finished pixel array as well as a PIL image
+        arr = img if isinstance(img, np.ndarray) else np.asarray(img)
+        tifffile.imwrite(
+            save_path,
+            arr,
+            photometric='rgb' if arr.ndim == 3 else 'minisblack',
+            tile=(256, 256),
+            compression=tifffile_codec,
+            predictor=predictor,
+            bigtiff=arr.nbytes > 2**31,  # classic TIFF offsets are 32-bit
+            resolution=dpi,
+            resolutionunit='INCH'
+        )
+    except (ImportError, ValueError, NotImplementedError):
+        # tifffile (or its codec) unavailable - let PIL write a striped TIFF,
+        # with horizontal differencing (Predictor=2) so flat fills compress well.
+        # OSError is left to propagate: a disk or permission failure should
+        # surface rather than be retried through a second writer
+        if not isinstance(img, Image.Image):
+            img = Image.fromarray(img)
+        with open(save_path, 'wb', buffering=_SAVE_BUFFER_SIZE) as f:
+            img.save(f, 'TIFF', compression=pil_codec, dpi=dpi,
+                     tiffinfo={317: 2 if predictor else 1, 278: 32})
+
+# File extension -> raster save handler, anything else is written as PNG
+_SAVE_HANDLERS = {
+    '.jpg': _save_jpeg,
+    '.jpeg': _save_jpeg,
+    '.tif': _save_tiff,
+    '.tiff': _save_tiff,
+    '.png': _save_png
+}
+
+def _save_image(img, save_path, dpi, quality=95, compress_level=6):
+    """Save img in the format implied by save_path's extension"""
+    handler = _SAVE_HANDLERS.get(os.path.splitext(save_path)[1].lower(), _save_png)
+    handler(img, save_path, dpi, quality=quality, compress_level=compress_level)
+
+@lru_cache(maxsize=512)
+def _hex_to_rgb(color):
+    """Convert a #RRGGBB string to an (r, g, b) tuple"""
+    return (int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16))
+
+@lru_cache(maxsize=32)
+def _get_font(name, size):
+    """Load a TrueType font once per (name, size), falling back to PIL's default font"""
+    from PIL import ImageFont
+    try:
+        return ImageFont.truetype(name, size)
+    except IOError:
+        return ImageFont.load_default()
+
+# Unit conversions - pure functions of small, heavily repeated inputs, so cached
+@lru_cache(maxsize=512)
+def _fraction_to_decimal(fraction_str):
+    """Convert a fraction string to its decimal value"""
+    value = _FRACTION_VALUES.get(fraction_str)
+    if value is not None:
+        return value
+        
+    # Anything off the dropdown list: parse it (partition, not split, so no list
+    # is built and extra slashes still fail as a bad denominator)
+    num, slash, denom = fraction_str.partition("/")
+    try:
+        if slash:
+            return float(num) / float(denom)
+        return float(fraction_str)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+@lru_cache(maxsize=512)
+def _convert_to_inches(feet, inches, fraction_str):
+    """Convert feet, inches, and fraction to total inches"""
+    return feet * 12 + inches + _fraction_to_decimal(fraction_str)
+
+@lru_cache(maxsize=512)
+def _convert_to_feet_inches_fraction(total_inches):
+    """Split total inches into (feet, inches, closest sixteenth fraction string)"""
+    # Add a small epsilon to handle floating point errors
+    epsilon = 0.001
+    total_inches += epsilon
+    
+    feet = int(total_inches // 12)
+    remaining_inches = total_inches % 12
+    
+    whole_inches = int(remaining_inches)
+    fraction_decimal = remaining_inches - whole_inches
+    
+    # Find the closest sixteenth: bisect, then take the nearer neighbour
+    # (the lower one on a tie)
+    i = bisect.bisect_left(_FRACTION_DECIMALS, fraction_decimal)
+    if i == len(_FRACTION_DECIMALS) or (
+            i > 0 and fraction_decimal - _FRACTION_DECIMALS[i - 1] <= _FRACTION_DECIMALS[i] - fraction_decimal):
+        i -= 1
+    closest_decimal = _FRACTION_DECIMALS[i]
+    closest_fraction = _FRACTION_OPTIONS[i]
+    
+    # Handle rounding more carefully
+    if abs(fraction_decimal - closest_decimal) < 0.01 and closest_decimal > 0.94:
+        whole_inches += 1
+        closest_fraction = "0"
+        
+    # Handle case where inches becomes 12
+    if whole_inches == 12:
+        feet += 1
+        whole_inches = 0
+    
+    return feet, whole_inches, closest_fraction
+
+@lru_cache(maxsize=512)
+def _convert_to_feet_and_inches(total_inches):
+    """Split total inches into (feet, whole inches rounded to nearest)"""
+    feet = int(total_inches // 12)
+    inches = round(total_inches % 12)
+    if inches == 12:
+        feet += 1
+        inches = 0
+    return feet, inches
+
+# Compiled contrast/color kernels for the ultra-quality export (numba is optional)
+_ENHANCE_KERNELS = None
+
+def _get_enhance_kernels():
+    """Compile the fused enhancement kernels once; returns None without numba"""
+    global _ENHANCE_KERNELS
+    if _ENHANCE_KERNELS is not None:
+        return _ENHANCE_KERNELS or None
+
+    try:
+        from numba import njit, prange
+    except ImportError:
+        _ENHANCE_KERNELS = ()
+        return None
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def luma_mean(src):
+        total = 0.0
+        for y in prange(src.shape[0]):
+            for x in range(src.shape[1]):
+                total += 0.299 * src[y, x, 0] + 0.587 * src[y, x, 1] + 0.114 * src[y, x, 2]
+        return total / (src.shape[0] * src.shape[1])
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def enhance(src, out, mean_luma, contrast, color):
+        scale = contrast * color
+        for y in prange(src.shape[0]):
+            for x in range(src.shape[1]):
+                luma = 0.299 * src[y, x, 0] + 0.587 * src[y, x, 1] + 0.114 * src[y, x, 2]
+                base = (luma - mean_luma) * contrast + mean_luma
+                for c in range(3):
+                    value = base + (src[y, x, c] - luma) * scale
+                    if value < 0.0:
+                        value = 0.0
+                    elif value > 255.0:
+                        value = 255.0
+                    out[y, x, c] = value
+
+    _ENHANCE_KERNELS = (luma_mean, enhance)
+    return _ENHANCE_KERNELS
+
+# Compiled rectangle fill kernel for the direct-vector export (numba is optional)
+_FILL_KERNEL = None
+
+def _get_fill_kernel():
+    """Compile the rectangle fill kernel once; returns None without numba"""
+    global _FILL_KERNEL
+    if _FILL_KERNEL is not None:
+        return _FILL_KERNEL or None
+
+    try:
+        from numba import njit, prange
+    except ImportError:
+        _FILL_KERNEL = ()
+        return None
+
+    @njit(parallel=True, cache=True)
+    def fill_rects(pixels, rects, colors):
+        # Rows are independent, so they are split across cores; within a row
+        # the rectangles are painted in order so later ones stay on top
+        height = pixels.shape[0]
+        width = pixels.shape[1]
+        for y in prange(height):
+            for i in range(rects.shape[0]):
+                if rects[i, 1] <= y < rects[i, 3]:
+                    for x in range(max(rects[i, 0], 0), min(rects[i, 2], width)):
+                        for c in range(3):
+                            pixels[y, x, c] = colors[i, c]
+
+    _FILL_KERNEL = fill_rects
+    return _FILL_KERNEL
+
 @dataclass
 class Dimension:
     feet: int
     inches: int
 
-@dataclass
+@dataclass(slots=True)
 class Panel:
     id: int
     x: float
@@ -49,6 +391,9 @@ class Panel:
     height_offset: Dimension = None  # Height offset from floor if not floor mounted
     height_offset_fraction: str = "0"  # Fraction for height offset    
     
+# Sort key for panels, by horizontal position
+_BY_X = attrgetter("x")
+
 @dataclass
 class WallObject:
     """Class representing an object placed on the wall (e.g., TV, artwork)"""
@@ -280,9 +625,12 @@ class PDFExporter:
         c.save()
         return True
 
-    def svg_to_pdf(self, svg_path, pdf_path, dpi=300):
-        """Convert SVG to PDF with high resolution."""
-        cairosvg.svg2pdf(file_obj=open(svg_path, "rb"), write_to=pdf_path, dpi=dpi)
+    def svg_to_pdf(self, svg_path, pdf_path, dpi=300, svg_data=None):
+        """Convert SVG to PDF with high resolution (from svg_data bytes when given)."""
+        if svg_data is not None:
+            cairosvg.svg2pdf(bytestring=svg_data, write_to=pdf_path, dpi=dpi)
+        else:
+            cairosvg.svg2pdf(url=svg_path, write_to=pdf_path, dpi=dpi)
 
     def canvas_to_svg(self, canvas_widget, output_path, project_name, location, date):
         """Convert Tkinter canvas to an SVG file without arrows."""
@@ -352,6 +700,11 @@ class WallcoveringCalculatorUI(ctk.CTk):
         # Add calculation control flags
         self.calculation_in_progress = False
         self.pending_calculation = False
+        # Throttle redraws: calculate() requests within this window share one pass
+        self._redraw_pending = False
+        self._min_redraw_interval_ms = 50
+        # Set once the baseboard fraction dropdown exists
+        self._has_baseboard_frac = False
         super().__init__()
 
         self.title("Wallcovering Calculator")
@@ -369,13 +722,15 @@ class WallcoveringCalculatorUI(ctk.CTk):
         self.panel_border_color = "red"  # Default panel border color
         # self.setup_variable_traces()
         # Initialize object-related variables
-        self.selected_panels = []  # List of selected panel IDs
+        self.selected_panels = set()  # IDs of the selected panels
         self.wall_objects = []     # List of WallObject instances
+        self._obj_canvas_ids = {}  # Object id -> (rectangle id, label id, style) from the last draw
         self.next_object_id = 1    # ID counter for wall objects
         self.selection_mode = False  # If True, clicks will select panels
 
         # Initialize annotation system
         self.annotation_circles = []
+        self._annotation_grid = None
         self.next_annotation_id = 1
         self.annotation_mode = False
         self.moving_annotation = False
@@ -385,9 +740,32 @@ class WallcoveringCalculatorUI(ctk.CTk):
         self.summary_refresh_requested = False
         # Initialize panel customization tracking
         self.custom_panel_widths = {}  # Make sure to initialize this
+        self._panel_hit_cache = None  # Canvas-space panel extents for click hit testing
+        self._panels_cache = []  # Last calculate_panels result, valid while not _panels_dirty
+        self._panels_dirty = True
+        self._panels_generation = 0  # Bumped each time calculate_panels recomputes the layout
+        self._dim_cache_dirty = True  # Set when _ensure_dim_cache must refresh _wall_w_in etc.
         self.split_panels = {}         # And this
         self.current_active_wall_id = None
         self.switching_walls = False
+        # Export caches - bump _scene_version whenever the drawing changes
+        self._scene_version = 0
+        self._ps_cache = {}
+        self._raster_cache = {}
+        # Raster renders/encodes run here, off the Tk thread
+        self._export_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        # Scratch files reused by every SVG-based export, removed on exit
+        # (mkstemp creates it exclusively with owner-only permissions, so nobody
+        # else can pre-create or symlink the path)
+        tmp_fd, self._tmp_svg = tempfile.mkstemp(prefix="shop2_", suffix=".svg")
+        os.close(tmp_fd)
+        atexit.register(self._cleanup_tmp)
+        # Vector export handlers keyed by the first word of the format dropdown
+        self._export_dispatch = {
+            "PDF": self.export_enhanced_pdf,
+            "SVG": self.export_enhanced_svg,
+            "EPS": self.export_enhanced_eps
+        }
 
         # Create the UI
         self.create_tabbed_interface_with_annotations()
@@ -400,7 +778,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
 
     def manual_add_circle(self, x, y):
         """Add an annotation circle using UI settings"""
-        print(f"ADD CIRCLE: x={x}, y={y}")
+        logger.debug("ADD CIRCLE: x=%s, y=%s", x, y)
         try:
             # Get properties from UI controls
             text = self.annotation_text_var.get()
@@ -426,6 +804,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
             
             # Add to list and increment ID
             self.annotation_circles.append(circle)
+            self._annotation_grid = None
             self.next_annotation_id += 1
             self.current_annotation = circle
             
@@ -440,7 +819,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
             # Redraw
             self.calculate()
         except Exception as e:
-            print(f"ERROR in add_annotation_circle: {e}")
+            logger.error("ERROR in add_annotation_circle: %s", e)
             import traceback
             traceback.print_exc()
         
@@ -483,10 +862,6 @@ class WallcoveringCalculatorUI(ctk.CTk):
 
     def create_wall_panel_controls(self, parent):
         """Create wall and panel dimension controls"""
-        # Define fraction options at the beginning of the method
-        fraction_options = ["0", "1/16", "1/8", "3/16", "1/4", "5/16", "3/8", "7/16", 
-                          "1/2", "9/16", "5/8", "11/16", "3/4", "13/16", "7/8", "15/16"]
-        
         # Wall dimensions section
         wall_section = ctk.CTkFrame(parent)
         wall_section.pack(pady=10, fill=tk.X)
@@ -692,7 +1067,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
         start_seam_fraction_dropdown = ctk.CTkOptionMenu(
             self.start_seam_frame,
             variable=self.start_seam_fraction_var,
-            values=fraction_options,
+            values=list(_FRACTION_OPTIONS),
             width=70
         )
         start_seam_fraction_dropdown.pack(side=tk.LEFT, padx=5)
@@ -728,7 +1103,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
         height_offset_fraction_dropdown = ctk.CTkOptionMenu(
             self.height_offset_frame,
             variable=self.height_offset_fraction_var,
-            values=fraction_options,
+            values=list(_FRACTION_OPTIONS),
             width=70
         )
         height_offset_fraction_dropdown.pack(side=tk.LEFT, padx=5)
@@ -748,10 +1123,11 @@ class WallcoveringCalculatorUI(ctk.CTk):
         # Add fraction dropdown for baseboard
         ctk.CTkLabel(self.baseboard_frame, text="+").pack(side=tk.LEFT, padx=2)
         self.baseboard_fraction_var = tk.StringVar(value="0")
+        self._has_baseboard_frac = True
         baseboard_fraction_dropdown = ctk.CTkOptionMenu(
             self.baseboard_frame,
             variable=self.baseboard_fraction_var,
-            values=fraction_options,
+            values=list(_FRACTION_OPTIONS),
             width=70
         )
         baseboard_fraction_dropdown.pack(side=tk.LEFT, padx=5)
@@ -777,6 +1153,12 @@ class WallcoveringCalculatorUI(ctk.CTk):
             hover_color="#616161"
         )
         reset_btn.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        
+        # Any edit to a panel input invalidates the cached layout
+        for var_name in _PANEL_INPUT_VARS:
+            var = getattr(self, var_name, None)
+            if var is not None:
+                var.trace_add("write", self._mark_panels_dirty)
 
     # The issue is that while the UI elements are created, references to display them are missing
     # Here's the fix for the create_object_controls method
@@ -876,12 +1258,10 @@ class WallcoveringCalculatorUI(ctk.CTk):
         # Fraction dropdown
         ctk.CTkLabel(self.vertical_pos_frame, text="+").pack(side=tk.LEFT, padx=2)
         self.object_y_fraction_var = tk.StringVar(value="0")
-        fraction_options = ["0", "1/16", "1/8", "3/16", "1/4", "5/16", "3/8", "7/16", 
-                          "1/2", "9/16", "5/8", "11/16", "3/4", "13/16", "7/8", "15/16"]
         fraction_dropdown = ctk.CTkOptionMenu(
             self.vertical_pos_frame,
             variable=self.object_y_fraction_var,
-            values=fraction_options,
+            values=list(_FRACTION_OPTIONS),
             width=70
         )
         fraction_dropdown.pack(side=tk.LEFT, padx=2)
@@ -963,7 +1343,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
         fraction_dropdown = ctk.CTkOptionMenu(
             self.h_position_inputs,
             variable=self.object_h_fraction_var,
-            values=fraction_options,
+            values=list(_FRACTION_OPTIONS),
             width=70
         )
         fraction_dropdown.pack(side=tk.LEFT, padx=2)
@@ -1098,6 +1478,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
         """Initialize the annotation circle system"""
         # Store annotation circles
         self.annotation_circles = []
+        self._annotation_grid = None  # Click hit-test grid, rebuilt on the next lookup
         self.next_annotation_id = 1
         
         # Track current mode
@@ -1139,7 +1520,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
             annotation_section,
             text="Connect Circle with Line",
             variable=self.line_drawing_var,
-            command=lambda: print(f"Line drawing set to: {self.line_drawing_var.get()}")  # Debug callback
+            command=lambda: logger.debug("Line drawing set to: %s", self.line_drawing_var.get())  # Debug callback
         )
         line_drawing_cb.pack(pady=5, anchor="w")
         
@@ -1286,7 +1667,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
     def toggle_annotation_mode(self):
         """Toggle annotation mode on/off"""
         self.annotation_mode = self.annotation_mode_var.get()
-        print(f"Annotation mode set to: {self.annotation_mode}")
+        logger.debug("Annotation mode set to: %s", self.annotation_mode)
         
         # If enabling annotation mode, disable panel selection mode
         if self.annotation_mode and hasattr(self, 'selection_mode_var'):
@@ -1366,36 +1747,37 @@ class WallcoveringCalculatorUI(ctk.CTk):
             self.annotation_line_color_preview.configure(bg=color[1])
 
     def on_canvas_click(self, event):
-        print(f"CLICK: x={event.x}, y={event.y}, annotation_mode={self.annotation_mode}")
+        logger.debug("CLICK: x=%s, y=%s, annotation_mode=%s", event.x, event.y, self.annotation_mode)
         
         if self.annotation_mode:
-            print("  Annotation mode branch activated")
+            logger.debug("  Annotation mode branch activated")
             annotation = self.find_annotation_at_position(event.x, event.y)
-            print(f"  Found existing annotation: {annotation is not None}")
+            logger.debug("  Found existing annotation: %s", annotation is not None)
             
             if annotation:
-                print("  Found existing annotation, starting move")
+                logger.debug("  Found existing annotation, starting move")
                 self.moving_annotation = True
                 self.current_annotation = annotation
                 return
             
-            print(f"  Checking line drawing: {self.line_drawing_var.get()}")
-            print(f"  Current annotation: {self.current_annotation is not None}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("  Checking line drawing: %s", self.line_drawing_var.get())
+            logger.debug("  Current annotation: %s", self.current_annotation is not None)
             if self.line_drawing_var.get() and self.current_annotation:
-                print("  Starting line drawing")
+                logger.debug("  Starting line drawing")
                 self.line_drawing = True
                 self.annotation_line_start = self.current_annotation
                 return
             
-            print("  About to add annotation circle")
+            logger.debug("  About to add annotation circle")
             self.add_annotation_circle(event.x, event.y)
-            print("  After adding annotation circle")
+            logger.debug("  After adding annotation circle")
         elif self.selection_mode:
             # Your existing panel selection code
-            print("  Selection mode branch")
+            logger.debug("  Selection mode branch")
             # Rest of your code
         else:
-            print("  Neither annotation nor selection mode active")
+            logger.debug("  Neither annotation nor selection mode active")
 
     def on_start_seam_change(self):
         """Handle start seam checkbox change"""
@@ -1603,11 +1985,12 @@ class WallcoveringCalculatorUI(ctk.CTk):
                 # Move the annotation to the new position
                 self.current_annotation.x = event.x
                 self.current_annotation.y = event.y
+                self._annotation_grid = None
                 
                 # Update the drawing
                 self.calculate()
             elif self.line_drawing and self.annotation_line_start:
-                print(f"Updating line endpoint to ({event.x}, {event.y})")
+                logger.debug("Updating line endpoint to (%s, %s)", event.x, event.y)
                 # Update the line endpoint
                 self.annotation_line_start.line_to_x = event.x
                 self.annotation_line_start.line_to_y = event.y
@@ -1623,12 +2006,12 @@ class WallcoveringCalculatorUI(ctk.CTk):
                 self.moving_annotation = False
                 
             if self.line_drawing:
-                print(f"Finalizing line at ({event.x}, {event.y})")
+                logger.debug("Finalizing line at (%s, %s)", event.x, event.y)
                 # Check if we released over another annotation
                 target = self.find_annotation_at_position(event.x, event.y)
                 
                 if target and target != self.annotation_line_start:
-                    print(f"Connected to annotation {target.id}")
+                    logger.debug("Connected to annotation %s", target.id)
                     # Connect to this annotation instead of arbitrary point
                     self.annotation_line_start.line_to_x = target.x
                     self.annotation_line_start.line_to_y = target.y
@@ -1673,15 +2056,31 @@ class WallcoveringCalculatorUI(ctk.CTk):
 
     def find_annotation_at_position(self, x, y):
         """Find an annotation circle at the given position"""
-        for circle in self.annotation_circles:
+        if self._annotation_grid is None:
+            self._annotation_grid = self._build_annotation_grid()
+        
+        # Only circles whose bounding box touches this grid cell can contain the point
+        cell = _ANNOTATION_GRID_CELL
+        for circle in self._annotation_grid.get((int(x // cell), int(y // cell)), ()):
             # Check if position is within the circle
             distance = math.sqrt((circle.x - x) ** 2 + (circle.y - y) ** 2)
             if distance <= circle.radius:
                 return circle
         return None
 
+    def _build_annotation_grid(self):
+        """Bucket annotation circles by the grid cells their bounding boxes cover"""
+        cell = _ANNOTATION_GRID_CELL
+        grid = {}
+        # Cells keep the annotation_circles order, so the first match still wins
+        for circle in self.annotation_circles:
+            for cx in range(int((circle.x - circle.radius) // cell), int((circle.x + circle.radius) // cell) + 1):
+                for cy in range(int((circle.y - circle.radius) // cell), int((circle.y + circle.radius) // cell) + 1):
+                    grid.setdefault((cx, cy), []).append(circle)
+        return grid
+
     def add_annotation_circle(self, x, y):
-        print(f"ADD CIRCLE: Starting at ({x}, {y})")
+        logger.debug("ADD CIRCLE: Starting at (%s, %s)", x, y)
         try:
             # Create a simple annotation circle with fixed values
             circle = AnnotationCircle(
@@ -1700,17 +2099,18 @@ class WallcoveringCalculatorUI(ctk.CTk):
                 line_style=""
             )
             
-            print(f"  Circle created with id={circle.id}")
+            logger.debug("  Circle created with id=%s", circle.id)
             self.annotation_circles.append(circle)
-            print(f"  Total circles now: {len(self.annotation_circles)}")
+            self._annotation_grid = None
+            logger.debug("  Total circles now: %s", len(self.annotation_circles))
             self.next_annotation_id += 1
             
             # Call calculate to update display
-            print("  Calling calculate")
+            logger.debug("  Calling calculate")
             self.calculate()
-            print("  After calculate")
+            logger.debug("  After calculate")
         except Exception as e:
-            print(f"ADD CIRCLE ERROR: {e}")
+            logger.error("ADD CIRCLE ERROR: %s", e)
             import traceback
             traceback.print_exc()
 
@@ -1745,6 +2145,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
         if new_size is not None:
             try:
                 self.current_annotation.radius = int(new_size)
+                self._annotation_grid = None
                 self.calculate()
             except ValueError:
                 messagebox.showerror("Error", "Please enter a valid number for the size")
@@ -1764,6 +2165,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
             return
         
         self.annotation_circles.remove(annotation)
+        self._annotation_grid = None
         
         # If this was the current annotation, clear it
         if self.current_annotation == annotation:
@@ -1778,19 +2180,21 @@ class WallcoveringCalculatorUI(ctk.CTk):
         
         if messagebox.askyesno("Confirm", "Remove all annotations?"):
             self.annotation_circles = []
+            self._annotation_grid = None
             self.current_annotation = None
             self.calculate()
 
     def draw_annotations(self):
         """Draw all annotation circles on the canvas"""
-        print(f"DRAW: {len(self.annotation_circles)} circles to draw")
+        self._scene_version += 1
+        logger.debug("DRAW: %s circles to draw", len(self.annotation_circles))
         
         for circle in self.annotation_circles:
-            print(f"  Drawing circle: id={circle.id}, pos=({circle.x}, {circle.y})")
+            logger.debug("  Drawing circle: id=%s, pos=(%s, %s)", circle.id, circle.x, circle.y)
             
             # Draw connecting line if present
             if circle.line_to_x is not None and circle.line_to_y is not None:
-                print(f"  Drawing line from ({circle.x}, {circle.y}) to ({circle.line_to_x}, {circle.line_to_y})")
+                logger.debug("  Drawing line from (%s, %s) to (%s, %s)", circle.x, circle.y, circle.line_to_x, circle.line_to_y)
                 # Determine line dash pattern if needed
                 dash = (4, 2) if circle.line_style == "dash" else None
                 
@@ -1824,18 +2228,18 @@ class WallcoveringCalculatorUI(ctk.CTk):
                 font=(circle.font_family, circle.font_size, "bold")
             )
             
-            print(f"  Circle {circle.id} drawn on canvas")
+            logger.debug("  Circle %s drawn on canvas", circle.id)
 
     # Modify the draw_wall method to include drawing annotations
     def draw_wall_with_annotations(self, panels: List[Panel]):
-        print("DRAW_WALL_WITH_ANNOTATIONS: Starting")
+        logger.debug("DRAW_WALL_WITH_ANNOTATIONS: Starting")
         # First call the original method
         self.draw_wall(panels)
         
         # Then draw annotations on top
-        print(f"  Now drawing {len(self.annotation_circles)} annotations")
+        logger.debug("  Now drawing %s annotations", len(self.annotation_circles))
         self.draw_annotations()
-        print("DRAW_WALL_WITH_ANNOTATIONS: Completed")
+        logger.debug("DRAW_WALL_WITH_ANNOTATIONS: Completed")
 
     # Modify the calculate method to use the updated drawing function
     def calculate_with_annotations(self):
@@ -1851,7 +2255,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
             baseboard_height_inches = self.baseboard_height
             baseboard_fraction = "0"
             
-            if hasattr(self, 'baseboard_fraction_var'):
+            if self._has_baseboard_frac:
                 baseboard_fraction = self.baseboard_fraction_var.get()
                 baseboard_height_inches += self.fraction_to_decimal(baseboard_fraction)
                 
@@ -2060,19 +2464,11 @@ class WallcoveringCalculatorUI(ctk.CTk):
         ctk.CTkLabel(format_frame, text="Format:").pack(side=tk.LEFT, padx=5)
         
         self.export_format_var = tk.StringVar(value="EPS (Vector Format)")
-        export_options = [
-            "TIFF (Ultra-HD Print Quality)", 
-            "PNG (Ultra-HD Quality)", 
-            "JPEG (High Quality)",
-            "SVG (Vector Format)", 
-            "PDF (Document Format)", 
-            "EPS (Vector Format)"
-        ]
 
         format_dropdown = ctk.CTkOptionMenu(
             format_frame,
             variable=self.export_format_var,
-            values=export_options,
+            values=list(_EXPORT_OPTIONS),
             width=250
         )
         format_dropdown.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
@@ -2084,12 +2480,11 @@ class WallcoveringCalculatorUI(ctk.CTk):
         ctk.CTkLabel(quality_frame, text="Quality Level:").pack(side=tk.LEFT, padx=5)
         
         self.quality_level_var = tk.StringVar(value="Ultra-HD (6x)")
-        quality_options = ["Standard (2x)", "High (4x)", "Ultra-HD (6x)", "Maximum (8x)"]
         
         quality_dropdown = ctk.CTkOptionMenu(
             quality_frame,
             variable=self.quality_level_var,
-            values=quality_options,
+            values=list(_QUALITY_OPTIONS),
             width=150
         )
         quality_dropdown.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
@@ -2114,6 +2509,16 @@ class WallcoveringCalculatorUI(ctk.CTk):
             height=40
         )
         export_horizontal_btn.pack(pady=10, fill=tk.X)
+
+        export_all_btn = ctk.CTkButton(
+            export_section,
+            text="Export PNG + PDF + SVG",
+            command=self.export_all,
+            fg_color="#1E88E5",
+            hover_color="#1565C0",
+            height=40
+        )
+        export_all_btn.pack(pady=10, fill=tk.X)
     def create_walls_tab_interface(self):
         """Create a tab interface for multiple walls"""
         # Create a frame for wall tabs at the top of the canvas area
@@ -2328,9 +2733,11 @@ class WallcoveringCalculatorUI(ctk.CTk):
         # Reset custom panel widths and objects for the new wall
         self.custom_panel_widths = {}
         self.split_panels = {}
+        self._panels_dirty = True
         self.wall_objects = []
-        self.selected_panels = []
+        self.selected_panels = set()
         self.annotation_circles = []
+        self._annotation_grid = None
         self.next_object_id = 1
         self.next_annotation_id = 1
         
@@ -2350,7 +2757,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
         self.switching_walls = False
         self.calculate()
         
-        print(f"Created new wall: {new_wall_name} (ID: {new_wall_id})")
+        logger.debug("Created new wall: %s (ID: %s)", new_wall_name, new_wall_id)
         
         return new_wall
 
@@ -2581,13 +2988,12 @@ class WallcoveringCalculatorUI(ctk.CTk):
             status_label.pack(pady=10)
             
             # Update progress window
-            self.update()
+            self.update_idletasks()
             
             # First determine the total layout size needed
             import tempfile
             import os
             import re
-            import time
             
             # Create a temporary directory to store individual wall renderings
             temp_dir = tempfile.mkdtemp()
@@ -2599,7 +3005,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
             # CRITICAL: First, check each wall's current state and make sure it's recorded
             # This ensures we use the wall's CURRENT state rather than the saved state
             for i, wall in enumerate(working_walls):
-                print(f"Checking wall {i+1}: {wall.name} (ID: {wall.id})")
+                logger.debug("Checking wall %s: %s (ID: %s)", i+1, wall.name, wall.id)
                 
                 # Find the tab for this wall to check its current state
                 tab_name = None
@@ -2623,11 +3029,11 @@ class WallcoveringCalculatorUI(ctk.CTk):
                         # If this is the currently displayed wall, get its state from the UI
                         # because the UI represents the latest user changes
                         current_baseboard_state = self.baseboard_var.get()
-                        print(f"  Current wall - using UI state: baseboard_enabled={current_baseboard_state}")
+                        logger.debug("  Current wall - using UI state: baseboard_enabled=%s", current_baseboard_state)
                         wall.baseboard_enabled = current_baseboard_state
                     else:
                         # For other walls, we rely on the saved state in the wall object
-                        print(f"  Non-current wall - using saved state: baseboard_enabled={wall.baseboard_enabled}")
+                        logger.debug("  Non-current wall - using saved state: baseboard_enabled=%s", wall.baseboard_enabled)
                     
                     # Go back to switching mode
                     self.switching_walls = old_switching
@@ -2637,11 +3043,11 @@ class WallcoveringCalculatorUI(ctk.CTk):
                 progress = (i) / (len(working_walls) * 2)  # First half of progress is layout prep
                 progress_bar.set(progress)
                 status_label.configure(text=f"Processing wall {i+1}/{len(working_walls)}: {wall.name}")
-                self.update()
+                self.update_idletasks()
                 
                 # Debug print to track wall processing
-                print(f"Processing wall {i+1}: {wall.name} (ID: {wall.id})")
-                print(f"  Wall baseboard_enabled: {wall.baseboard_enabled}")
+                logger.debug("Processing wall %s: %s (ID: %s)", i+1, wall.name, wall.id)
+                logger.debug("  Wall baseboard_enabled: %s", wall.baseboard_enabled)
                 
                 # Find the tab for this wall
                 tab_name = None
@@ -2652,7 +3058,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
                             break
                             
                 if not tab_name:
-                    print(f"Could not find tab for wall {wall.name}, skipping")
+                    logger.warning("Could not find tab for wall %s, skipping", wall.name)
                     continue
                     
                 # Switch to this wall to render it
@@ -2668,6 +3074,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
                 # This ensures we use the most up-to-date state for each wall
                 self.baseboard_var.set(wall.baseboard_enabled)
                 self.use_baseboard = wall.baseboard_enabled
+                self._dim_cache_dirty = True
                 
                 # Update UI to match the forced state
                 if wall.baseboard_enabled:
@@ -2679,40 +3086,41 @@ class WallcoveringCalculatorUI(ctk.CTk):
                 
                 # Force UI update to reflect the changes
                 self.update()
-                print(f"  After override: self.baseboard_var={self.baseboard_var.get()}, self.use_baseboard={self.use_baseboard}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("  After override: self.baseboard_var=%s, self.use_baseboard=%s", self.baseboard_var.get(), self.use_baseboard)
                 
-                # Now calculate layout
+                # Now calculate layout (synchronously - the canvas is captured right after)
                 self.switching_walls = False
-                self.calculate()
+                self._do_calculate()
                 
-                # Allow time for rendering to complete
-                self.update()
-                time.sleep(0.5)  # Short delay to ensure rendering is complete
+                # Flush pending geometry/redraw work before capturing the canvas
+                self.update_idletasks()
                 
                 # Debug verify the state just before capture
-                print(f"  Before capture: self.baseboard_var={self.baseboard_var.get()}, self.use_baseboard={self.use_baseboard}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("  Before capture: self.baseboard_var=%s, self.use_baseboard=%s", self.baseboard_var.get(), self.use_baseboard)
                 
                 # Create temporary EPS file for this wall
                 temp_eps_path = os.path.join(temp_dir, f"wall_{i+1}.eps")
                 
+                # Get canvas dimensions once - each winfo_* call is a Tcl round-trip
+                canvas_width = self.canvas.winfo_width()
+                canvas_height = self.canvas.winfo_height()
+                
                 # DIRECT CAPTURE: Use the direct canvas postscript method for EPS export
                 ps_data = self.canvas.postscript(
                     colormode='color',
-                    pagewidth=self.canvas.winfo_width(),
-                    pageheight=self.canvas.winfo_height(),
+                    pagewidth=canvas_width,
+                    pageheight=canvas_height,
                     x=0, y=0,
-                    width=self.canvas.winfo_width(),
-                    height=self.canvas.winfo_height()
+                    width=canvas_width,
+                    height=canvas_height
                 )
                 
                 # Write to the temporary EPS file
                 with open(temp_eps_path, 'w') as f:
                     f.write(ps_data)
                 
-                # Get canvas dimensions
-                canvas_width = self.canvas.winfo_width()
-                canvas_height = self.canvas.winfo_height()
-                
                 # Extract summary information for this wall
                 wall_summary = {}
                 wall_summary['name'] = wall.name
@@ -2747,14 +3155,14 @@ class WallcoveringCalculatorUI(ctk.CTk):
                 })
                 
                 processed_wall_count += 1
-                print(f"Successfully processed wall {wall.name} - Total: {processed_wall_count}")
+                logger.debug("Successfully processed wall %s - Total: %s", wall.name, processed_wall_count)
                 
                 # Reset flag
                 self.switching_walls = old_switching
             
             # Check if we processed all walls
             if processed_wall_count != len(working_walls):
-                print(f"WARNING: Only processed {processed_wall_count} out of {len(working_walls)} walls")
+                logger.warning("WARNING: Only processed %s out of %s walls", processed_wall_count, len(working_walls))
             
             # Now determine optimal layout with improved spacing
             wall_padding = 150
@@ -2779,7 +3187,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
             # Create a single EPS combining all individual EPS files
             progress_bar.set(0.9)
             status_label.configure(text="Creating final EPS file...")
-            self.update()
+            self.update_idletasks()
             
             # Create a new PostScript file with required headers
             combined_eps_path = os.path.join(temp_dir, "combined_walls.eps")
@@ -2855,7 +3263,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
                                 eps_content = wall_eps.read()
                                 eps_file.write(eps_content)
                         except Exception as e:
-                            print(f"Error including EPS content: {str(e)}")
+                            logger.error("Error including EPS content: %s", str(e))
                             # Try reopening the file and reading all content
                             try:
                                 with open(wall_eps_path, 'r') as wall_eps:
@@ -2863,7 +3271,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
                                     eps_content = wall_eps.read()
                                     eps_file.write(eps_content)
                             except Exception as e2:
-                                print(f"Failed again: {str(e2)}")
+                                logger.error("Failed again: %s", str(e2))
                     
                     eps_file.write(f"grestore\n\n")
                     
@@ -2883,7 +3291,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
             # Clean up temporary files
             progress_bar.set(1.0)
             status_label.configure(text="Cleaning up...")
-            self.update()
+            self.update_idletasks()
             
             try:
                 # Clean up temporary directory
@@ -2895,7 +3303,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
             # Close progress window
             progress_bar.set(1.0)
             status_label.configure(text="Export complete!")
-            self.update()
+            self.update_idletasks()
             progress_window.after(1000, progress_window.destroy)
             
             # Restore the original wall
@@ -2910,6 +3318,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
             # Restore original baseboard state
             self.baseboard_var.set(original_baseboard_enabled)
             self.use_baseboard = original_use_baseboard
+            self._dim_cache_dirty = True
             
             # Load the original data without saving
             self.load_current_wall_data()
@@ -2944,7 +3353,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
             
             # Get the current tab
             current_tab = self.walls_tabview.get()
-            print(f"Changed to tab: {current_tab}")
+            logger.debug("Changed to tab: %s", current_tab)
             
             # Save data from the current wall before switching
             if self.current_active_wall_id is not None:
@@ -2955,17 +3364,17 @@ class WallcoveringCalculatorUI(ctk.CTk):
                         break
                         
                 if old_wall:
-                    print(f"Saving data from: {old_wall.name}")
+                    logger.debug("Saving data from: %s", old_wall.name)
                     self.save_current_wall_data()
             
             # If the "+" tab is selected, add a new wall
             if current_tab == "+":
-                print("Adding new wall...")
+                logger.debug("Adding new wall...")
                 new_wall = self.add_new_wall()
                 # Don't return here - the new wall becomes the current wall
             else:
                 # Load data for the selected wall
-                print(f"Loading wall data for {current_tab}")
+                logger.debug("Loading wall data for %s", current_tab)
                 
                 # Find the wall object for the selected tab
                 new_wall = None
@@ -2975,7 +3384,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
                         break
                 
                 if not new_wall:
-                    print(f"Error: Could not find wall for tab {current_tab}")
+                    logger.error("Error: Could not find wall for tab %s", current_tab)
                     self.switching_walls = False
                     return
                 
@@ -2994,7 +3403,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
             self.calculate()
             
         except Exception as e:
-            print(f"Error during tab change: {e}")
+            logger.error("Error during tab change: %s", e)
             import traceback
             traceback.print_exc()
             self.switching_walls = False  # Reset flag in case of error
@@ -3018,7 +3427,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
             self.wall_status_label.place(x=10, y=10)
         
         # Update the label text
-        print(f"Updating wall status header to: {current_wall.name} (ID: {current_wall.id})")
+        logger.debug("Updating wall status header to: %s (ID: %s)", current_wall.name, current_wall.id)
         self.wall_status_label.configure(text=f"Active: {current_wall.name}")
         
         # Force the label to be on top of everything else
@@ -3062,33 +3471,21 @@ class WallcoveringCalculatorUI(ctk.CTk):
         if not current_wall:
             return
             
-        print(f"Force saving wall: {current_wall.name}")
+        logger.debug("Force saving wall: %s", current_wall.name)
         
         # Direct dimension save is most critical
         current_wall.dimensions = {
-            "width": Dimension(
-                self.safe_int_conversion(self.wall_width_feet_var.get(), 0),
-                self.safe_int_conversion(self.wall_width_inches_var.get(), 0)
-            ),
+            "width": self._dim(self.wall_width_feet_var, self.wall_width_inches_var),
             "width_fraction": self.wall_width_fraction_var.get(),
-            "height": Dimension(
-                self.safe_int_conversion(self.wall_height_feet_var.get(), 0),
-                self.safe_int_conversion(self.wall_height_inches_var.get(), 0)
-            ),
+            "height": self._dim(self.wall_height_feet_var, self.wall_height_inches_var),
             "height_fraction": self.wall_height_fraction_var.get()
         }
         
         # Also save panel dimensions
         current_wall.panel_dimensions = {
-            "width": Dimension(
-                self.safe_int_conversion(self.panel_width_feet_var.get(), 0),
-                self.safe_int_conversion(self.panel_width_inches_var.get(), 0)
-            ),
+            "width": self._dim(self.panel_width_feet_var, self.panel_width_inches_var),
             "width_fraction": self.panel_width_fraction_var.get(),
-            "height": Dimension(
-                self.safe_int_conversion(self.panel_height_feet_var.get(), 0),
-                self.safe_int_conversion(self.panel_height_inches_var.get(), 0)
-            ),
+            "height": self._dim(self.panel_height_feet_var, self.panel_height_inches_var),
             "height_fraction": self.panel_height_fraction_var.get()
         }
         
@@ -3099,9 +3496,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
         
         # Use a delay timer for dimension changes
         def delayed_calculate(*args):
-            if hasattr(self, '_calc_timer'):
-                self.after_cancel(self._calc_timer)
-            self._calc_timer = self.after(200, self.calculate)  # 200ms delay
+            self._schedule_calc(200)  # 200ms delay
         
         # Trace dimension variables with delay
         self.wall_width_feet_var.trace_add("write", delayed_calculate)
@@ -3114,7 +3509,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
         if not current_wall:
             return
         
-        print(f"LOAD: Loading wall: {current_wall.name} (ID: {current_wall.id}) with height {current_wall.dimensions['height'].feet}'{current_wall.dimensions['height'].inches}\"")
+        logger.debug("LOAD: Loading wall: %s (ID: %s) with height %s'%s\"", current_wall.name, current_wall.id, current_wall.dimensions['height'].feet, current_wall.dimensions['height'].inches)
         
         # Temporarily prevent calculations during loading
         old_calc_flag = getattr(self, 'calculation_in_progress', False)
@@ -3150,6 +3545,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
             # Load colors
             self.panel_color = current_wall.panel_color
             self.panel_border_color = current_wall.panel_border_color
+            self._panels_dirty = True
             if hasattr(self, 'color_preview'):
                 self.color_preview.configure(bg=self.panel_color)
             if hasattr(self, 'border_color_preview'):
@@ -3162,10 +3558,11 @@ class WallcoveringCalculatorUI(ctk.CTk):
                 self.show_object_distances_var.set(current_wall.show_object_distances)
             
             # CRITICAL: Load baseboard settings LAST and update UI accordingly
-            print(f"  Loading baseboard state: {current_wall.baseboard_enabled}")
+            logger.debug("  Loading baseboard state: %s", current_wall.baseboard_enabled)
             self.baseboard_var.set(current_wall.baseboard_enabled)
             self.use_baseboard = current_wall.baseboard_enabled
             self.baseboard_height = current_wall.baseboard_height
+            self._dim_cache_dirty = True
             self.baseboard_height_var.set(str(current_wall.baseboard_height))
             
             # Update UI visibility for baseboard
@@ -3180,11 +3577,13 @@ class WallcoveringCalculatorUI(ctk.CTk):
             import copy
             self.custom_panel_widths = copy.deepcopy(current_wall.custom_panel_widths)
             self.split_panels = copy.deepcopy(current_wall.split_panels)
+            self._panels_dirty = True
             self.wall_objects = copy.deepcopy(current_wall.wall_objects)
-            self.selected_panels = current_wall.selected_panels.copy()
+            self.selected_panels = set(current_wall.selected_panels)
             self.annotation_circles = copy.deepcopy(current_wall.annotation_circles)
+            self._annotation_grid = None
             
-            print(f"LOAD: Completed loading {current_wall.name}")
+            logger.debug("LOAD: Completed loading %s", current_wall.name)
             
         finally:
             # Restore calculation flag
@@ -3195,17 +3594,18 @@ class WallcoveringCalculatorUI(ctk.CTk):
 
     def update_ui_visibility(self):
         """Update UI element visibility based on current settings"""
-        print(f"Updating UI visibility - baseboard_var: {self.baseboard_var.get()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Updating UI visibility - baseboard_var: %s", self.baseboard_var.get())
         
         # Show/hide baseboard frame
         if self.baseboard_var.get():
             if hasattr(self, 'baseboard_frame') and self.baseboard_frame.winfo_exists():
-                print("  Showing baseboard frame")
+                logger.debug("  Showing baseboard frame")
                 # Force the widget to be packed if it exists
                 self.baseboard_frame.pack(pady=5, fill=tk.X)
         else:
             if hasattr(self, 'baseboard_frame') and self.baseboard_frame.winfo_exists():
-                print("  Hiding baseboard frame")
+                logger.debug("  Hiding baseboard frame")
                 self.baseboard_frame.pack_forget()
         
         # Show/hide floor mounting related controls
@@ -3250,34 +3650,23 @@ class WallcoveringCalculatorUI(ctk.CTk):
         if not current_wall:
             return
         
-        print(f"Saving data for wall: {current_wall.name} (ID: {current_wall.id})")
-        print(f"  Current baseboard state: UI={self.baseboard_var.get()}, wall={current_wall.baseboard_enabled}")
+        logger.debug("Saving data for wall: %s (ID: %s)", current_wall.name, current_wall.id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Current baseboard state: UI=%s, wall=%s", self.baseboard_var.get(), current_wall.baseboard_enabled)
         
         # Save wall dimensions - explicitly get values from UI variables
         current_wall.dimensions = {
-            "width": Dimension(
-                self.safe_int_conversion(self.wall_width_feet_var.get(), 0),
-                self.safe_int_conversion(self.wall_width_inches_var.get(), 0)
-            ),
+            "width": self._dim(self.wall_width_feet_var, self.wall_width_inches_var),
             "width_fraction": self.wall_width_fraction_var.get(),
-            "height": Dimension(
-                self.safe_int_conversion(self.wall_height_feet_var.get(), 0),
-                self.safe_int_conversion(self.wall_height_inches_var.get(), 0)
-            ),
+            "height": self._dim(self.wall_height_feet_var, self.wall_height_inches_var),
             "height_fraction": self.wall_height_fraction_var.get()
         }
         
         # Save panel dimensions
         current_wall.panel_dimensions = {
-            "width": Dimension(
-                self.safe_int_conversion(self.panel_width_feet_var.get(), 0),
-                self.safe_int_conversion(self.panel_width_inches_var.get(), 0)
-            ),
+            "width": self._dim(self.panel_width_feet_var, self.panel_width_inches_var),
             "width_fraction": self.panel_width_fraction_var.get(),
-            "height": Dimension(
-                self.safe_int_conversion(self.panel_height_feet_var.get(), 0),
-                self.safe_int_conversion(self.panel_height_inches_var.get(), 0)
-            ),
+            "height": self._dim(self.panel_height_feet_var, self.panel_height_inches_var),
             "height_fraction": self.panel_height_fraction_var.get()
         }
         
@@ -3290,20 +3679,17 @@ class WallcoveringCalculatorUI(ctk.CTk):
         # Save baseboard settings - CRITICAL: Use UI state directly and log it
         current_wall.baseboard_enabled = self.baseboard_var.get()
         current_wall.baseboard_height = self.safe_int_conversion(self.baseboard_height_var.get(), 4)
-        if hasattr(self, 'baseboard_fraction_var'):
+        if self._has_baseboard_frac:
             current_wall.baseboard_fraction = self.baseboard_fraction_var.get()
         
-        print(f"  After save: wall.baseboard_enabled={current_wall.baseboard_enabled}")
+        logger.debug("  After save: wall.baseboard_enabled=%s", current_wall.baseboard_enabled)
         
         # Save floor mounting settings
         current_wall.floor_mounted = self.floor_mounted_var.get()
         
         # Save height offset for non-floor mounted panels
         if hasattr(self, 'floor_mounted_var') and not self.floor_mounted_var.get() and hasattr(self, 'height_offset_feet_var'):
-            current_wall.height_offset = Dimension(
-                self.safe_int_conversion(self.height_offset_feet_var.get(), 0),
-                self.safe_int_conversion(self.height_offset_inches_var.get(), 0)
-            )
+            current_wall.height_offset = self._dim(self.height_offset_feet_var, self.height_offset_inches_var)
             if hasattr(self, 'height_offset_fraction_var'):
                 current_wall.height_offset_fraction = self.height_offset_fraction_var.get()
         else:
@@ -3334,18 +3720,18 @@ class WallcoveringCalculatorUI(ctk.CTk):
         current_wall.panels = copy.deepcopy(current_panels)
         
         # Save panel configurations 
-        current_wall.custom_panel_widths = copy.deepcopy(self.custom_panel_widths) if hasattr(self, 'custom_panel_widths') else {}
-        current_wall.split_panels = copy.deepcopy(self.split_panels) if hasattr(self, 'split_panels') else {}
+        current_wall.custom_panel_widths = copy.deepcopy(self.custom_panel_widths)
+        current_wall.split_panels = copy.deepcopy(self.split_panels)
         current_wall.wall_objects = copy.deepcopy(self.wall_objects) if hasattr(self, 'wall_objects') else []
-        current_wall.selected_panels = self.selected_panels.copy() if hasattr(self, 'selected_panels') else []
+        current_wall.selected_panels = sorted(self.selected_panels) if hasattr(self, 'selected_panels') else []
         current_wall.annotation_circles = copy.deepcopy(self.annotation_circles) if hasattr(self, 'annotation_circles') else []
         
         # Save ID counters
         current_wall.next_object_id = self.next_object_id if hasattr(self, 'next_object_id') else 1
         current_wall.next_annotation_id = self.next_annotation_id if hasattr(self, 'next_annotation_id') else 1
         
-        print(f"Wall {current_wall.name} saved with {len(current_wall.panels)} panels and height {current_wall.dimensions['height'].feet}'{current_wall.dimensions['height'].inches}\"")
-        print(f"  Final baseboard state: {current_wall.baseboard_enabled}")
+        logger.debug("Wall %s saved with %s panels and height %s'%s\"", current_wall.name, len(current_wall.panels), current_wall.dimensions['height'].feet, current_wall.dimensions['height'].inches)
+        logger.debug("  Final baseboard state: %s", current_wall.baseboard_enabled)
 
     
     def toggle_horizontal_position_mode(self):
@@ -3363,9 +3749,33 @@ class WallcoveringCalculatorUI(ctk.CTk):
 
     def create_advanced_controls(self, parent):
         """Create advanced controls for the Advanced tab"""
-        # Panel width adjustment section
+        # The adjustment widgets are only built the first time they are shown
+        self._panel_adjust_frame = None
+        self._panel_adjust_toggle = ctk.CTkButton(
+            parent,
+            text="Show Panel Adjustments",
+            command=lambda: self.toggle_panel_adjustments(parent)
+        )
+        self._panel_adjust_toggle.pack(pady=10, fill=tk.X)
+        
+        # Add any other advanced options here
+        # ...
+
+    def toggle_panel_adjustments(self, parent):
+        """Show or hide the panel width adjustment section, building it on first use"""
+        if self._panel_adjust_frame is None:
+            self._panel_adjust_frame = self.create_panel_adjustment_section(parent)
+        elif self._panel_adjust_frame.winfo_manager():
+            self._panel_adjust_frame.pack_forget()
+            self._panel_adjust_toggle.configure(text="Show Panel Adjustments")
+            return
+        
+        self._panel_adjust_frame.pack(pady=10, fill=tk.X, after=self._panel_adjust_toggle)
+        self._panel_adjust_toggle.configure(text="Hide Panel Adjustments")
+
+    def create_panel_adjustment_section(self, parent):
+        """Build the panel width adjustment section (unpacked) and return its frame"""
         adjustment_section = ctk.CTkFrame(parent)
-        adjustment_section.pack(pady=10, fill=tk.X)
         
         ctk.CTkLabel(adjustment_section, text="Panel Width Adjustments", font=("Arial", 14, "bold")).pack(pady=5)
         
@@ -3399,13 +3809,11 @@ class WallcoveringCalculatorUI(ctk.CTk):
         # Fraction
         ctk.CTkLabel(width_frame, text="+").pack(side=tk.LEFT, padx=2)
         self.adjust_width_fraction_var = tk.StringVar(value="0")
-        fraction_options = ["0", "1/16", "1/8", "3/16", "1/4", "5/16", "3/8", "7/16", 
-                          "1/2", "9/16", "5/8", "11/16", "3/4", "13/16", "7/8", "15/16"]
         
         fraction_dropdown = ctk.CTkOptionMenu(
             width_frame,
             variable=self.adjust_width_fraction_var,
-            values=fraction_options,
+            values=list(_FRACTION_OPTIONS),
             width=70
         )
         fraction_dropdown.pack(side=tk.LEFT, padx=5)
@@ -3432,13 +3840,12 @@ class WallcoveringCalculatorUI(ctk.CTk):
         )
         reset_btn.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
         
-        # Add any other advanced options here
-        # ...
+        return adjustment_section
 
 
     def create_export_frame(self):
+        # Build the whole section before packing it so Tk lays it out once
         export_frame = ctk.CTkFrame(self.input_frame)
-        export_frame.pack(pady=10, padx=10, fill=tk.X)
         
         ctk.CTkLabel(export_frame, text="Export Details").pack()
         
@@ -3467,19 +3874,11 @@ class WallcoveringCalculatorUI(ctk.CTk):
         ctk.CTkLabel(export_options_frame, text="Format:").pack(side=tk.LEFT, padx=(0, 5))
         
         self.export_format_var = tk.StringVar(value="TIFF (Ultra-HD Print Quality)")
-        export_options = [
-            "TIFF (Ultra-HD Print Quality)", 
-            "PNG (Ultra-HD Quality)", 
-            "JPEG (High Quality)",
-            "SVG (Vector Format)", 
-            "PDF (Document Format)", 
-            "EPS (Vector Format)"
-        ]
         
         export_dropdown = ctk.CTkOptionMenu(
             export_options_frame,
             variable=self.export_format_var,
-            values=export_options,
+            values=list(_EXPORT_OPTIONS),
             width=200
         )
         export_dropdown.pack(side=tk.LEFT, padx=5)
@@ -3494,11 +3893,10 @@ class WallcoveringCalculatorUI(ctk.CTk):
         ctk.CTkLabel(scale_frame, text="Quality Level:").pack(side=tk.LEFT, padx=5)
         
         self.quality_level_var = tk.StringVar(value="Ultra-HD (6x)")
-        quality_options = ["Standard (2x)", "High (4x)", "Ultra-HD (6x)", "Maximum (8x)"]
         quality_dropdown = ctk.CTkOptionMenu(
             scale_frame,
             variable=self.quality_level_var,
-            values=quality_options,
+            values=list(_QUALITY_OPTIONS),
             width=120
         )
         quality_dropdown.pack(side=tk.LEFT, padx=5)
@@ -3514,6 +3912,7 @@ class WallcoveringCalculatorUI(ctk.CTk):
         )
         export_btn.pack(side=tk.LEFT, padx=10)
 
+        export_frame.pack(pady=10, padx=10, fill=tk.X)
         
     def export_selected_format(self):
         """Export in the format selected from the dropdown with enhanced quality"""
@@ -3529,27 +3928,16 @@ class WallcoveringCalculatorUI(ctk.CTk):
         if hasattr(self, 'quality_level_var'):
             quality_level = self.quality_level_var.get()
         
-        # Parse the scale factor from the quality level
-        scale_factor = 6  # Default to 6x for Ultra-HD
-        if "2x" in quality_level:
-            scale_factor = 2
-        elif "4x" in quality_level:
-            scale_factor = 4
-        elif "6x" in quality_level:
-            scale_factor = 6
-        elif "8x" in quality_level:
-            scale_factor = 8
+        # Look up the scale factor for the quality level (default to 6x for Ultra-HD)
+        scale_factor = _SCALE_FROM_QUALITY.get(quality_level, 6)
         
         # Call the appropriate export function based on selection
+        format_key = format_choice.split()[0] if format_choice else ""
         try:
-            if "PDF" in format_choice:
-                self.export_enhanced_pdf()
-            elif "SVG" in format_choice:
-                self.export_enhanced_svg()
-            elif "EPS" in format_choice:
-                self.export_enhanced_eps()
-            elif "PNG" in format_choice or "TIFF" in format_choice or "JPEG" in format_choice:
-                self.export_high_res_via_svg(format_choice.split()[0].lower(), scale_factor)
+            if format_key in self._export_dispatch:
+                self._export_dispatch[format_key]()
+            elif format_key in _RASTER_EXPORT_FORMATS:
+                self.export_high_res_via_svg(format_key.lower(), scale_factor)
             else:
                 messagebox.showerror("Error", "Invalid export format selected")
         except Exception as e:
@@ -3568,7 +3956,12 @@ class WallcoveringCalculatorUI(ctk.CTk):
         if color[1]:  # color is ((R, G, B), hex_color)
             self.panel_border_color = color[1]
             self.border_color_preview.configure(bg=self.panel_border_color)
-            self.calculate()
+            self._scene_version += 1
+            self._panels_dirty = True
+            
+            # Only the border color changed, so recolor the existing items in place
+            for item_id, option in getattr(self, '_border_item_ids', []):
+                self.canvas.itemconfig(item_id, **{option: self.panel_border_color})
 
 
 
@@ -3647,16 +4040,156 @@ class WallcoveringCalculatorUI(ctk.CTk):
         self.create_advanced_controls(self.advanced_frame)
         self.create_about_controls(self.about_frame)
         
-    def export_ultra_quality(self):
-        """Export canvas at ultra-high resolution using direct rendering instead of screenshots"""
+    def _render_canvas_to_image(self, scale_factor):
+        """Rasterize the canvas items directly onto a cairo surface and return a PIL image"""
         try:
-            from PIL import Image, ImageEnhance, ImageFilter
-            import os
-            import tempfile
+            import cairo
         except ImportError:
-            messagebox.showerror("Error", "Required libraries missing. Please install with:\npip install pillow")
-            return
+            import cairocffi as cairo  # Installed alongside cairosvg
+        from PIL import Image
+        import tkinter.font as tkfont
+
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+
+        # No alpha channel: the background is opaque white anyway
+        surface = cairo.ImageSurface(cairo.FORMAT_RGB24,
+                                     canvas_width * scale_factor,
+                                     canvas_height * scale_factor)
+        ctx = cairo.Context(surface)
+        ctx.scale(scale_factor, scale_factor)
+
+        # White background, same as the on-screen canvas
+        ctx.set_source_rgb(1, 1, 1)
+        ctx.paint()
+
+        def set_color(color):
+            """Use a Tk color as the cairo source; returns False for empty colors"""
+            if not color:
+                return False
+            r, g, b = self.winfo_rgb(color)
+            ctx.set_source_rgb(r / 65535, g / 65535, b / 65535)
+            return True
+
+        def set_stroke(item_id):
+            ctx.set_line_width(float(self.canvas.itemcget(item_id, 'width') or 1))
+            try:
+                dash = [float(d) for d in self.canvas.itemcget(item_id, 'dash').split()]
+            except ValueError:
+                dash = []
+            ctx.set_dash(dash)
+
+        def draw_arrow(tip_x, tip_y, from_x, from_y):
+            # Tk's default arrowshape is (8, 10, 3)
+            length = math.hypot(tip_x - from_x, tip_y - from_y)
+            if length == 0:
+                return
+            ux, uy = (tip_x - from_x) / length, (tip_y - from_y) / length
+            ctx.move_to(tip_x, tip_y)
+            ctx.line_to(tip_x - ux * 10 - uy * 3, tip_y - uy * 10 + ux * 3)
+            ctx.line_to(tip_x - ux * 8, tip_y - uy * 8)
+            ctx.line_to(tip_x - ux * 10 + uy * 3, tip_y - uy * 10 - ux * 3)
+            ctx.close_path()
+            ctx.fill()
+
+        tk_scaling = float(self.tk.call('tk', 'scaling'))
+
+        for item_id in self.canvas.find_all():
+            if self.canvas.itemcget(item_id, 'state') == 'hidden':
+                continue
+
+            item_type = self.canvas.type(item_id)
+            coords = self.canvas.coords(item_id)
+
+            if item_type in ('rectangle', 'oval'):
+                x1, y1, x2, y2 = coords
+                if item_type == 'rectangle':
+                    ctx.rectangle(x1, y1, x2 - x1, y2 - y1)
+                else:
+                    ctx.save()
+                    ctx.translate((x1 + x2) / 2, (y1 + y2) / 2)
+                    ctx.scale(max((x2 - x1) / 2, 0.01), max((y2 - y1) / 2, 0.01))
+                    ctx.arc(0, 0, 1, 0, 2 * math.pi)
+                    ctx.restore()
+                if set_color(self.canvas.itemcget(item_id, 'fill')):
+                    ctx.fill_preserve()
+                if set_color(self.canvas.itemcget(item_id, 'outline')):
+                    set_stroke(item_id)
+                    ctx.stroke()
+                else:
+                    ctx.new_path()
+
+            elif item_type == 'line' and len(coords) >= 4:
+                if not set_color(self.canvas.itemcget(item_id, 'fill')):
+                    continue
+                set_stroke(item_id)
+                ctx.move_to(coords[0], coords[1])
+                for i in range(2, len(coords), 2):
+                    ctx.line_to(coords[i], coords[i + 1])
+                ctx.stroke()
+
+                arrow = self.canvas.itemcget(item_id, 'arrow')
+                ctx.set_dash([])
+                if arrow in ('first', 'both'):
+                    draw_arrow(coords[0], coords[1], coords[2], coords[3])
+                if arrow in ('last', 'both'):
+                    draw_arrow(coords[-2], coords[-1], coords[-4], coords[-3])
+
+            elif item_type == 'text':
+                text = self.canvas.itemcget(item_id, 'text')
+                if not text or not set_color(self.canvas.itemcget(item_id, 'fill')):
+                    continue
 
+                font = tkfont.Font(font=self.canvas.itemcget(item_id, 'font')).actual()
+                size = font['size']
+                ctx.select_font_face(
+                    font['family'],
+                    cairo.FONT_SLANT_ITALIC if font['slant'] == 'italic' else cairo.FONT_SLANT_NORMAL,
+                    cairo.FONT_WEIGHT_BOLD if font['weight'] == 'bold' else cairo.FONT_WEIGHT_NORMAL
+                )
+                ctx.set_font_size(-size if size < 0 else size * tk_scaling)
+
+                # Work out the block size so the Tk anchor can be honoured
+                lines = text.split("\n")
+                ascent, descent, line_height = ctx.font_extents()[:3]
+                block_width = max(ctx.text_extents(line)[4] for line in lines)
+                block_height = line_height * len(lines)
+
+                anchor = self.canvas.itemcget(item_id, 'anchor')
+                x, y = coords[0], coords[1]
+                # Compare against explicit sets - "center" contains both 'e' and 'n'
+                if anchor in ('w', 'nw', 'sw'):
+                    left = x
+                elif anchor in ('e', 'ne', 'se'):
+                    left = x - block_width
+                else:
+                    left = x - block_width / 2
+                if anchor in ('n', 'nw', 'ne'):
+                    top = y
+                elif anchor in ('s', 'sw', 'se'):
+                    top = y - block_height
+                else:
+                    top = y - block_height / 2
+
+                justify = self.canvas.itemcget(item_id, 'justify')
+                for i, line in enumerate(lines):
+                    line_width = ctx.text_extents(line)[4]
+                    if justify == 'center':
+                        line_x = left + (block_width - line_width) / 2
+                    elif justify == 'right':
+                        line_x = left + block_width - line_width
+                    else:
+                        line_x = left
+                    ctx.move_to(line_x, top + i * line_height + ascent)
+                    ctx.show_text(line)
+
+        surface.flush()
+        # Decode the BGRX pixels straight into an RGB image (no RGBA intermediate)
+        return Image.frombuffer("RGB", (surface.get_width(), surface.get_height()),
+                                bytes(surface.get_data()), "raw", "BGRX", surface.get_stride(), 1)
+
+    def export_ultra_quality(self):
+        """Export canvas at ultra-high resolution using direct rendering instead of screenshots"""
         # Get save location
         file_name = f"{self.project_name_var.get().replace(' ', '-')}-{self.date_var.get()}.tiff"
         save_path = filedialog.asksaveasfilename(
@@ -3673,97 +4206,27 @@ class WallcoveringCalculatorUI(ctk.CTk):
             return
 
         try:
-            # Make sure canvas is fully updated
-            self.update()
-            self.after(300)  # Longer delay for complete rendering
-            
-            # Create a temporary file for the PostScript output
-            with tempfile.NamedTemporaryFile(suffix='.eps', delete=False) as temp_file:
-                temp_path = temp_file.name
-                
-            # Get the canvas's PostScript representation
-            ps_data = self.canvas.postscript(
-                colormode='color',
-                pagewidth=self.canvas.winfo_width(),
-                pageheight=self.canvas.winfo_height(),
-                x=0, y=0,
-                width=self.canvas.winfo_width(),
-                height=self.canvas.winfo_height()
-            )
-            
-            # Write the PostScript data to the temporary file
-            with open(temp_path, 'w') as f:
-                f.write(ps_data)
-                
-            # Convert EPS to PIL Image (requires Ghostscript to be installed)
             try:
-                img = Image.open(temp_path)
-                
-                # Calculate super-resolution scaling (6x)
+                # Render the canvas items straight to a 6x surface (no EPS/Ghostscript round-trip)
                 scale_factor = 6
-                canvas_width = self.canvas.winfo_width()
-                canvas_height = self.canvas.winfo_height()
-                img = img.resize((canvas_width * scale_factor, canvas_height * scale_factor), 
-                               resample=Image.LANCZOS)
-                
-                # Apply a series of advanced image enhancements
-                
-                # 1. Edge-preserving smoothing to reduce noise while keeping sharp edges
-                img = img.filter(ImageFilter.SMOOTH_MORE)
-                
-                # 2. Apply unsharp mask to sharpen edges
-                img = img.filter(ImageFilter.UnsharpMask(radius=2, percent=250, threshold=3))
-                
-                # 3. Enhance details
-                enhancer = ImageEnhance.Sharpness(img)
-                img = enhancer.enhance(2.5)
-                
-                # 4. Improve contrast
-                enhancer = ImageEnhance.Contrast(img)
-                img = enhancer.enhance(1.4)
-                
-                # 5. Slightly boost color saturation
-                enhancer = ImageEnhance.Color(img)
-                img = enhancer.enhance(1.2)
-                
-                # Set ultra-high DPI for printing
-                dpi = (1200, 1200)
-                
-                # Save with optimal format-specific settings
-                if save_path.lower().endswith('.jpg') or save_path.lower().endswith('.jpeg'):
-                    if img.mode != 'RGB':
-                        img = img.convert('RGB')
-                    img.save(save_path, 'JPEG', quality=100, dpi=dpi, optimize=True)
-                    
-                elif save_path.lower().endswith('.tiff'):
-                    # Best settings for TIFF - using LZW compression for lossless results
-                    img.save(save_path, 'TIFF', compression='tiff_lzw', dpi=dpi)
-                    
-                else:  # Default to PNG
-                    # Use maximum compression level for PNG
-                    img.save(save_path, 'PNG', dpi=dpi, compress_level=9)
-                    
-                messagebox.showinfo("Success", "Canvas exported at ultra-high resolution with advanced processing!")
-                
-                # Automatically open the image file after saving
-                try:
-                    if os.name == 'nt':  # Windows
-                        os.startfile(save_path)
-                    elif os.name == 'posix':  # macOS and Linux
-                        if os.uname().sysname == 'Darwin':  # macOS
-                            os.system(f'open "{save_path}"')
-                        else:  # Linux
-                            os.system(f'xdg-open "{save_path}"')
-                except:
-                    pass  # Silently ignore if we can't open the file
+                img = self._render_canvas_to_image(scale_factor)
+                
+                # The enhancement chain and encode are pure PIL work, so run them on the
+                # export pool and keep the Tk event loop responsive meanwhile
+                self._run_export_job(
+                    lambda: self._process_and_save(img, save_path),
+                    "Canvas exported at ultra-high resolution with advanced processing!",
+                    on_error=lambda: self.export_direct_vector(ultra_hd=True),
+                    on_success=lambda: self._open_exported_file(save_path)
+                )
                     
-            except Exception as eps_error:
-                # If EPS conversion fails, try direct rendering method
+            except Exception as render_error:
+                # If direct rendering fails, try the vector rendering method
                 messagebox.showwarning("Notice", 
-                                      f"EPS conversion failed: {str(eps_error)}\nFalling back to vector-based rendering.")
+                                      f"Direct rendering failed: {str(render_error)}\nFalling back to vector-based rendering.")
                 
                 # Use direct vector rendering as a fallback
-                self.export_direct_vector()
+                self.export_direct_vector(ultra_hd=True)
                 
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred during export: {str(e)}")
@@ -3773,28 +4236,72 @@ class WallcoveringCalculatorUI(ctk.CTk):
             # Try one last fallback method
             try:
                 messagebox.showinfo("Notice", "Trying alternative export method...")
-                self.export_direct_vector()
+                self.export_direct_vector(ultra_hd=True)
             except:
                 pass
-                
-        finally:
-            # Clean up the temporary file
-            if 'temp_path' in locals() and os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except:
-                    pass
 
-    def export_high_resolution_image(self):
-        """Export the wall drawing as a high-resolution image using direct rendering"""
+    def _process_and_save(self, img, save_path):
+        """Enhance and save an ultra-quality export (runs off the Tk thread)"""
+        from PIL import Image, ImageEnhance, ImageFilter
+        import numpy as np
+
+        # Apply a series of advanced image enhancements
+        
+        # 1. Edge-preserving smoothing to reduce noise while keeping sharp edges
+        img = img.filter(ImageFilter.SMOOTH_MORE)
+        
+        # 2. Apply unsharp mask to sharpen edges
+        img = img.filter(ImageFilter.UnsharpMask(radius=2, percent=250, threshold=3))
+        
+        # 3. Enhance details (a blend against a smoothed copy, so it stays in PIL)
+        enhancer = ImageEnhance.Sharpness(img)
+        img = enhancer.enhance(2.5)
+        
+        # 4 + 5. Contrast 1.4 and color 1.2 fused into one pass over the pixels.
+        # Same maths as ImageEnhance: contrast pivots on the mean luma, color
+        # blends each pixel with its own luma.
+        contrast, color = 1.4, 1.2
+        kernels = _get_enhance_kernels()
+        if kernels is not None:
+            # Compiled uint8 kernels, parallel over rows
+            luma_mean_kernel, enhance_kernel = kernels
+            src = np.ascontiguousarray(np.asarray(img.convert('RGB')))
+            out = np.empty_like(src)
+            enhance_kernel(src, out, luma_mean_kernel(src), contrast, color)
+            img = Image.fromarray(out, 'RGB')
+        else:
+            arr = np.asarray(img.convert('RGB'), dtype=np.float32)
+            luma = arr @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+            luma = luma[..., np.newaxis]
+            mean_luma = float(luma.mean())
+            arr -= luma
+            arr *= contrast * color
+            arr += (luma - mean_luma) * contrast + mean_luma
+            np.clip(arr, 0, 255, out=arr)
+            img = Image.fromarray(arr.astype(np.uint8), 'RGB')
+        
+        # Set ultra-high DPI for printing
+        dpi = (1200, 1200)
+        
+        # Save with optimal format-specific settings (maximum JPEG quality / PNG compression)
+        _save_image(img, save_path, dpi, quality=100, compress_level=9)
+
+    def _open_exported_file(self, save_path):
+        """Open a finished export in the system viewer"""
+        # Automatically open the image file after saving
         try:
-            from PIL import Image, ImageDraw, ImageFont
-            import os
-            import tempfile
-        except ImportError as e:
-            messagebox.showerror("Error", f"Required library missing: {str(e)}. Please install with pip.")
-            return
+            if os.name == 'nt':  # Windows
+                os.startfile(save_path)
+            elif os.name == 'posix':  # macOS and Linux
+                if os.uname().sysname == 'Darwin':  # macOS
+                    os.system(f'open "{save_path}"')
+                else:  # Linux
+                    os.system(f'xdg-open "{save_path}"')
+        except:
+            pass  # Silently ignore if we can't open the file
 
+    def export_high_resolution_image(self):
+        """Export the wall drawing as a high-resolution image using direct rendering"""
         # Get save location with options
         file_name = f"{self.project_name_var.get().replace(' ', '-')}-{self.date_var.get()}.tiff"
         save_path = filedialog.asksaveasfilename(
@@ -3811,124 +4318,35 @@ class WallcoveringCalculatorUI(ctk.CTk):
             return
 
         try:
-            # Make sure canvas is fully updated
-            self.update()
-            
-            # Get original canvas dimensions
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            
             # Calculate a high-resolution scale factor (6x for maximum quality)
             scale_factor = 6
-            target_width = canvas_width * scale_factor
-            target_height = canvas_height * scale_factor
-            
-            # Create a temporary EPS file (best vector format from Tkinter)
-            with tempfile.NamedTemporaryFile(suffix='.eps', delete=False) as temp_eps:
-                temp_eps_path = temp_eps.name
-                
-            # Generate a high-quality EPS file
-            ps_data = self.canvas.postscript(
-                colormode='color',
-                pagewidth=canvas_width,
-                pageheight=canvas_height,
-                x=0, y=0,
-                width=canvas_width,
-                height=canvas_height
-            )
             
-            with open(temp_eps_path, 'w') as f:
-                f.write(ps_data)
-                
-            # Use Pillow to convert EPS to high-resolution raster
-            # First, need to install Ghostscript for EPS handling
+            # Rasterize the canvas items directly at the target resolution
             try:
-                from PIL import EpsImagePlugin
-                img = Image.open(temp_eps_path)
+                img = self._render_canvas_to_image(scale_factor)
                 
                 # Set the target DPI for high resolution
                 dpi = 600
                 
-                # Resize to the target dimensions
-                img = img.resize((target_width, target_height), Image.LANCZOS)
-                
                 # Save in the appropriate format with high quality
-                if save_path.lower().endswith('.jpg') or save_path.lower().endswith('.jpeg'):
-                    if img.mode != 'RGB':
-                        img = img.convert('RGB')
-                    img.save(save_path, 'JPEG', quality=95, dpi=(dpi, dpi))
-                    
-                elif save_path.lower().endswith('.tiff'):
-                    img.save(save_path, 'TIFF', compression='tiff_lzw', dpi=(dpi, dpi))
-                    
-                else:  # Default to PNG
-                    img.save(save_path, 'PNG', dpi=(dpi, dpi))
+                _save_image(img, save_path, (dpi, dpi))
                     
                 messagebox.showinfo("Success", f"High-resolution image exported successfully at {dpi} DPI!")
                 
-            except Exception as eps_error:
-                # If EPS conversion fails, fall back to a direct canvas grab method
-                messagebox.showwarning("Notice", f"EPS conversion unsuccessful: {str(eps_error)}\nFalling back to direct rendering method.")
-                
-                # Create a high-resolution image using direct canvas rendering
-                # Use pyscreenshot for better quality screenshot if available
-                try:
-                    import pyscreenshot as ImageGrab
-                except ImportError:
-                    # Fall back to PIL's ImageGrab if pyscreenshot is not available
-                    from PIL import ImageGrab
-                
-                # Get the canvas coordinates on screen
-                canvas_x = self.canvas.winfo_rootx()
-                canvas_y = self.canvas.winfo_rooty()
-                
-                # Grab the canvas region
-                img = ImageGrab.grab(bbox=(canvas_x, canvas_y, 
-                                           canvas_x + canvas_width, 
-                                           canvas_y + canvas_height))
-                
-                # Resize to high resolution
-                img = img.resize((target_width, target_height), Image.LANCZOS)
-                
-                # Set DPI for high-quality printing
-                dpi = 300
-                
-                # Save with appropriate format
-                if save_path.lower().endswith('.jpg') or save_path.lower().endswith('.jpeg'):
-                    img.save(save_path, 'JPEG', quality=95, dpi=(dpi, dpi))
-                    
-                elif save_path.lower().endswith('.tiff'):
-                    img.save(save_path, 'TIFF', compression='tiff_lzw', dpi=(dpi, dpi))
-                    
-                else:  # Default to PNG
-                    img.save(save_path, 'PNG', dpi=(dpi, dpi))
-                    
-                messagebox.showinfo("Success", f"Image exported successfully at {dpi} DPI using direct rendering!")
-                
-            # Clean up temporary files
-            if os.path.exists(temp_eps_path):
-                try:
-                    os.remove(temp_eps_path)
-                except:
-                    pass
+            except Exception as render_error:
+                # If canvas rendering fails, redraw the wall from the model with the
+                # direct-vector rasterizer instead of upscaling a screen grab
+                messagebox.showwarning("Notice", f"Direct rendering unsuccessful: {str(render_error)}\nFalling back to direct vector rendering.")
+                self.export_direct_vector(save_path, scale_factor=scale_factor, ultra_hd=False)
                     
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred during image export: {str(e)}")
             import traceback
             traceback.print_exc()  # Print stack trace for debugging
             
-            # Clean up temp file if it exists
-            if 'temp_eps_path' in locals() and os.path.exists(temp_eps_path):
-                try:
-                    os.remove(temp_eps_path)
-                except:
-                    pass
-            
     def export_vector_based_image(self):
         """Export the wall drawing as a vector-based SVG first, then convert to high-resolution raster"""
         try:
-            import os
-            import tempfile
             from PIL import Image
             import cairosvg  # You may need to install this with pip install cairosvg
         except ImportError as e:
@@ -3952,22 +4370,14 @@ class WallcoveringCalculatorUI(ctk.CTk):
             return
 
         try:
-            # Create a temporary SVG file
-            with tempfile.NamedTemporaryFile(suffix='.svg', delete=False) as temp_svg:
-                temp_svg_path = temp_svg.name
-            
             # First, export to SVG using our improved SVG export method
-            # Save to the temporary SVG path
-            old_asksaveasfilename = filedialog.asksaveasfilename
-            filedialog.asksaveasfilename = lambda **kwargs: temp_svg_path
-            self.export_svg_enhanced()  # This uses your existing method to create a clean SVG
-            filedialog.asksaveasfilename = old_asksaveasfilename
+            # (reused as-is if the scene hasn't changed since the last export)
+            temp_svg_path = self._get_scratch_svg()
             
             # If user wants SVG directly, just copy the temp file to destination
             if save_path.lower().endswith('.svg'):
                 import shutil
                 shutil.copy2(temp_svg_path, save_path)
-                os.remove(temp_svg_path)
                 messagebox.showinfo("Success", "Vector SVG exported successfully!")
                 return
                 
@@ -3981,42 +4391,16 @@ class WallcoveringCalculatorUI(ctk.CTk):
             )
             
             # Base DPI on wall width - smaller walls get higher DPI for more detail
-            if wall_width_inches <= 48:  # 4 feet or less
-                dpi = 1200
-            elif wall_width_inches <= 96:  # 8 feet or less
-                dpi = 900
-            elif wall_width_inches <= 144:  # 12 feet or less
-                dpi = 600
-            else:  # Larger walls
-                dpi = 450
-                
-            # Convert the SVG to the requested format using cairosvg
-            if save_path.lower().endswith('.jpg') or save_path.lower().endswith('.jpeg'):
-                # For JPEG, we convert to PNG first then to JPEG to maintain quality
-                temp_png = temp_svg_path + '.png'
-                cairosvg.svg2png(url=temp_svg_path, write_to=temp_png, dpi=dpi)
-                
-                # Convert PNG to JPEG with PIL for maximum quality
-                img = Image.open(temp_png)
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                img.save(save_path, 'JPEG', quality=100, dpi=(dpi, dpi))
-                os.remove(temp_png)
-                
-            elif save_path.lower().endswith('.tiff'):
-                # For TIFF, direct conversion works well with cairosvg
-                cairosvg.svg2png(url=temp_svg_path, write_to=temp_svg_path + '.png', dpi=dpi)
+            # (4 feet or less, 8 feet or less, 12 feet or less, larger walls)
+            dpi = _VECTOR_EXPORT_DPIS[bisect.bisect_left(_VECTOR_EXPORT_WIDTH_STEPS, wall_width_inches)]
                 
-                # Convert PNG to TIFF with PIL for maximum quality
-                img = Image.open(temp_svg_path + '.png')
-                img.save(save_path, 'TIFF', compression='tiff_lzw', dpi=(dpi, dpi))
-                os.remove(temp_svg_path + '.png')
-                
-            else:  # Default to PNG
-                cairosvg.svg2png(url=temp_svg_path, write_to=save_path, dpi=dpi)
-            
-            # Clean up the temporary file
-            os.remove(temp_svg_path)
+            # Render the SVG to an in-memory PNG with cairosvg, then save it in the
+            # format implied by the extension (JPEG at maximum quality)
+            png_buffer = io.BytesIO()
+            cairosvg.svg2png(bytestring=self._get_scratch_svg_bytes(), write_to=png_buffer, dpi=dpi)
+            png_buffer.seek(0)
+            img = Image.open(png_buffer)
+            _save_image(img, save_path, (dpi, dpi), quality=100)
             
             messagebox.showinfo("Success", f"Vector-based image exported successfully at {dpi} DPI!")
             
@@ -4024,18 +4408,11 @@ class WallcoveringCalculatorUI(ctk.CTk):
             messagebox.showerror("Error", f"An error occurred during vector export: {str(e)}")
             import traceback
             traceback.print_exc()  # Print stack trace for debugging
-            
-            # Clean up temp file if it exists
-            if os.path.exists(temp_svg_path):
-                try:
-                    os.remove(temp_svg_path)
-                except:
-                    pass
     def create_about_controls(self, parent):
         """Create content for the About tab"""
-        # Main about frame
+        # Main about frame - packed only after its children are in place so
+        # Tk computes the layout in one pass
         about_section = ctk.CTkFrame(parent)
-        about_section.pack(pady=20, fill=tk.X)
         
         # App title
         app_title = ctk.CTkLabel(
@@ -4064,28 +4441,14 @@ class WallcoveringCalculatorUI(ctk.CTk):
         )
         dev_title.pack(pady=(10, 5))
         
-        # Developer name
-        name_label = ctk.CTkLabel(
-            dev_section,
-            text="John Ortega",
-            font=("Arial", 14)
-        )
-        name_label.pack(pady=5)
-        
-        # Contact info
-        email_label = ctk.CTkLabel(
-            dev_section,
-            text="johnortega@gmail.com",
-            font=("Arial", 14)
-        )
-        email_label.pack(pady=2)
-        
-        phone_label = ctk.CTkLabel(
+        # Developer name and contact info share one label - this text is static
+        contact_label = ctk.CTkLabel(
             dev_section,
-            text="408-960-3207",
-            font=("Arial", 14)
+            text="John Ortega\njohnortega@gmail.com\n408-960-3207",
+            font=("Arial", 14),
+            justify="center"
         )
-        phone_label.pack(pady=(2, 10))
+        contact_label.pack(pady=(5, 10))
         
         # Description section
         desc_section = ctk.CTkFrame(about_section)
@@ -4129,66 +4492,84 @@ with precise measurements and customizable configurations.
         )
         copyright_label.pack(pady=(20, 10))
 
-    def export_direct_vector(self):
+        about_section.pack(pady=20, fill=tk.X)
+
+    def export_direct_vector(self, save_path=None, scale_factor=2, ultra_hd=False):
         """Export using a direct vector rendering approach for maximum clarity"""
-        import os
         try:
-            from PIL import Image, ImageDraw, ImageFont
+            from PIL import Image, ImageDraw
+            import numpy as np
         except ImportError:
-            messagebox.showerror("Error", "Pillow library is required. Please install with: pip install pillow")
+            messagebox.showerror("Error", "Required libraries missing. Please install with:\npip install pillow numpy")
             return
             
         # Get save location
-        file_name = f"{self.project_name_var.get().replace(' ', '-')}-{self.date_var.get()}.tiff"
-        save_path = filedialog.asksaveasfilename(
-            defaultextension=".tiff",
-            initialfile=file_name,
-            filetypes=[
-                ("TIFF files (Ultra HD)", "*.tiff"), 
-                ("PNG files (Ultra HD)", "*.png")
-            ]
-        )
+        if save_path is None:
+            file_name = f"{self.project_name_var.get().replace(' ', '-')}-{self.date_var.get()}.tiff"
+            save_path = filedialog.asksaveasfilename(
+                defaultextension=".tiff",
+                initialfile=file_name,
+                filetypes=[
+                    ("TIFF files (Ultra HD)", "*.tiff"), 
+                    ("PNG files (Ultra HD)", "*.png")
+                ]
+            )
         
         if not save_path:
             return
             
         try:
-            # Calculate super high resolution dimensions (8x actual size)
+            # Solid fills are painted at scale_factor x screen size and resized to the
+            # output size (8x for ultra HD); outlines, text and dimension lines are then
+            # drawn at the output size so they stay sharp
             canvas_width = self.canvas.winfo_width()
             canvas_height = self.canvas.winfo_height()
-            scale_factor = 8  # 8x larger than screen for ultra-crisp lines
             
-            img_width = canvas_width * scale_factor
-            img_height = canvas_height * scale_factor
+            # Read the wall settings once up front
+            wall_width = self.wall_dimensions["width"]
+            wall_height = self.wall_dimensions["height"]
+            width_fraction = self.wall_dimensions.get("width_fraction", "0")
+            height_fraction = self.wall_dimensions.get("height_fraction", "0")
+            use_baseboard = self.use_baseboard
+            custom_name = self.custom_name_var.get() or "Panel"
+            show_dims = self.show_dimensions_var.get()
             
-            # Create a blank white image at high resolution
-            image = Image.new('RGB', (img_width, img_height), color='white')
-            draw = ImageDraw.Draw(image)
+            output_scale = max(scale_factor, 8) if ultra_hd else scale_factor
+            fill_ratio = scale_factor / output_scale
+            
+            img_width = canvas_width * output_scale
+            img_height = canvas_height * output_scale
+            fill_width = canvas_width * scale_factor
+            fill_height = canvas_height * scale_factor
+            
+            # Solid fills are painted straight into a white pixel array;
+            # ImageDraw is only used for outlines and text afterwards
+            pixels = np.full((fill_height, fill_width, 3), 255, dtype=np.uint8)
             
             # Get accurate dimensions from original canvas
-            margin = 100 * scale_factor
+            margin = 100 * output_scale
             
             # Wall dimensions in inches (including fractions)
             wall_width_inches = self.convert_to_inches(
-                self.wall_dimensions["width"].feet,
-                self.wall_dimensions["width"].inches,
-                self.wall_dimensions.get("width_fraction", "0")
+                wall_width.feet,
+                wall_width.inches,
+                width_fraction
             )
             
             wall_height_inches = self.convert_to_inches(
-                self.wall_dimensions["height"].feet,
-                self.wall_dimensions["height"].inches,
-                self.wall_dimensions.get("height_fraction", "0")
+                wall_height.feet,
+                wall_height.inches,
+                height_fraction
             )
             
             # Calculate baseboard height
             baseboard_height_inches = self.baseboard_height
-            if hasattr(self, 'baseboard_fraction_var'):
+            if self._has_baseboard_frac:
                 baseboard_height_inches += self.fraction_to_decimal(self.baseboard_fraction_var.get())
                 
             # Calculate visual usable height
             visual_usable_height = wall_height_inches
-            if self.use_baseboard:
+            if use_baseboard:
                 visual_usable_height -= baseboard_height_inches
             
             # Calculate scaling for high-resolution rendering
@@ -4209,37 +4590,26 @@ with precise measurements and customizable configurations.
             y_offset = (img_height - scaled_height) / 2
             
             # Calculate baseboard height for visualization
-            baseboard_height = baseboard_height_inches * scale if self.use_baseboard else 0
+            baseboard_height = baseboard_height_inches * scale if use_baseboard else 0
             
             # Calculate font sizes scaled to high resolution
-            title_font_size = int(18 * scale_factor / 3)
-            normal_font_size = int(12 * scale_factor / 3)
-            small_font_size = int(8 * scale_factor / 3)
+            title_font_size = int(18 * output_scale / 3)
+            normal_font_size = int(12 * output_scale / 3)
+            small_font_size = int(8 * output_scale / 3)
             
-            # Try to load fonts - use default if not available
-            try:
-                title_font = ImageFont.truetype("Arial.ttf", title_font_size)
-                normal_font = ImageFont.truetype("Arial.ttf", normal_font_size)
-                small_font = ImageFont.truetype("Arial.ttf", small_font_size)
-            except IOError:
-                # Fallback to default font
-                title_font = ImageFont.load_default()
-                normal_font = ImageFont.load_default()
-                small_font = ImageFont.load_default()
-            
-            # Draw wall outline with thick lines (scaled by resolution)
-            line_width = max(2 * scale_factor // 2, 1)
-            draw.rectangle(
-                (x_offset, y_offset, x_offset + scaled_width, y_offset + scaled_height),
-                outline='black',
-                width=line_width
-            )
+            # Load fonts (cached across exports) - default font if Arial is not available
+            title_font = _get_font("Arial.ttf", title_font_size)
+            normal_font = _get_font("Arial.ttf", normal_font_size)
+            small_font = _get_font("Arial.ttf", small_font_size)
+            
+            # Wall outline width (scaled by resolution)
+            line_width = max(2 * output_scale // 2, 1)
             
             # Get panels
             panels = self.calculate_panels()
             
             # Sort panels by x position
-            sorted_panels = sorted(panels, key=lambda p: p.x)
+            sorted_panels = sorted(panels, key=_BY_X)
             
             # Fix overlapping panels
             fixed_panels = []
@@ -4260,141 +4630,188 @@ with precise measurements and customizable configurations.
                 fixed_panels.append(fixed_panel)
                 current_x_percent += panel.width
             
-            # Draw baseboard if enabled
-            if self.use_baseboard:
-                draw.rectangle(
-                    (
-                        x_offset,
-                        y_offset + scaled_height - baseboard_height,
-                        x_offset + scaled_width,
-                        y_offset + scaled_height
-                    ),
-                    fill='gray'
-                )
+            # Panel geometry as parallel arrays, shared by the fill, outline and dimension passes
+            panel_count = len(fixed_panels)
+            panel_x_arr = x_offset + np.fromiter((p.x for p in fixed_panels), dtype=np.float64, count=panel_count) / 100 * scaled_width
+            panel_w_arr = np.fromiter((p.width for p in fixed_panels), dtype=np.float64, count=panel_count) / 100 * scaled_width
+            panel_h_arr = np.fromiter(
+                (self.convert_to_inches(p.height.feet, p.height.inches, p.height_fraction) for p in fixed_panels),
+                dtype=np.float64, count=panel_count
+            )
             
-            # Draw panels
-            for panel in fixed_panels:
-                panel_x = x_offset + (panel.x / 100 * scaled_width)
-                panel_width = (panel.width / 100 * scaled_width)
-                
-                # Calculate panel height
-                panel_height_inches = self.convert_to_inches(
-                    panel.height.feet, 
-                    panel.height.inches, 
-                    panel.height_fraction
-                )
-                visual_panel_height = min(panel_height_inches, visual_usable_height) * scale
-                
-                # Calculate panel y position
-                if self.use_baseboard:
-                    panel_bottom = y_offset + scaled_height - baseboard_height
-                else:
-                    panel_bottom = y_offset + scaled_height
-                    
-                panel_top = panel_bottom - visual_panel_height
-                
+            # Panels sit on the baseboard (baseboard_height is 0 when it is disabled)
+            panel_bottom = y_offset + scaled_height - baseboard_height
+            panel_top_arr = panel_bottom - np.minimum(panel_h_arr, visual_usable_height) * scale
+            panel_geometry = list(zip(fixed_panels, panel_x_arr.tolist(), panel_w_arr.tolist(), panel_top_arr.tolist()))
+            
+            # Solid rectangles (x0, y0, x1, y1) in output coordinates and their colors,
+            # filled in order
+            fill_rects = []
+            fill_colors = []
+            
+            # Baseboard if enabled
+            if use_baseboard:
+                fill_rects.append((
+                    x_offset, y_offset + scaled_height - baseboard_height,
+                    x_offset + scaled_width, y_offset + scaled_height
+                ))
+                fill_colors.append((128, 128, 128))
+            
+            # Panels, keeping their border colors for the outline pass
+            panel_borders = []
+            for panel, panel_x, panel_width, panel_top in panel_geometry:
                 # Convert color hex to RGB
                 try:
-                    # Parse panel color which is in hex format (#RRGGBB)
-                    panel_fill = panel.color
-                    r = int(panel_fill[1:3], 16)
-                    g = int(panel_fill[3:5], 16)
-                    b = int(panel_fill[5:7], 16)
-                    panel_fill_rgb = (r, g, b)
-                    
-                    # Parse border color
-                    border_color = panel.border_color
-                    r = int(border_color[1:3], 16)
-                    g = int(border_color[3:5], 16)
-                    b = int(border_color[5:7], 16)
-                    border_rgb = (r, g, b)
-                except:
+                    panel_fill_rgb = _hex_to_rgb(panel.color)
+                    border_rgb = _hex_to_rgb(panel.border_color)
+                except (ValueError, IndexError, TypeError):
                     # Fallback to blue for fill, red for border
                     panel_fill_rgb = (100, 150, 240)  # Light blue
                     border_rgb = (255, 0, 0)  # Red
                 
-                # Draw panel rectangle
-                draw.rectangle(
-                    (panel_x, panel_top, panel_x + panel_width, panel_bottom),
-                    fill=panel_fill_rgb,
-                    outline=border_rgb,
-                    width=max(1, line_width // 2)
+                fill_rects.append((panel_x, panel_top, panel_x + panel_width, panel_bottom))
+                fill_colors.append(panel_fill_rgb)
+                panel_borders.append(border_rgb)
+            
+            # Map the rectangles onto the smaller fill raster
+            fill_rects = [tuple(int(v * fill_ratio) for v in rect) for rect in fill_rects]
+            
+            # Paint the fills with the compiled kernel when numba is available
+            fill_kernel = _get_fill_kernel()
+            if fill_kernel is not None and fill_rects:
+                fill_kernel(
+                    pixels,
+                    np.array(fill_rects, dtype=np.int64),
+                    np.array(fill_colors, dtype=np.uint8)
                 )
+            else:
+                for (x0, y0, x1, y1), rgb in zip(fill_rects, fill_colors):
+                    pixels[y0:y1, x0:x1] = rgb
+            
+            # Pillow keeps RGB padded to 4 bytes per pixel, so the packed array cannot be
+            # shared and one copy is unavoidable - decode it and release the array right
+            # away so it is not held alongside the image (and the ultra HD upscale)
+            image = Image.frombuffer('RGB', (fill_width, fill_height), pixels, 'raw', 'RGB', 0, 1)
+            del pixels
+            if fill_ratio < 1:
+                image = image.resize((img_width, img_height), _LANCZOS)
+            draw = ImageDraw.Draw(image)
+            
+            # Wall bounds in whole pixels, rounded once for all the draw calls below
+            wall_x0 = int(x_offset)
+            wall_y0 = int(y_offset)
+            wall_x1 = int(x_offset + scaled_width)
+            wall_y1 = int(y_offset + scaled_height)
+            
+            # Draw wall outline with thick lines
+            draw.rectangle(
+                (wall_x0, wall_y0, wall_x1, wall_y1),
+                outline='black',
+                width=line_width
+            )
+            
+            # Draw panel borders and labels. Regular layouts repeat the same panel
+            # size, so each distinct border+label overlay is rendered once as a
+            # transparent tile and pasted (alpha as mask) over the filled panels
+            border_width = max(1, line_width // 2)
+            tile_cache = {}
+            divider_strips = {}
+            for (panel, panel_x, panel_width, panel_top), border_rgb in zip(panel_geometry, panel_borders):
+                tile_x = int(panel_x)
+                tile_y = int(panel_top)
+                tile_w = max(1, int(panel_x + panel_width) - tile_x + 1)
+                tile_h = max(1, int(panel_bottom) - tile_y + 1)
+                key = (tile_w, tile_h, border_rgb, custom_name)
+                tile = tile_cache.get(key)
+                if tile is None:
+                    tile = Image.new('RGBA', (tile_w, tile_h), (0, 0, 0, 0))
+                    tile_draw = ImageDraw.Draw(tile)
+                    tile_draw.rectangle((0, 0, tile_w - 1, tile_h - 1), outline=border_rgb + (255,), width=border_width)
+                    tile_draw.text(
+                        (tile_w / 2, tile_h / 2),
+                        f"{custom_name}",
+                        fill=(0, 0, 0, 255),
+                        font=small_font,
+                        anchor="mm"  # Center alignment
+                    )
+                    tile_cache[key] = tile
+                image.paste(tile, (tile_x, tile_y), tile)
                 
-                # Draw panel vertical dividing lines if not leftmost edge
+                # Draw panel vertical dividing lines if not leftmost edge, pasting
+                # one full-height strip per border color
                 if panel.x > 0:
-                    draw.line(
-                        (panel_x, y_offset, panel_x, y_offset + scaled_height),
-                        fill=border_rgb,
-                        width=max(1, line_width // 2)
-                    )
-                
-                # Draw panel label
-                custom_name = self.custom_name_var.get() or "Panel"
-                text_x = panel_x + panel_width / 2
-                text_y = panel_top + visual_panel_height / 2
-                draw.text(
-                    (text_x, text_y),
-                    f"{custom_name}",
-                    fill='black',
-                    font=small_font,
-                    anchor="mm"  # Center alignment
-                )
+                    strip = divider_strips.get(border_rgb)
+                    if strip is None:
+                        strip = Image.new('RGB', (border_width, wall_y1 - wall_y0 + 1), border_rgb)
+                        divider_strips[border_rgb] = strip
+                    image.paste(strip, (tile_x - border_width // 2, wall_y0))
             
             # Draw dimensions if enabled
-            if self.show_dimensions_var.get():
+            if show_dims:
+                fmt_cache = {}
                 # Draw wall width dimension at top
                 self.draw_direct_dimension(
                     draw,
-                    x_offset, y_offset - 40 * scale_factor / 3,
-                    x_offset + scaled_width, y_offset - 40 * scale_factor / 3,
-                    self.wall_dimensions["width"],
-                    self.wall_dimensions.get("width_fraction", "0"),
+                    x_offset, y_offset - 40 * output_scale / 3,
+                    x_offset + scaled_width, y_offset - 40 * output_scale / 3,
+                    wall_width,
+                    width_fraction,
                     normal_font,
-                    scale_factor
+                    output_scale,
+                    fmt_cache=fmt_cache
                 )
                 
                 # Draw wall height dimension
                 self.draw_direct_dimension(
                     draw,
-                    x_offset - 40 * scale_factor / 3, y_offset,
-                    x_offset - 40 * scale_factor / 3, y_offset + scaled_height,
-                    self.wall_dimensions["height"],
-                    self.wall_dimensions.get("height_fraction", "0"),
+                    x_offset - 40 * output_scale / 3, y_offset,
+                    x_offset - 40 * output_scale / 3, y_offset + scaled_height,
+                    wall_height,
+                    height_fraction,
                     normal_font,
-                    scale_factor,
-                    is_vertical=True
+                    output_scale,
+                    is_vertical=True,
+                    fmt_cache=fmt_cache
                 )
                 
-                # Draw panel width dimensions
-                for panel in fixed_panels:
-                    panel_x = x_offset + (panel.x / 100 * scaled_width)
-                    panel_width = (panel.width / 100 * scaled_width)
+                # Draw panel width dimensions - the panels are contiguous, so their
+                # dimension lines form one run drawn with a single call
+                panel_dim_y = int(y_offset - 20 * output_scale / 3)
+                run_points = []
+                for panel, panel_x, panel_width, panel_top in panel_geometry:
+                    if not run_points:
+                        run_points.append((int(panel_x), panel_dim_y))
+                    run_points.append((int(panel_x + panel_width), panel_dim_y))
                     
                     self.draw_direct_dimension(
                         draw,
-                        panel_x, y_offset - 20 * scale_factor / 3,
-                        panel_x + panel_width, y_offset - 20 * scale_factor / 3,
+                        panel_x, panel_dim_y,
+                        panel_x + panel_width, panel_dim_y,
                         panel.actual_width,
                         panel.actual_width_fraction,
                         small_font,
-                        scale_factor
+                        output_scale,
+                        draw_line=False,
+                        fmt_cache=fmt_cache
                     )
+                if run_points:
+                    draw.line(run_points, fill='black', width=max(1, output_scale // 8))
                 
                 # Draw baseboard dimension if enabled
-                if self.use_baseboard:
+                if use_baseboard:
                     baseboard_dim, baseboard_frac = self.convert_to_feet_inches_fraction(baseboard_height_inches)
                     self.draw_direct_dimension(
                         draw,
-                        x_offset + scaled_width + 20 * scale_factor / 3, 
+                        x_offset + scaled_width + 20 * output_scale / 3, 
                         y_offset + scaled_height - baseboard_height,
-                        x_offset + scaled_width + 20 * scale_factor / 3,
+                        x_offset + scaled_width + 20 * output_scale / 3,
                         y_offset + scaled_height,
                         baseboard_dim,
                         baseboard_frac,
                         small_font,
-                        scale_factor,
-                        is_vertical=True
+                        output_scale,
+                        is_vertical=True,
+                        fmt_cache=fmt_cache
                     )
             
             # Draw wall objects if any
@@ -4421,7 +4838,7 @@ with precise measurements and customizable configurations.
                     obj_x = x_offset + (obj.x_position * scaled_width / 100) - (obj_width / 2)
                     
                     # Calculate vertical position accounting for baseboard
-                    if self.use_baseboard:
+                    if use_baseboard:
                         wall_top = y_offset
                         wall_bottom = y_offset + scaled_height - baseboard_height
                     else:
@@ -4435,51 +4852,38 @@ with precise measurements and customizable configurations.
                     
                     # Parse object color
                     try:
-                        obj_color = obj.color
-                        r = int(obj_color[1:3], 16)
-                        g = int(obj_color[3:5], 16)
-                        b = int(obj_color[5:7], 16)
-                        obj_color_rgb = (r, g, b)
-                        
-                        border_color = obj.border_color
-                        r = int(border_color[1:3], 16)
-                        g = int(border_color[3:5], 16)
-                        b = int(border_color[5:7], 16)
-                        border_rgb = (r, g, b)
-                    except:
+                        obj_color_rgb = _hex_to_rgb(obj.color)
+                        border_rgb = _hex_to_rgb(obj.border_color)
+                    except (ValueError, IndexError, TypeError):
                         obj_color_rgb = (170, 170, 170)  # Gray
                         border_rgb = (0, 0, 0)  # Black
                     
                     # Draw object rectangle
+                    obj_box = (int(obj_x), int(obj_y), int(obj_x + obj_width), int(obj_y + obj_height))
                     if obj.show_border:
                         draw.rectangle(
-                            (obj_x, obj_y, obj_x + obj_width, obj_y + obj_height),
+                            obj_box,
                             fill=obj_color_rgb,
                             outline=border_rgb,
-                            width=obj.border_width * scale_factor // 4
+                            width=obj.border_width * output_scale // 4
                         )
                     else:
                         draw.rectangle(
-                            (obj_x, obj_y, obj_x + obj_width, obj_y + obj_height),
+                            obj_box,
                             fill=obj_color_rgb
                         )
                     
                     # Draw object label
                     draw.text(
-                        (obj_x + obj_width / 2, obj_y + obj_height / 2),
+                        ((obj_box[0] + obj_box[2]) // 2, (obj_box[1] + obj_box[3]) // 2),
                         obj.name,
                         fill='black',
                         font=normal_font,
                         anchor="mm"  # Center alignment
                     )
             
-            # Save the high-resolution image
-            if save_path.lower().endswith('.tiff'):
-                # For TIFF format with LZW compression
-                image.save(save_path, 'TIFF', compression='tiff_lzw', dpi=(600, 600))
-            else:
-                # Default to PNG
-                image.save(save_path, 'PNG', dpi=(600, 600))
+            # Save the high-resolution image in the format implied by the extension
+            _save_image(image, save_path, (600, 600))
             
             messagebox.showinfo("Success", "Ultra high-resolution image saved successfully!")
         
@@ -4488,33 +4892,34 @@ with precise measurements and customizable configurations.
             import traceback
             traceback.print_exc()
 
-    def draw_direct_dimension(self, draw, x1, y1, x2, y2, dimension, fraction, font, scale_factor, is_vertical=False):
-        """Draw dimension line directly on PIL ImageDraw canvas"""
-        # Draw main dimension line
+    def draw_direct_dimension(self, draw, x1, y1, x2, y2, dimension, fraction, font, scale_factor, is_vertical=False, draw_line=True, fmt_cache=None):
+        """Draw dimension line directly on PIL ImageDraw canvas (draw_line=False when the caller batches the line)"""
         line_width = max(1, scale_factor // 8)
         arrow_size = max(5, scale_factor // 6)
+        x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
         
         # Draw main dimension line
-        draw.line((x1, y1, x2, y2), fill='black', width=line_width)
+        if draw_line:
+            draw.line([(x1, y1), (x2, y2)], fill='black', width=line_width)
         
-        # Draw arrow at start
+        # Draw each arrowhead as one polyline
         if is_vertical:
-            draw.line((x1 - arrow_size, y1 + arrow_size, x1, y1, x1 + arrow_size, y1 + arrow_size), 
-                     fill='black', width=line_width)
+            start_arrow = [(x1 - arrow_size, y1 + arrow_size), (x1, y1), (x1 + arrow_size, y1 + arrow_size)]
+            end_arrow = [(x2 - arrow_size, y2 - arrow_size), (x2, y2), (x2 + arrow_size, y2 - arrow_size)]
         else:
-            draw.line((x1 - arrow_size, y1 - arrow_size, x1, y1, x1 - arrow_size, y1 + arrow_size), 
-                     fill='black', width=line_width)
+            start_arrow = [(x1 - arrow_size, y1 - arrow_size), (x1, y1), (x1 - arrow_size, y1 + arrow_size)]
+            end_arrow = [(x2 + arrow_size, y2 - arrow_size), (x2, y2), (x2 + arrow_size, y2 + arrow_size)]
+        draw.line(start_arrow, fill='black', width=line_width)
+        draw.line(end_arrow, fill='black', width=line_width)
         
-        # Draw arrow at end
-        if is_vertical:
-            draw.line((x2 - arrow_size, y2 - arrow_size, x2, y2, x2 + arrow_size, y2 - arrow_size), 
-                     fill='black', width=line_width)
+        # Format dimension text (equal panel widths share one cached string per export)
+        if fmt_cache is None:
+            text = self.format_dimension(dimension, fraction)
         else:
-            draw.line((x2 + arrow_size, y2 - arrow_size, x2, y2, x2 + arrow_size, y2 + arrow_size), 
-                     fill='black', width=line_width)
-        
-        # Format dimension text
-        text = self.format_dimension(dimension, fraction)
+            key = (dimension.feet, dimension.inches, fraction)
+            text = fmt_cache.get(key)
+            if text is None:
+                text = fmt_cache[key] = self.format_dimension(dimension, fraction)
         
         # Position text
         text_x = (x1 + x2) / 2
@@ -4529,14 +4934,6 @@ with precise measurements and customizable configurations.
 
     def export_high_quality_image(self):
         """Export the wall drawing as a high resolution image with proper color rendering"""
-        try:
-            from PIL import Image
-            import numpy as np
-            import pyscreenshot as ImageGrab
-        except ImportError:
-            messagebox.showerror("Error", "Required libraries missing. Please install with:\npip install pillow numpy pyscreenshot")
-            return
-
         # Get save location
         file_name = f"{self.project_name_var.get().replace(' ', '-')}-{self.date_var.get()}.tiff"
         save_path = filedialog.asksaveasfilename(
@@ -4549,44 +4946,16 @@ with precise measurements and customizable configurations.
             return
 
         try:
-            # Make sure canvas is fully updated and give time for rendering
-            self.update()
-            self.after(100)  # Small delay to ensure canvas is fully rendered
-            
-            # Get the canvas coordinates on screen
-            canvas_x = self.canvas.winfo_rootx()
-            canvas_y = self.canvas.winfo_rooty()
-            canvas_width = self.canvas.winfo_width()
-            canvas_height = self.canvas.winfo_height()
-            
-            # Take a screenshot of just the canvas area at maximum quality
-            img = ImageGrab.grab(bbox=(canvas_x, canvas_y, 
-                                      canvas_x + canvas_width, 
-                                      canvas_y + canvas_height))
-            
-            # Calculate scaling factor for high resolution (4x)
+            # Rasterize the canvas items at 4x directly instead of grabbing the
+            # screen and upscaling the screenshot with LANCZOS
             scale_factor = 4
-            target_width = canvas_width * scale_factor
-            target_height = canvas_height * scale_factor
-            
-            # Resize with high-quality algorithm
-            img = img.resize((target_width, target_height), Image.LANCZOS)
+            img = self._render_canvas_to_image(scale_factor)
             
             # Set DPI for print quality
             dpi = (600, 600)
             
             # Save with appropriate format and maximum quality settings
-            if save_path.lower().endswith('.jpg') or save_path.lower().endswith('.jpeg'):
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                img.save(save_path, 'JPEG', quality=100, dpi=dpi)
-                
-            elif save_path.lower().endswith('.tiff'):
-                # Use best TIFF compression for quality
-                img.save(save_path, 'TIFF', compression='tiff_lzw', dpi=dpi)
-                
-            else:  # Default to PNG
-                img.save(save_path, 'PNG', dpi=dpi)
+            _save_image(img, save_path, dpi, quality=100)
             
             messagebox.showinfo("Success", f"High-resolution image saved successfully!")
             
@@ -4595,6 +4964,197 @@ with precise measurements and customizable configurations.
             import traceback
             traceback.print_exc()  # Print stack trace for debugging
 
+    def _cleanup_tmp(self):
+        """Remove the reusable export scratch file"""
+        try:
+            os.remove(self._tmp_svg)
+        except OSError:
+            pass
+
+    def _get_scratch_svg(self):
+        """Write the scene SVG to the scratch path unless it is already current"""
+        fingerprint = (
+            self._scene_fingerprint(),
+            self.project_name_var.get(),
+            self.date_var.get()
+        )
+        if getattr(self, '_cached_svg_fingerprint', None) != fingerprint or not os.path.exists(self._tmp_svg):
+            self._cached_svg_fingerprint = None
+            self.export_svg_enhanced(path=self._tmp_svg)
+            self._cached_svg_fingerprint = fingerprint
+        return self._tmp_svg
+
+    def _get_scratch_svg_bytes(self):
+        """The scratch SVG's contents, read from disk once per scene change"""
+        self._get_scratch_svg()
+        cached = getattr(self, '_cached_svg_bytes', None)
+        if cached is None or cached[0] != self._cached_svg_fingerprint:
+            with open(self._tmp_svg, 'rb') as f:
+                cached = (self._cached_svg_fingerprint, f.read())
+            self._cached_svg_bytes = cached
+        return cached[1]
+
+    def _scene_fingerprint(self):
+        """Cheap key identifying the current canvas contents"""
+        return (
+            len(self.canvas.find_all()),
+            self.canvas.winfo_width(),
+            self.canvas.winfo_height(),
+            self._scene_version
+        )
+
+    def _get_canvas_postscript(self):
+        """Return the canvas PostScript, reusing it while the scene is unchanged"""
+        fingerprint = self._scene_fingerprint()
+        ps_data = self._ps_cache.get(fingerprint)
+        if ps_data is None:
+            canvas_width, canvas_height = fingerprint[1], fingerprint[2]
+            ps_data = self.canvas.postscript(
+                colormode='color',
+                pagewidth=canvas_width,
+                pageheight=canvas_height,
+                x=0, y=0,
+                width=canvas_width,
+                height=canvas_height
+            )
+            # Only the latest scene is worth keeping
+            self._ps_cache.clear()
+            self._ps_cache[fingerprint] = ps_data
+        return ps_data
+
+    def _write_direct_eps(self, save_path):
+        """Write the wall, panels, objects, dimensions and annotations straight to an EPS file"""
+        canvas_width = self.canvas.winfo_width()
+        canvas_height = self.canvas.winfo_height()
+        margin = 100
+
+        def rgb(color, fallback):
+            try:
+                r, g, b = self.winfo_rgb(color)
+            except (tk.TclError, TypeError):
+                r, g, b = self.winfo_rgb(fallback)
+            return f"{r / 65535:.3f} {g / 65535:.3f} {b / 65535:.3f} setrgbcolor"
+
+        def ps_string(text):
+            return "(" + str(text).replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+        wall_width = self.wall_dimensions["width"]
+        wall_height = self.wall_dimensions["height"]
+        width_fraction = self.wall_dimensions.get("width_fraction", "0")
+        height_fraction = self.wall_dimensions.get("height_fraction", "0")
+        wall_width_inches = self.convert_to_inches(wall_width.feet, wall_width.inches, width_fraction)
+        wall_height_inches = self.convert_to_inches(wall_height.feet, wall_height.inches, height_fraction)
+
+        baseboard_height_inches = self.baseboard_height
+        if self._has_baseboard_frac:
+            baseboard_height_inches += self.fraction_to_decimal(self.baseboard_fraction_var.get())
+        use_baseboard = self.use_baseboard
+        visual_usable_height = wall_height_inches - (baseboard_height_inches if use_baseboard else 0)
+
+        # Same fit-to-canvas scaling as draw_wall
+        if wall_width_inches / wall_height_inches > (canvas_width - 2 * margin) / (canvas_height - 2 * margin):
+            scale = (canvas_width - 2 * margin) / wall_width_inches
+        else:
+            scale = (canvas_height - 2 * margin) / wall_height_inches
+        scale *= 0.8
+
+        scaled_width = wall_width_inches * scale
+        scaled_height = wall_height_inches * scale
+        x_offset = (canvas_width - scaled_width) / 2
+        y_offset = (canvas_height - scaled_height) / 2
+        baseboard_height = baseboard_height_inches * scale if use_baseboard else 0
+        panel_bottom = y_offset + scaled_height - baseboard_height
+
+        with open(save_path, 'w', buffering=1 << 20) as f:
+            w = f.write
+            w("%!PS-Adobe-3.0 EPSF-3.0\n")
+            w(f"%%BoundingBox: 0 0 {canvas_width} {canvas_height}\n")
+            w("%%EndComments\n")
+            # Work in canvas coordinates (y down); ct draws text centered on x y
+            w(f"0 {canvas_height} translate 1 -1 scale\n")
+            w("/ct { /sz exch def /Helvetica findfont sz scalefont setfont gsave translate 1 -1 scale "
+              "dup stringwidth pop -2 div sz -0.35 mul moveto show grestore } def\n")
+            w("/ln { newpath moveto lineto stroke } def\n")
+
+            def dimension(x1, y1, x2, y2, dim, fraction, size, is_vertical=False):
+                arrow = 5
+                w(f"0 0 0 setrgbcolor 1 setlinewidth {x2} {y2} {x1} {y1} ln\n")
+                if is_vertical:
+                    w(f"newpath {x1 - arrow} {y1 + arrow} moveto {x1} {y1} lineto {x1 + arrow} {y1 + arrow} lineto stroke\n")
+                    w(f"newpath {x2 - arrow} {y2 - arrow} moveto {x2} {y2} lineto {x2 + arrow} {y2 - arrow} lineto stroke\n")
+                    w(f"{ps_string(self.format_dimension(dim, fraction))} {x1 - 25} {(y1 + y2) / 2} {size} ct\n")
+                else:
+                    w(f"newpath {x1 + arrow} {y1 - arrow} moveto {x1} {y1} lineto {x1 + arrow} {y1 + arrow} lineto stroke\n")
+                    w(f"newpath {x2 - arrow} {y2 - arrow} moveto {x2} {y2} lineto {x2 - arrow} {y2 + arrow} lineto stroke\n")
+                    w(f"{ps_string(self.format_dimension(dim, fraction))} {(x1 + x2) / 2} {y1 - 8} {size} ct\n")
+
+            if use_baseboard:
+                w(f"0.5 0.5 0.5 setrgbcolor {x_offset} {panel_bottom} {scaled_width} {baseboard_height} rectfill\n")
+
+            # Panels are laid out left to right without overlap, as in draw_wall
+            custom_name = ps_string(self.custom_name_var.get() or "Panel")
+            panel_runs = []
+            current_x_percent = 0
+            for panel in sorted(self.calculate_panels(), key=_BY_X):
+                panel_x = x_offset + current_x_percent / 100 * scaled_width
+                panel_width = panel.width / 100 * scaled_width
+                panel_height_inches = self.convert_to_inches(panel.height.feet, panel.height.inches, panel.height_fraction)
+                # Raised panels sit height_offset above the floor, but never
+                # lower than the top of the baseboard (as in draw_wall)
+                bottom = panel_bottom
+                if not panel.floor_mounted:
+                    height_offset_inches = 0
+                    if panel.height_offset:
+                        height_offset_inches = self.convert_to_inches(
+                            panel.height_offset.feet, panel.height_offset.inches, panel.height_offset_fraction)
+                    bottom = min(y_offset + scaled_height - height_offset_inches * scale, panel_bottom)
+                panel_top = bottom - min(panel_height_inches, visual_usable_height) * scale
+                w(f"{rgb(panel.color, '#6496F0')} {panel_x} {panel_top} {panel_width} {bottom - panel_top} rectfill\n")
+                w(f"{rgb(panel.border_color, 'red')} 1 setlinewidth {panel_x} {panel_top} {panel_width} {bottom - panel_top} rectstroke\n")
+                if current_x_percent > 0:
+                    w(f"{panel_x} {y_offset} {panel_x} {y_offset + scaled_height} ln\n")
+                w(f"0 0 0 setrgbcolor {custom_name} {panel_x + panel_width / 2} {(panel_top + bottom) / 2} 8 ct\n")
+                panel_runs.append((panel_x, panel_width, panel))
+                current_x_percent += panel.width
+
+            w(f"0 0 0 setrgbcolor 2 setlinewidth {x_offset} {y_offset} {scaled_width} {scaled_height} rectstroke\n")
+
+            for obj in getattr(self, 'wall_objects', None) or []:
+                obj_width = self.convert_to_inches(obj.width.feet, obj.width.inches, obj.width_fraction) * scale
+                obj_height = self.convert_to_inches(obj.height.feet, obj.height.inches, obj.height_fraction) * scale
+                obj_x = x_offset + obj.x_position * scaled_width / 100 - obj_width / 2
+                obj_y = y_offset + obj.y_position / 100 * (panel_bottom - y_offset) - obj_height / 2
+                w(f"{rgb(obj.color, '#AAAAAA')} {obj_x} {obj_y} {obj_width} {obj_height} rectfill\n")
+                if obj.show_border:
+                    w(f"{rgb(obj.border_color, 'black')} {obj.border_width} setlinewidth {obj_x} {obj_y} {obj_width} {obj_height} rectstroke\n")
+                w(f"0 0 0 setrgbcolor {ps_string(obj.name)} {obj_x + obj_width / 2} {obj_y + obj_height / 2} 12 ct\n")
+
+            if self.show_dimensions_var.get():
+                dimension(x_offset, y_offset - 40, x_offset + scaled_width, y_offset - 40,
+                          wall_width, width_fraction, 12)
+                dimension(x_offset - 40, y_offset, x_offset - 40, y_offset + scaled_height,
+                          wall_height, height_fraction, 12, is_vertical=True)
+                for panel_x, panel_width, panel in panel_runs:
+                    dimension(panel_x, y_offset - 20, panel_x + panel_width, y_offset - 20,
+                              panel.actual_width, panel.actual_width_fraction, 8)
+                if use_baseboard:
+                    baseboard_dim, baseboard_frac = self.convert_to_feet_inches_fraction(baseboard_height_inches)
+                    dimension(x_offset + scaled_width + 20, panel_bottom, x_offset + scaled_width + 20,
+                              y_offset + scaled_height, baseboard_dim, baseboard_frac, 8, is_vertical=True)
+
+            for circle in getattr(self, 'annotation_circles', None) or []:
+                if circle.line_to_x is not None and circle.line_to_y is not None:
+                    dash = "[4 2] 0 setdash" if circle.line_style == "dash" else "[] 0 setdash"
+                    w(f"{rgb(circle.line_color, 'black')} {circle.line_width} setlinewidth {dash} "
+                      f"{circle.line_to_x} {circle.line_to_y} {circle.x} {circle.y} ln [] 0 setdash\n")
+                w(f"{rgb(circle.color, 'white')} newpath {circle.x} {circle.y} {circle.radius} 0 360 arc fill\n")
+                w(f"{rgb(circle.border_color, 'black')} {circle.border_width} setlinewidth "
+                  f"newpath {circle.x} {circle.y} {circle.radius} 0 360 arc stroke\n")
+                if circle.text:
+                    w(f"{rgb(circle.text_color, 'black')} {ps_string(circle.text)} {circle.x} {circle.y} {circle.font_size} ct\n")
+
+            w("showpage\n%%EOF\n")
+
     def export_eps(self):
         """Export the wall drawing as an Encapsulated PostScript (EPS) file with proper color support"""
         # Get save location
@@ -4609,23 +5169,20 @@ with precise measurements and customizable configurations.
             return
 
         try:
-            # Force a redraw to ensure all elements are rendered correctly
-            self.update()
-            
-            # Create a PostScript file directly from the canvas
-            # Use extended options for better color handling
-            ps_data = self.canvas.postscript(
-                colormode='color',  # Use color mode
-                pagewidth=self.canvas.winfo_width(),
-                pageheight=self.canvas.winfo_height(),
-                x=0, y=0,
-                width=self.canvas.winfo_width(),
-                height=self.canvas.winfo_height()
-            )
+            # Flush pending redraws so all elements are in place
+            self.update_idletasks()
             
-            # Write the EPS file
-            with open(save_path, 'w') as f:
-                f.write(ps_data)
+            if len(self.canvas.find_all()) > _DIRECT_EPS_MIN_ITEMS:
+                # Huge scenes: write the PostScript from the wall model
+                self._write_direct_eps(save_path)
+            else:
+                # Create a PostScript file directly from the canvas
+                # Use extended options for better color handling
+                ps_data = self._get_canvas_postscript()
+                
+                # Write the EPS file
+                with open(save_path, 'w') as f:
+                    f.write(ps_data)
             
             messagebox.showinfo("Success", "EPS file exported successfully!")
         except Exception as e:
@@ -4636,9 +5193,6 @@ with precise measurements and customizable configurations.
     def export_enhanced_svg(self):
         """Export an enhanced SVG with better compatibility and quality"""
         try:
-            import os
-            import tempfile
-            
             # Get save location
             file_name = f"{self.project_name_var.get().replace(' ', '-')}-{self.date_var.get()}.svg"
             save_path = filedialog.asksaveasfilename(
@@ -4650,39 +5204,11 @@ with precise measurements and customizable configurations.
             if not save_path:
                 return
                 
-            # Create a temporary directory for intermediate files
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # Use the existing SVG export method but redirect to a temp file
-                temp_svg_path = os.path.join(temp_dir, "temp.svg")
-                
-                # Store original asksaveasfilename function
-                original_ask = filedialog.asksaveasfilename
-                
-                # Override with our temp path
-                filedialog.asksaveasfilename = lambda **kwargs: temp_svg_path
-                
-                # Call the existing SVG export method
-                self.export_svg_enhanced()
-                
-                # Restore original function
-                filedialog.asksaveasfilename = original_ask
-                
-                # Now we have the SVG in temp_svg_path
-                # Optionally post-process it for better quality
-                
-                # Read the SVG content
-                with open(temp_svg_path, 'r') as f:
-                    svg_content = f.read()
-                    
-                # You could enhance the SVG content here if needed
-                # For example, add better metadata, optimize paths, etc.
-                
-                # Write the final SVG
-                with open(save_path, 'w') as f:
-                    f.write(svg_content)
-                    
-                messagebox.showinfo("Success", "Enhanced SVG exported successfully!")
+            # Write the SVG straight to the chosen file
+            self.export_svg_enhanced(path=save_path)
                 
+            messagebox.showinfo("Success", "Enhanced SVG exported successfully!")
+            
 
         
         except Exception as e:
@@ -4693,9 +5219,6 @@ with precise measurements and customizable configurations.
     def export_enhanced_pdf(self):
         """Export an enhanced PDF with better compatibility and quality"""
         try:
-            import os
-            import tempfile
-            
             # Get save location
             file_name = f"{self.project_name_var.get().replace(' ', '-')}-{self.date_var.get()}.pdf"
             save_path = filedialog.asksaveasfilename(
@@ -4707,35 +5230,23 @@ with precise measurements and customizable configurations.
             if not save_path:
                 return
                 
-            # Create a temporary directory for intermediate files
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # First generate a high-quality SVG
-                temp_svg_path = os.path.join(temp_dir, "temp.svg")
-                
-                # Store original function
-                original_ask = filedialog.asksaveasfilename
-                
-                # Override with our temp path
-                filedialog.asksaveasfilename = lambda **kwargs: temp_svg_path
-                
-                # Call SVG export
-                self.export_svg_enhanced()
-                
-                # Restore original function
-                filedialog.asksaveasfilename = original_ask
-                
-                # Create an instance of PDFExporter
-                pdf_exporter = PDFExporter(self.canvas, self.summary_text)
-                
-                # Convert SVG to PDF using the PDF exporter
-                pdf_exporter.svg_to_pdf(
-                    temp_svg_path, 
-                    save_path, 
-                    dpi=600  # High resolution
-                )
-                
-                messagebox.showinfo("Success", "Enhanced PDF exported successfully!")
-                
+            # Intermediate files go to the reusable scratch paths
+            # First generate a high-quality SVG
+            temp_svg_path = self._get_scratch_svg()
+            
+            # Create an instance of PDFExporter
+            pdf_exporter = PDFExporter(self.canvas, self.summary_text)
+            
+            # Convert SVG to PDF using the PDF exporter
+            pdf_exporter.svg_to_pdf(
+                temp_svg_path, 
+                save_path, 
+                dpi=600,  # High resolution
+                svg_data=self._get_scratch_svg_bytes()
+            )
+            
+            messagebox.showinfo("Success", "Enhanced PDF exported successfully!")
+            
 
         
         except Exception as e:
@@ -4746,8 +5257,6 @@ with precise measurements and customizable configurations.
     def export_enhanced_eps(self):
         """Export an enhanced EPS file with better compatibility and quality"""
         try:
-            import os
-            
             # Get save location
             file_name = f"{self.project_name_var.get().replace(' ', '-')}-{self.date_var.get()}.eps"
             save_path = filedialog.asksaveasfilename(
@@ -4759,19 +5268,16 @@ with precise measurements and customizable configurations.
             if not save_path:
                 return
                 
-            # Use the canvas's postscript method for best vector quality
-            ps_data = self.canvas.postscript(
-                colormode='color',
-                pagewidth=self.canvas.winfo_width(),
-                pageheight=self.canvas.winfo_height(),
-                x=0, y=0,
-                width=self.canvas.winfo_width(),
-                height=self.canvas.winfo_height()
-            )
-            
-            # Write the postscript data to file
-            with open(save_path, 'w') as f:
-                f.write(ps_data)
+            if len(self.canvas.find_all()) > _DIRECT_EPS_MIN_ITEMS:
+                # Huge scenes: skip the Tk canvas walk and write from the wall model
+                self._write_direct_eps(save_path)
+            else:
+                # Use the canvas's postscript method for best vector quality
+                ps_data = self._get_canvas_postscript()
+                
+                # Write the postscript data to file
+                with open(save_path, 'w') as f:
+                    f.write(ps_data)
                 
             messagebox.showinfo("Success", "Enhanced EPS exported successfully!")
             
@@ -4782,18 +5288,22 @@ with precise measurements and customizable configurations.
             import traceback
             traceback.print_exc()
 
-    def export_high_res_via_svg(self, format_type, scale_factor=6):
+    def export_high_res_via_svg(self, format_type, scale_factor=6, dpi=None,
+                                jpeg_quality=90, jpeg_subsampling=0,
+                                tiff_compression='deflate', tiff_predictor=True):
         """
         Export high-resolution raster image via SVG first approach
         
         Args:
             format_type: Format type string ('png', 'tiff', 'jpg')
-            scale_factor: Resolution multiplier (default: 6)
+            scale_factor: Resolution multiplier, used when dpi is not given (default: 6)
+            dpi: Output resolution for the drawing (default: 72 * scale_factor)
+            jpeg_quality: JPEG quality (default: 90)
+            jpeg_subsampling: JPEG chroma subsampling, 0 = 4:4:4 (default: 0)
+            tiff_compression: Lossless TIFF codec, 'deflate' or 'lzw' (default: 'deflate')
+            tiff_predictor: Apply horizontal differencing to TIFF rows (default: True)
         """
         try:
-            import os
-            import tempfile
-            
             # Make sure format type is lowercase
             format_type = format_type.lower()
             
@@ -4824,69 +5334,64 @@ with precise measurements and customizable configurations.
                 
             try:
                 from PIL import Image
-                import cairosvg
             except ImportError:
-                messagebox.showerror("Error", "Required libraries missing. Please install with:\npip install pillow cairosvg")
+                messagebox.showerror("Error", "Pillow library is required. Please install with: pip install pillow")
                 return
                 
-            # Create a temporary directory for intermediate files
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # First generate a high-quality SVG
-                temp_svg_path = os.path.join(temp_dir, "temp.svg")
-                
-                # Store original function
-                original_ask = filedialog.asksaveasfilename
-                
-                # Override with our temp path
-                filedialog.asksaveasfilename = lambda **kwargs: temp_svg_path
-                
-                # Call SVG export
-                self.export_svg_enhanced()
-                
-                # Restore original function
-                filedialog.asksaveasfilename = original_ask
-                
-                # Calculate target dimensions
-                canvas_width = self.canvas.winfo_width()
-                canvas_height = self.canvas.winfo_height()
-                target_width = canvas_width * scale_factor
-                target_height = canvas_height * scale_factor
-                
-                # Calculate DPI for print-quality output
-                # Standard DPI is 72, so we multiply by the scale factor
+            # Calculate DPI for print-quality output
+            # Standard DPI is 72, so we multiply by the scale factor
+            if dpi is None:
                 dpi = 72 * scale_factor
+            
+            # The SVG is written here on the Tk thread; the render and encode
+            # run on the export pool so the window stays responsive
+            render_job = self._prepare_svg_render(dpi)
+            
+            def _do_raster():
+                # Render the scene SVG to PNG bytes
+                render = self._render_svg_png(render_job)
+                png_bytes = render[1]
                 
-                # Create a temporary PNG file
-                temp_png_path = os.path.join(temp_dir, "temp.png")
-                
-                # Use CairoSVG to render the SVG to a high-resolution PNG
-                cairosvg.svg2png(
-                    url=temp_svg_path,
-                    write_to=temp_png_path,
-                    output_width=target_width,
-                    output_height=target_height,
-                    dpi=dpi
-                )
+                # PNG needs no pixel changes, so the rendered bytes (plus the
+                # resolution chunk) are the file
+                if pil_format == 'PNG':
+                    with open(save_path, 'wb') as f:
+                        f.write(_png_with_dpi(png_bytes, dpi))
+                    return render
                 
-                # Open the temporary PNG
-                img = Image.open(temp_png_path)
+                # TIFF/JPEG: re-encode the in-memory PNG with PIL
+                img = Image.open(io.BytesIO(png_bytes))
                 
                 # Format-specific settings for saving
                 if pil_format == 'TIFF':
-                    # Use LZW compression for TIFF (lossless)
-                    img.save(save_path, pil_format, compression='tiff_lzw', dpi=(dpi, dpi))
+                    # Use Deflate compression for TIFF (lossless)
+                    _save_tiff(img, save_path, (dpi, dpi), compression=tiff_compression,
+                               predictor=tiff_predictor)
                 elif pil_format == 'JPEG':
-                    # Convert to RGB for JPEG and use maximum quality
+                    # Convert to RGB for JPEG; 4:4:4 keeps thin colored lines from
+                    # bleeding, which matters more for line art than a higher quality
                     if img.mode != 'RGB':
                         img = img.convert('RGB')
-                    img.save(save_path, pil_format, quality=95, dpi=(dpi, dpi))
-                else:  # PNG
-                    # Use maximum compression for PNG
-                    img.save(save_path, pil_format, dpi=(dpi, dpi), compress_level=9)
-                    
-                messagebox.showinfo("Success", f"High-resolution {format_type.upper()} exported at {dpi} DPI!")
-                
-
+                    img.save(save_path, pil_format, quality=jpeg_quality, subsampling=jpeg_subsampling,
+                             progressive=True, optimize=True, dpi=(dpi, dpi))
+                return render
+            
+            def _fallback():
+                # Try alternative export method if SVG conversion fails
+                try:
+                    messagebox.showinfo("Notice", "Trying alternative export method...")
+                    if format_type == 'png':
+                        self.export_direct_vector(save_path)
+                    else:
+                        self.export_direct_vector()
+                except Exception as e:
+                    messagebox.showerror("Error", f"Alternative export failed: {str(e)}")
+            
+            self._run_export_job(
+                _do_raster,
+                f"High-resolution {format_type.upper()} exported at {dpi} DPI!",
+                on_error=_fallback
+            )
         
         except Exception as e:
             messagebox.showerror("Error", f"Export failed: {str(e)}")
@@ -4903,6 +5408,167 @@ with precise measurements and customizable configurations.
             except:
                 pass
 
+    def _run_export_job(self, job, success_message, on_error=None, on_success=None):
+        """Run job on the export pool, showing a busy cursor until it finishes
+        
+        A job that renders the scratch SVG returns _render_svg_png's
+        (raster_key, png_bytes) so the render can be cached on the Tk thread.
+        """
+        self.canvas.configure(cursor="watch")
+        future = self._export_pool.submit(job)
+        self.after(100, self._poll_export_job, future, success_message, on_error, on_success)
+
+    def _poll_export_job(self, future, success_message, on_error, on_success=None):
+        """Report a finished export job back on the Tk thread"""
+        # Tk must only be touched from its own thread, so poll instead of
+        # using a done-callback (which runs on the worker)
+        if not future.done():
+            self.after(100, self._poll_export_job, future, success_message, on_error, on_success)
+            return
+        
+        self.canvas.configure(cursor="")
+        try:
+            render = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Export failed: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            if on_error is not None:
+                on_error()
+            return
+        if render is not None:
+            self._store_raster(*render)
+        messagebox.showinfo("Success", success_message)
+        if on_success is not None:
+            on_success()
+
+    def _prepare_svg_render(self, dpi):
+        """Write (or reuse) the scratch SVG and work out its render size
+        
+        Touches Tk (and reads the render cache), so it runs on the Tk thread;
+        the result is handed to _render_svg_png, which is safe to call from
+        the export pool.
+        """
+        # Generate (or reuse) the high-quality SVG
+        svg_data = self._get_scratch_svg_bytes()
+        
+        # Size the bitmap from the SVG itself (96 user units per inch) rather
+        # than the on-screen canvas, so the pixel count follows the drawing and
+        # the output has the drawing's aspect ratio instead of being letterboxed
+        svg_width, svg_height = self._svg_size
+        target_width = round(svg_width * dpi / 96)
+        target_height = round(svg_height * dpi / 96)
+        
+        raster_key = (self._cached_svg_fingerprint, target_width, target_height, dpi)
+        
+        # The SVG bytes are an immutable snapshot, so a later export rewriting
+        # the scratch file can't change them under a running render
+        return raster_key, svg_data, self._raster_cache.get(raster_key)
+
+    def _render_svg_png(self, render_job):
+        """Render a prepared scratch SVG to PNG bytes, reusing the cached render
+        when the same scene is exported again at the same size (e.g. PNG then TIFF)
+        
+        Returns (raster_key, png_bytes) without touching the cache, so it can run
+        on the export pool; hand the result to _store_raster on the Tk thread.
+        """
+        import cairosvg
+        
+        raster_key, svg_data, png_bytes = render_job
+        _, target_width, target_height, dpi = raster_key
+        
+        if png_bytes is None:
+            png_bytes = cairosvg.svg2png(
+                bytestring=svg_data,
+                output_width=target_width,
+                output_height=target_height,
+                dpi=dpi
+            )
+        return raster_key, png_bytes
+
+    def _store_raster(self, raster_key, png_bytes):
+        """Cache an SVG render for the next export (Tk thread only)"""
+        # Only the latest render is worth keeping
+        self._raster_cache.clear()
+        self._raster_cache[raster_key] = png_bytes
+
+    def export_all(self, formats=("png", "pdf", "svg"), out_dir=None):
+        """Export the drawing in several formats from one SVG and one raster render
+        
+        Args:
+            formats: Any of 'svg', 'pdf', 'png', 'jpg', 'tiff'
+            out_dir: Output folder (asked for when not given)
+        """
+        if not self.project_name_var.get().strip():
+            messagebox.showerror("Error", "Please enter a project name")
+            return
+        
+        # Reject unknown formats before anything is written
+        formats = [fmt.lower() for fmt in formats]
+        raster_formats = ('png', 'jpg', 'jpeg', 'tif', 'tiff')
+        unsupported = [fmt for fmt in formats if fmt not in ('svg', 'pdf') + raster_formats]
+        if unsupported:
+            messagebox.showerror("Error", f"Unsupported format: {', '.join(unsupported)}")
+            return
+        
+        if out_dir is None:
+            out_dir = filedialog.askdirectory(title="Choose a folder for the exported files")
+        if not out_dir:
+            return
+        
+        try:
+            from PIL import Image
+            
+            base_name = f"{self.project_name_var.get().replace(' ', '-')}-{self.date_var.get()}"
+            dpi = 72 * _SCALE_FROM_QUALITY.get(self.quality_level_var.get(), 6)
+            
+            # Every format is derived from the same SVG snapshot, taken here on the
+            # Tk thread; the renders and encodes run on the export pool
+            svg_data = self._get_scratch_svg_bytes()
+            render_job = None
+            if any(fmt in raster_formats for fmt in formats):
+                render_job = self._prepare_svg_render(dpi)
+            
+            def _write_all():
+                # The raster formats share one render, decoded at most once for
+                # the PIL-encoded formats
+                render = None
+                img = None
+                for fmt in formats:
+                    save_path = os.path.join(out_dir, f"{base_name}.{fmt}")
+                    if fmt == 'svg':
+                        with open(save_path, 'wb') as f:
+                            f.write(svg_data)
+                    elif fmt == 'pdf':
+                        pdf_exporter = PDFExporter(self.canvas, self.summary_text)
+                        pdf_exporter.svg_to_pdf(None, save_path, dpi=300, svg_data=svg_data)
+                    else:
+                        if render is None:
+                            render = self._render_svg_png(render_job)
+                        png_bytes = render[1]
+                        if fmt == 'png':
+                            with open(save_path, 'wb') as f:
+                                f.write(_png_with_dpi(png_bytes, dpi))
+                            continue
+                        if img is None:
+                            img = Image.open(io.BytesIO(png_bytes))
+                            img.load()
+                        if fmt in ('jpg', 'jpeg'):
+                            # Same settings as the single JPEG export: 4:4:4 keeps
+                            # thin colored lines from bleeding
+                            _save_jpeg(img, save_path, (dpi, dpi), quality=90, subsampling=0)
+                        else:
+                            _save_image(img, save_path, (dpi, dpi))
+                return render
+            
+            self._run_export_job(
+                _write_all,
+                f"Exported {', '.join(fmt.upper() for fmt in formats)} to {out_dir}"
+            )
+        except Exception as e:
+            messagebox.showerror("Error", f"Export failed: {str(e)}")
+            import traceback
+            traceback.print_exc()
 
     def export_pdf(self):
         # Validate inputs
@@ -4953,15 +5619,21 @@ with precise measurements and customizable configurations.
             
 
 
-    def export_svg_enhanced(self):
-        """Export the wall drawing as a clean SVG file optimized for Inkscape editing"""
+    def export_svg_enhanced(self, path=None):
+        """Export the wall drawing as a clean SVG file optimized for Inkscape editing
+
+        When path is given the SVG is written there without asking, and errors
+        are raised to the caller instead of being shown.
+        """
         # Get save location
-        file_name = f"{self.project_name_var.get().replace(' ', '-')}-{self.date_var.get()}.svg"
-        save_path = filedialog.asksaveasfilename(
-            defaultextension=".svg",
-            initialfile=file_name,
-            filetypes=[("SVG files", "*.svg")]
-        )
+        save_path = path
+        if save_path is None:
+            file_name = f"{self.project_name_var.get().replace(' ', '-')}-{self.date_var.get()}.svg"
+            save_path = filedialog.asksaveasfilename(
+                defaultextension=".svg",
+                initialfile=file_name,
+                filetypes=[("SVG files", "*.svg")]
+            )
 
         if not save_path:
             return
@@ -4982,12 +5654,26 @@ with precise measurements and customizable configurations.
             
             # Set up scaling and margins
             scale = 10  # Each inch = 10 units in SVG
+            
+            # Baseboard height, computed once for the panels, dimensions and objects
+            use_baseboard = self.use_baseboard
+            baseboard_height_inches = 0.0
+            if use_baseboard:
+                baseboard_height_inches = self.baseboard_height
+                if self._has_baseboard_frac:
+                    baseboard_height_inches += self.fraction_to_decimal(self.baseboard_fraction_var.get())
+            baseboard_height = baseboard_height_inches * scale
             margin = 100
             svg_width = int(wall_width_inches * scale) + (2 * margin)
             svg_height = int(wall_height_inches * scale) + (2 * margin)
+            self._svg_size = (svg_width, svg_height)  # read back by the SVG raster export
             
-            # Start SVG content with proper Inkscape namespaces
-            svg_content = f'''<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+            # Stream the SVG straight to disk through a large write buffer
+            with open(save_path, 'w', buffering=1 << 20, encoding='utf-8') as svg_file:
+                write = svg_file.write
+                
+                # Start SVG content with proper Inkscape namespaces
+                write(f'''<?xml version="1.0" encoding="UTF-8" standalone="no"?>
     <svg
        width="{svg_width}"
        height="{svg_height}"
@@ -4997,259 +5683,276 @@ with precise measurements and customizable configurations.
        xmlns="http://www.w3.org/2000/svg"
        xmlns:svg="http://www.w3.org/2000/svg"
        xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"
-       xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd">
+       xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd"
+       font-family="Arial"
+       font-size="12"
+       text-anchor="middle">
 
       <!-- Project metadata -->
       <title>Wall Panel Shop Drawing</title>
       <desc>Project: {self.project_name_var.get()}, Date: {self.date_var.get()}</desc>
       
+      <!-- Shared arrowheads and dimension line style, defined once for every dimension -->
+      <defs>
+        <marker id="arrow_start" markerWidth="10" markerHeight="7" refX="0" refY="3.5" orient="auto">
+          <polygon points="10 0, 0 3.5, 10 7" fill="black" />
+        </marker>
+        <marker id="arrow_end" markerWidth="10" markerHeight="7" refX="10" refY="3.5" orient="auto">
+          <polygon points="0 0, 10 3.5, 0 7" fill="black" />
+        </marker>
+        <style>
+          line.dim {{ stroke: black; stroke-width: 1; marker-start: url(#arrow_start); marker-end: url(#arrow_end); }}
+        </style>
+      </defs>
+      
       <!-- Create layers for easier editing in Inkscape -->
       <g inkscape:groupmode="layer" id="layer_wall" inkscape:label="Wall">
-    '''
+    ''')
             
-            # Calculate wall position with margins
-            wall_left = margin
-            wall_top = margin
-            wall_width = wall_width_inches * scale
-            wall_height = wall_height_inches * scale
+                # Calculate wall position with margins
+                wall_left = margin
+                wall_top = margin
+                wall_width = wall_width_inches * scale
+                wall_height = wall_height_inches * scale
             
-            # Draw wall outline
-            svg_content += f'''    <rect
+                # Draw wall outline
+                write(f'''    <rect
            id="wall_outline"
-           x="{wall_left}"
-           y="{wall_top}"
-           width="{wall_width}"
-           height="{wall_height}"
+           x="{wall_left:.2f}"
+           y="{wall_top:.2f}"
+           width="{wall_width:.2f}"
+           height="{wall_height:.2f}"
            fill="none"
            stroke="black"
            stroke-width="2" />
-    '''
+    ''')
             
-            # Add baseboard if enabled
-            if self.use_baseboard:
-                baseboard_height_inches = self.baseboard_height
-                if hasattr(self, 'baseboard_fraction_var'):
-                    baseboard_height_inches += self.fraction_to_decimal(self.baseboard_fraction_var.get())
-                
-                baseboard_height = baseboard_height_inches * scale
-                
-                svg_content += f'''    <rect
+                # Add baseboard if enabled
+                if use_baseboard:
+                    write(f'''    <rect
            id="baseboard"
-           x="{wall_left}"
-           y="{wall_top + wall_height - baseboard_height}"
-           width="{wall_width}"
-           height="{baseboard_height}"
+           x="{wall_left:.2f}"
+           y="{wall_top + wall_height - baseboard_height:.2f}"
+           width="{wall_width:.2f}"
+           height="{baseboard_height:.2f}"
            fill="#808080"
            stroke="none" />
-    '''
+    ''')
 
-            svg_content += '''  </g>
+                write('''  </g>
       <g inkscape:groupmode="layer" id="layer_panels" inkscape:label="Panels">
-    '''
+    ''')
             
-            # Get panels and draw them
-            panels = self.calculate_panels()
+                # Get panels and draw them. Dividers are merged into one path per
+                # border color and labels share one group, instead of one element each
+                panels = self.calculate_panels()
+                custom_name = self.custom_name_var.get() or "Panel"
+                divider_paths = {}
+                panel_labels = []
+            
+                # Panel positions, widths and heights for every panel at once,
+                # shared by the panel and panel dimension loops
+                panel_heights_inches = [
+                    self.convert_to_inches(panel.height.feet, panel.height.inches, panel.height_fraction)
+                    for panel in panels
+                ]
+                width_scale = wall_width / 100
+                try:
+                    import numpy as np
+                    panel_count = len(panels)
+                    xs = np.fromiter((panel.x for panel in panels), dtype=np.float64, count=panel_count)
+                    ws = np.fromiter((panel.width for panel in panels), dtype=np.float64, count=panel_count)
+                    panel_xs = (wall_left + xs * width_scale).tolist()
+                    panel_widths = (ws * width_scale).tolist()
+                    panel_heights = (np.array(panel_heights_inches, dtype=np.float64) * scale).tolist()
+                except ImportError:
+                    panel_xs = [wall_left + panel.x * width_scale for panel in panels]
+                    panel_widths = [panel.width * width_scale for panel in panels]
+                    panel_heights = [h * scale for h in panel_heights_inches]
             
-            for i, panel in enumerate(panels):
-                # Calculate panel position and dimensions
-                panel_x = wall_left + (panel.x / 100 * wall_width)
-                panel_width = (panel.width / 100 * wall_width)
-                
-                # Calculate panel height
-                panel_height_inches = self.convert_to_inches(
-                    panel.height.feet, 
-                    panel.height.inches, 
-                    panel.height_fraction
-                )
-                panel_height = panel_height_inches * scale
-                
-                # Calculate baseboard height if used
-                baseboard_height = 0
-                if self.use_baseboard:
-                    baseboard_height_inches = self.baseboard_height
-                    if hasattr(self, 'baseboard_fraction_var'):
-                        baseboard_height_inches += self.fraction_to_decimal(self.baseboard_fraction_var.get())
-                    baseboard_height = baseboard_height_inches * scale
-                
                 # Calculate panel top position
                 panel_top = wall_top
-                panel_bottom = wall_top + wall_height - baseboard_height
+                divider_bottom = wall_top + wall_height
+            
+                for i, (panel, panel_x, panel_width, panel_height) in enumerate(
+                        zip(panels, panel_xs, panel_widths, panel_heights)):
+                    # Skip degenerate (zero-size) panels - nothing visible to draw
+                    if panel_width < 0.5 or panel_height < 0.5:
+                        continue
+                    
+                    # Draw panel dividing lines if not the leftmost edge
+                    if panel.x > 0:
+                        divider_paths.setdefault(panel.border_color, []).append(
+                            f"M {panel_x:.2f} {wall_top:.2f} L {panel_x:.2f} {divider_bottom:.2f}"
+                        )
                 
-                # Draw panel dividing lines if not the leftmost edge
-                if panel.x > 0:
-                    svg_content += f'''    <path
-           id="panel_divider_{i}"
-           d="M {panel_x} {wall_top} L {panel_x} {wall_top + wall_height}"
-           stroke="{panel.border_color}"
+                    # Add panel label
+                    panel_label_x = panel_x + (panel_width / 2)
+                    panel_label_y = panel_top + (panel_height / 2)
+                    panel_labels.append(
+                        f'''      <text id="panel_label_{i}" x="{panel_label_x:.2f}" y="{panel_label_y:.2f}">{custom_name} {i+1}</text>
+    '''
+                    )
+            
+                for j, (border_color, segments) in enumerate(divider_paths.items()):
+                    write(f'''    <path
+           id="panel_dividers_{j}"
+           d="{' '.join(segments)}"
+           stroke="{border_color}"
            stroke-width="1"
            stroke-dasharray="5,5" />
-    '''
-                
-                # Add panel label
-                panel_label_x = panel_x + (panel_width / 2)
-                panel_label_y = panel_top + (panel_height / 2)
-                custom_name = self.custom_name_var.get() or "Panel"
-                
-                svg_content += f'''    <text
-           id="panel_label_{i}"
-           x="{panel_label_x}"
-           y="{panel_label_y}"
-           text-anchor="middle"
-           dominant-baseline="middle"
-           font-family="Arial"
-           font-size="12">{custom_name} {i+1}</text>
-    '''
+    ''')
             
-            svg_content += '''  </g>
-      <g inkscape:groupmode="layer" id="layer_dimensions" inkscape:label="Dimensions">
-    '''
+                write('''    <g id="panel_labels" dominant-baseline="middle">
+    ''')
+                svg_file.writelines(panel_labels)
+                write('''    </g>
+    ''')
             
-            # Add dimensions if requested
-            if self.show_dimensions_var.get():
-                # Overall wall width dimension
-                dim_y = wall_top - 40
-                svg_content += self.create_svg_dimension(
-                    wall_left, dim_y, 
-                    wall_left + wall_width, dim_y,
-                    self.wall_dimensions["width"],
-                    self.wall_dimensions.get("width_fraction", "0"),
-                    "wall_width_dim"
-                )
-                
-                # Wall height dimension
-                dim_x = wall_left - 40
-                svg_content += self.create_svg_dimension(
-                    dim_x, wall_top,
-                    dim_x, wall_top + wall_height,
-                    self.wall_dimensions["height"],
-                    self.wall_dimensions.get("height_fraction", "0"),
-                    "wall_height_dim",
-                    is_vertical=True
-                )
+                write('''  </g>
+      <g inkscape:groupmode="layer" id="layer_dimensions" inkscape:label="Dimensions">
+    ''')
+            
+                # Add dimensions if requested
+                if self.show_dimensions_var.get():
+                    # Overall wall width dimension
+                    dim_y = wall_top - 40
+                    write(self.create_svg_dimension(
+                        wall_left, dim_y, 
+                        wall_left + wall_width, dim_y,
+                        self.wall_dimensions["width"],
+                        self.wall_dimensions.get("width_fraction", "0"),
+                        "wall_width_dim"
+                    ))
                 
-                # Panel width dimensions
-                for i, panel in enumerate(panels):
-                    panel_x = wall_left + (panel.x / 100 * wall_width)
-                    panel_width = (panel.width / 100 * wall_width)
-                    
-                    dim_y = wall_top - 20
-                    svg_content += self.create_svg_dimension(
-                        panel_x, dim_y,
-                        panel_x + panel_width, dim_y,
-                        panel.actual_width,
-                        panel.actual_width_fraction,
-                        f"panel_{i+1}_width_dim"
-                    )
+                    # Wall height dimension
+                    dim_x = wall_left - 40
+                    write(self.create_svg_dimension(
+                        dim_x, wall_top,
+                        dim_x, wall_top + wall_height,
+                        self.wall_dimensions["height"],
+                        self.wall_dimensions.get("height_fraction", "0"),
+                        "wall_height_dim",
+                        is_vertical=True
+                    ))
                 
-                # Baseboard dimension if enabled
-                if self.use_baseboard:
-                    baseboard_height_inches = self.baseboard_height
-                    if hasattr(self, 'baseboard_fraction_var'):
-                        baseboard_height_inches += self.fraction_to_decimal(self.baseboard_fraction_var.get())
-                    
-                    baseboard_dim, baseboard_frac = self.convert_to_feet_inches_fraction(baseboard_height_inches)
+                    # Panel width dimensions
+                    for i, (panel, panel_x, panel_width, panel_height) in enumerate(
+                            zip(panels, panel_xs, panel_widths, panel_heights)):
+                        if panel_width < 0.5 or panel_height < 0.5:
+                            continue
+                        
+                        dim_y = wall_top - 20
+                        write(self.create_svg_dimension(
+                            panel_x, dim_y,
+                            panel_x + panel_width, dim_y,
+                            panel.actual_width,
+                            panel.actual_width_fraction,
+                            f"panel_{i+1}_width_dim"
+                        ))
+                
+                    # Baseboard dimension if enabled
+                    if use_baseboard:
+                        baseboard_dim, baseboard_frac = self.convert_to_feet_inches_fraction(baseboard_height_inches)
                     
-                    dim_x = wall_left + wall_width + 30
-                    baseboard_y = wall_top + wall_height - (baseboard_height_inches * scale)
+                        dim_x = wall_left + wall_width + 30
+                        baseboard_y = wall_top + wall_height - baseboard_height
                     
-                    svg_content += self.create_svg_dimension(
-                        dim_x, baseboard_y,
-                        dim_x, wall_top + wall_height,
-                        baseboard_dim,
-                        baseboard_frac,
-                        "baseboard_height_dim",
-                        is_vertical=True
-                    )
+                        write(self.create_svg_dimension(
+                            dim_x, baseboard_y,
+                            dim_x, wall_top + wall_height,
+                            baseboard_dim,
+                            baseboard_frac,
+                            "baseboard_height_dim",
+                            is_vertical=True
+                        ))
             
-            # Add wall objects if any
-            if hasattr(self, 'wall_objects') and self.wall_objects:
-                svg_content += '''  </g>
+                # Add wall objects if any
+                if hasattr(self, 'wall_objects') and self.wall_objects:
+                    write('''  </g>
       <g inkscape:groupmode="layer" id="layer_objects" inkscape:label="Wall Objects">
-    '''
-                
-                for i, obj in enumerate(self.wall_objects):
-                    # Calculate object dimensions in inches
-                    width_inches = self.convert_to_inches(
-                        obj.width.feet,
-                        obj.width.inches,
-                        obj.width_fraction
-                    )
+    ''')
+                
+                    for i, obj in enumerate(self.wall_objects):
+                        # Calculate object dimensions in inches
+                        width_inches = self.convert_to_inches(
+                            obj.width.feet,
+                            obj.width.inches,
+                            obj.width_fraction
+                        )
                     
-                    height_inches = self.convert_to_inches(
-                        obj.height.feet,
-                        obj.height.inches,
-                        obj.height_fraction
-                    )
+                        height_inches = self.convert_to_inches(
+                            obj.height.feet,
+                            obj.height.inches,
+                            obj.height_fraction
+                        )
                     
-                    # Calculate position and size on SVG
-                    obj_width = width_inches * scale
-                    obj_height = height_inches * scale
+                        # Calculate position and size on SVG
+                        obj_width = width_inches * scale
+                        obj_height = height_inches * scale
                     
-                    # Calculate horizontal position based on percentage
-                    obj_x = wall_left + (obj.x_position * wall_width / 100) - (obj_width / 2)
+                        # Calculate horizontal position based on percentage
+                        obj_x = wall_left + (obj.x_position * wall_width / 100) - (obj_width / 2)
                     
-                    # Calculate vertical position (Y) accounting for baseboard
-                    usable_height = wall_height
-                    if self.use_baseboard:
-                        baseboard_height_inches = self.baseboard_height
-                        if hasattr(self, 'baseboard_fraction_var'):
-                            baseboard_height_inches += self.fraction_to_decimal(self.baseboard_fraction_var.get())
-                        usable_height -= baseboard_height_inches * scale
+                        # Skip zero-size objects and placeholders left entirely off the wall
+                        if obj_width < 0.5 or obj_height < 0.5:
+                            continue
+                        if obj_x + obj_width < wall_left or obj_x > wall_left + wall_width:
+                            continue
                     
-                    # Calculate position from top
-                    obj_y = wall_top + ((obj.y_position / 100) * usable_height) - (obj_height / 2)
+                        # Calculate vertical position (Y) accounting for baseboard
+                        usable_height = wall_height - baseboard_height
                     
-                    # Draw object rectangle
-                    border_attr = f'stroke="{obj.border_color}" stroke-width="{obj.border_width}"' if obj.show_border else 'stroke="none"'
+                        # Calculate position from top
+                        obj_y = wall_top + ((obj.y_position / 100) * usable_height) - (obj_height / 2)
+                    
+                        # Draw object rectangle
+                        border_attr = f'stroke="{obj.border_color}" stroke-width="{obj.border_width}"' if obj.show_border else 'stroke="none"'
                     
-                    svg_content += f'''    <rect
+                        write(f'''    <rect
            id="object_{i}"
-           x="{obj_x}"
-           y="{obj_y}"
-           width="{obj_width}"
-           height="{obj_height}"
+           x="{obj_x:.2f}"
+           y="{obj_y:.2f}"
+           width="{obj_width:.2f}"
+           height="{obj_height:.2f}"
            fill="{obj.color}"
            {border_attr} />
            
         <text
            id="object_label_{i}"
-           x="{obj_x + obj_width/2}"
-           y="{obj_y + obj_height/2}"
-           text-anchor="middle"
-           dominant-baseline="middle"
-           font-family="Arial"
-           font-size="12">{obj.name}</text>
-    '''
+           x="{obj_x + obj_width/2:.2f}"
+           y="{obj_y + obj_height/2:.2f}"
+           dominant-baseline="middle">{obj.name}</text>
+    ''')
                     
-                    # Add dimensions if requested
-                    if self.show_dimensions_var.get():
-                        svg_content += self.create_svg_dimension(
-                            obj_x, obj_y - 15,
-                            obj_x + obj_width, obj_y - 15,
-                            obj.width,
-                            obj.width_fraction,
-                            f"object_{i}_width_dim"
-                        )
+                        # Add dimensions if requested
+                        if self.show_dimensions_var.get():
+                            write(self.create_svg_dimension(
+                                obj_x, obj_y - 15,
+                                obj_x + obj_width, obj_y - 15,
+                                obj.width,
+                                obj.width_fraction,
+                                f"object_{i}_width_dim"
+                            ))
                         
-                        svg_content += self.create_svg_dimension(
-                            obj_x - 15, obj_y,
-                            obj_x - 15, obj_y + obj_height,
-                            obj.height,
-                            obj.height_fraction,
-                            f"object_{i}_height_dim",
-                            is_vertical=True
-                        )
-            
-            # Close SVG tag
-            svg_content += '''  </g>
-    </svg>'''
-            
-            # Write SVG content to file
-            with open(save_path, 'w') as f:
-                f.write(svg_content)
-            
-            messagebox.showinfo("Success", "SVG saved successfully for Inkscape editing!")
+                            write(self.create_svg_dimension(
+                                obj_x - 15, obj_y,
+                                obj_x - 15, obj_y + obj_height,
+                                obj.height,
+                                obj.height_fraction,
+                                f"object_{i}_height_dim",
+                                is_vertical=True
+                            ))
+            
+                # Close SVG tag
+                write('''  </g>
+    </svg>''')
+            
+            if path is None:
+                messagebox.showinfo("Success", "SVG saved successfully for Inkscape editing!")
         except Exception as e:
+            if path is not None:
+                raise
             messagebox.showerror("Error", f"An error occurred while saving the SVG: {str(e)}")
             import traceback
             traceback.print_exc()  # Print stack trace for debugging
@@ -5264,31 +5967,18 @@ with precise measurements and customizable configurations.
         
         # Different attributes for horizontal vs vertical dimensions
         if is_vertical:
-            text_transform = f'transform="rotate(-90,{mid_x-offset},{mid_y})"'
+            text_transform = f'transform="rotate(-90,{mid_x-offset:.2f},{mid_y:.2f})"'
         else:
             text_transform = ""
         
-        # Create arrow markers 
-        # (Note: We define these once in the SVG, but including here for completeness)
+        # Stroke and arrow markers come from the line.dim style in the SVG's <defs>
         svg_content = f'''    <g id="{id_prefix}_group">
-          <line
-             id="{id_prefix}_line"
-             x1="{x1}"
-             y1="{y1}"
-             x2="{x2}"
-             y2="{y2}"
-             stroke="black"
-             stroke-width="1"
-             marker-start="url(#arrow_start)"
-             marker-end="url(#arrow_end)" />
+          <line id="{id_prefix}_line" class="dim" x1="{x1:.2f}" y1="{y1:.2f}" x2="{x2:.2f}" y2="{y2:.2f}" />
              
           <text
              id="{id_prefix}_text"
-             x="{mid_x}"
-             y="{is_vertical and mid_y or y1 - offset}"
-             text-anchor="middle"
-             font-family="Arial"
-             font-size="12"
+             x="{mid_x:.2f}"
+             y="{(mid_y if is_vertical else y1 - offset):.2f}"
              {text_transform}>{dim_text}</text>
         </g>
     '''
@@ -5310,21 +6000,13 @@ with precise measurements and customizable configurations.
 
         try:
             # First export to SVG as an intermediate format
-            svg_path = save_path.replace(".pdf", ".svg")
-            
-            # Use enhanced SVG export function
-            # Save to the temporary SVG path
-            old_save_path = filedialog.asksaveasfilename
-            filedialog.asksaveasfilename = lambda **kwargs: svg_path
-            self.export_svg_enhanced()
-            filedialog.asksaveasfilename = old_save_path
+            # (the shared scratch SVG, reused if the scene hasn't changed)
+            svg_path = self._get_scratch_svg()
             
             # Convert SVG to PDF using cairosvg
             pdf_exporter = PDFExporter(self.canvas, self.summary_text)
-            pdf_exporter.svg_to_pdf(svg_path, save_path, dpi=300)
-            
-            # Remove temporary SVG file
-            os.remove(svg_path)
+            pdf_exporter.svg_to_pdf(svg_path, save_path, dpi=300,
+                                    svg_data=self._get_scratch_svg_bytes())
             
             messagebox.showinfo("Success", "PDF exported successfully!")
         except Exception as e:
@@ -5357,8 +6039,6 @@ with precise measurements and customizable configurations.
         # Fraction dropdown
         ctk.CTkLabel(frame, text="+").pack(side=tk.LEFT, padx=2)
         
-        fraction_options = ["0", "1/16", "1/8", "3/16", "1/4", "5/16", "3/8", "7/16", 
-                            "1/2", "9/16", "5/8", "11/16", "3/4", "13/16", "7/8", "15/16"]
         
         fraction_var = tk.StringVar(value="0")
         setattr(self, f"{prefix}_fraction_var", fraction_var)
@@ -5366,7 +6046,7 @@ with precise measurements and customizable configurations.
         fraction_dropdown = ctk.CTkOptionMenu(
             frame,
             variable=fraction_var,
-            values=fraction_options,
+            values=list(_FRACTION_OPTIONS),
             width=70
         )
         fraction_dropdown.pack(side=tk.LEFT, padx=5)
@@ -5374,58 +6054,23 @@ with precise measurements and customizable configurations.
 
     def fraction_to_decimal(self, fraction_str):
         """Convert a fraction string to its decimal value"""
-        if fraction_str == "0":
-            return 0.0
-            
-        try:
-            if "/" in fraction_str:
-                num, denom = fraction_str.split("/")
-                return float(num) / float(denom)
-            return float(fraction_str)
-        except (ValueError, ZeroDivisionError):
-            return 0.0
+        return _fraction_to_decimal(fraction_str)
 
     def convert_to_inches(self, feet: int, inches: int, fraction_str: str) -> float:
         """Convert feet, inches, and fraction to total inches"""
-        fraction_decimal = self.fraction_to_decimal(fraction_str)
-        return feet * 12 + inches + fraction_decimal
+        return _convert_to_inches(feet, inches, fraction_str)
 
     def convert_to_feet_inches_fraction(self, total_inches: float) -> tuple:
         """Convert total inches to feet, inches, and closest fraction with high precision"""
-        # Add a small epsilon to handle floating point errors
-        epsilon = 0.001
-        total_inches += epsilon
-        
-        feet = int(total_inches // 12)
-        remaining_inches = total_inches % 12
-        
-        whole_inches = int(remaining_inches)
-        fraction_decimal = remaining_inches - whole_inches
-        
-        # Find closest fraction with higher precision
-        fractions = {
-            0: "0", 0.0625: "1/16", 0.125: "1/8", 0.1875: "3/16", 
-            0.25: "1/4", 0.3125: "5/16", 0.375: "3/8", 0.4375: "7/16",
-            0.5: "1/2", 0.5625: "9/16", 0.625: "5/8", 0.6875: "11/16", 
-            0.75: "3/4", 0.8125: "13/16", 0.875: "7/8", 0.9375: "15/16"
-        }
-        
-        # Find the closest fraction with enhanced precision
-        closest_decimal = min(fractions.keys(), key=lambda x: abs(x - fraction_decimal))
-        closest_fraction = fractions[closest_decimal]
-        
-        # Handle rounding more carefully
-        if abs(fraction_decimal - closest_decimal) < 0.01 and closest_decimal > 0.94:
-            whole_inches += 1
-            closest_fraction = "0"
-            
-        # Handle case where inches becomes 12
-        if whole_inches == 12:
-            feet += 1
-            whole_inches = 0
-        
+        # The cache holds plain tuples; Dimension is mutable, so build a fresh one
+        feet, whole_inches, closest_fraction = _convert_to_feet_inches_fraction(total_inches)
         return Dimension(feet, whole_inches), closest_fraction
 
+    def convert_widths_to_feet_inches_fraction(self, widths) -> list:
+        """Convert a list of widths in one pass, converting each distinct width only once"""
+        converted = {width: _convert_to_feet_inches_fraction(width) for width in set(widths)}
+        return [(Dimension(*converted[width][:2]), converted[width][2]) for width in widths]
+
     def create_canvas(self):
         self.canvas_frame = ctk.CTkFrame(self)
         self.canvas_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -5444,7 +6089,7 @@ with precise measurements and customizable configurations.
                 self.center_panel_inputs.pack_forget()
         else:
             self.panel_count_frame.pack_forget()
-        self.calculate()
+        self._schedule_calc()
 
     def on_center_panels_change(self):
         """Handle center panels checkbox change"""
@@ -5458,14 +6103,29 @@ with precise measurements and customizable configurations.
             #    self.custom_panel_widths = {}
         else:
             self.center_panel_inputs.pack_forget()
-        self.calculate()
+        self._schedule_calc()
+
+    def _schedule_calc(self, delay=100):
+        """Recalculate after delay ms, coalescing with any recalculation already pending"""
+        if getattr(self, '_calc_timer', None):
+            self.after_cancel(self._calc_timer)
+        self._calc_timer = self.after(delay, self._run_scheduled_calc)
+
+    def _run_scheduled_calc(self):
+        self._calc_timer = None
+        # Already debounced, so redraw now rather than going through calculate()'s
+        # own throttle timer; if that timer is pending it will do the redraw
+        if not self._redraw_pending:
+            self._flush_calculate()
 
     def on_baseboard_change(self):
         """Optimized baseboard change handler"""
-        print(f"Baseboard state changed to: {self.baseboard_var.get()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Baseboard state changed to: %s", self.baseboard_var.get())
         
         # Update instance variable
         self.use_baseboard = self.baseboard_var.get()
+        self._dim_cache_dirty = True
         
         # Show/hide baseboard frame based on checkbox state
         if self.baseboard_var.get():
@@ -5478,17 +6138,14 @@ with precise measurements and customizable configurations.
         # CRITICAL: Save the current wall data immediately
         current_wall = self.get_current_wall()
         if current_wall:
-            print(f"  Immediately saving baseboard state to wall: {current_wall.name}")
+            logger.debug("  Immediately saving baseboard state to wall: %s", current_wall.name)
             current_wall.baseboard_enabled = self.baseboard_var.get()
             
             # Also save all wall data to ensure consistency
             self.save_current_wall_data()
         
         # Use a delayed calculation to prevent multiple rapid calculations
-        if hasattr(self, '_baseboard_timer'):
-            self.after_cancel(self._baseboard_timer)
-        
-        self._baseboard_timer = self.after(100, self.calculate)  # 100ms delay
+        self._schedule_calc()  # 100ms delay
 
         
     def choose_color(self):
@@ -5497,50 +6154,22 @@ with precise measurements and customizable configurations.
         if color[1]:  # color is ((R, G, B), hex_color)
             self.panel_color = color[1]
             self.color_preview.configure(bg=self.panel_color)
-            self.calculate()
+            self._panels_dirty = True
+            self._schedule_calc()
 
     def reset_form(self):
         """Reset all form inputs to default values"""
-        # Reset wall dimensions
-        self.wall_width_feet_var.set("0")
-        self.wall_width_inches_var.set("0")
-        self.wall_height_feet_var.set("0")
-        self.wall_height_inches_var.set("0")
-        
-        # Reset fractions
-        self.wall_width_fraction_var.set("0")
-        self.wall_height_fraction_var.set("0")
-        self.panel_width_fraction_var.set("0")
-        self.panel_height_fraction_var.set("0")
-        if hasattr(self, 'baseboard_fraction_var'):
-            self.baseboard_fraction_var.set("0")
-            
-        # Reset panel dimensions
-        self.panel_width_feet_var.set("0")
-        self.panel_width_inches_var.set("0")
-        self.panel_height_feet_var.set("0")
-        self.panel_height_inches_var.set("0")
-        self.show_dimensions_var.set(True)  # Reset to showing dimensions
-        
-        # Reset options
-        self.equal_panels_var.set(False)
-        self.panel_count_var.set("2")
-        self.center_panels_var.set(False)
-        self.center_panel_count_var.set("4")
+        # Reset every form variable to its default, skipping ones already there -
+        # each set() is a Tcl round-trip that fires the variable's traces
+        for var_name, default in _FORM_DEFAULTS.items():
+            var = getattr(self, var_name, None)
+            if var is not None and var.get() != default:
+                var.set(default)
         
-        # Reset baseboard options
-        self.baseboard_var.set(False)
-        self.baseboard_height_var.set("4")
         if hasattr(self, 'baseboard_frame'):
             self.baseboard_frame.pack_forget()
-        
-        # Reset floor mounting options
-        self.floor_mounted_var.set(True)  # Default to floor mounted
         if hasattr(self, 'height_offset_frame'):
             self.height_offset_frame.pack_forget()
-        self.height_offset_feet_var.set("0")
-        self.height_offset_inches_var.set("0")
-        self.height_offset_fraction_var.set("0")
         
         # Reset colors
         self.panel_color = "#FFFFFF"
@@ -5549,12 +6178,11 @@ with precise measurements and customizable configurations.
         self.border_color_preview.configure(bg=self.panel_border_color)
         
         # Reset panel adjustments
-        if hasattr(self, 'custom_panel_widths'):
-            self.custom_panel_widths = {}
+        self.custom_panel_widths = {}
         
         # Reset split panels
-        if hasattr(self, 'split_panels'):
-            self.split_panels = {}
+        self.split_panels = {}
+        self._panels_dirty = True
             
         # Clear canvas
         self.canvas.delete("all")
@@ -5562,193 +6190,47 @@ with precise measurements and customizable configurations.
         # Clear summary
         self.summary_text.delete("1.0", tk.END)
 
+    def _update_dimensions(self, dims, width_feet, width_inches, width_fraction,
+                           height_feet, height_inches, height_fraction):
+        """Write width/height values into an existing dimensions dict in place"""
+        self._dim_cache_dirty = True
+        width, height = dims["width"], dims["height"]
+        width.feet, width.inches = width_feet, width_inches
+        height.feet, height.inches = height_feet, height_inches
+        dims["width_fraction"] = width_fraction
+        dims["height_fraction"] = height_fraction
+
     def safe_int_conversion(self, value, default=0):
         """Safely convert string to int, returning default if conversion fails"""
         try:
-            return int(value) if value.strip() else default
-        except (ValueError, AttributeError):
-            return default
-
-
-    def convert_to_feet_and_inches(self, total_inches: float) -> Dimension:
-        feet = int(total_inches // 12)
-        inches = round(total_inches % 12)
-        if inches == 12:
-            feet += 1
-            inches = 0
-        return Dimension(feet, inches)
-
-    def format_dimension(self, dimension: Dimension, fraction: str = "0") -> str:
-        """Format dimensions with dash between feet and inches - UPDATED"""
-        if dimension.inches == 0 and fraction == "0":
-            return f"{dimension.feet}'"
-        elif fraction == "0":
-            return f"{dimension.feet}'-{dimension.inches}\""
-        else:
-            return f"{dimension.feet}'-{dimension.inches} {fraction}\""
-    def add_panel_adjustment_system(self):
-        """Add UI for adjusting individual panel widths"""
-        try:
-            panel_adjustment_frame = ctk.CTkFrame(self.input_frame)
-            panel_adjustment_frame.pack(pady=10, padx=10, fill=tk.X)
-            
-            ctk.CTkLabel(panel_adjustment_frame, text="Adjust Individual Panel").pack(pady=5)
-            
-            # Panel selection
-            selection_frame = ctk.CTkFrame(panel_adjustment_frame)
-            selection_frame.pack(pady=5, fill=tk.X)
-            
-            ctk.CTkLabel(selection_frame, text="Panel ID:").pack(side=tk.LEFT, padx=5)
-            self.panel_id_var = tk.StringVar(value="1")
-            panel_id_entry = ctk.CTkEntry(selection_frame, textvariable=self.panel_id_var, width=50)
-            panel_id_entry.pack(side=tk.LEFT, padx=5)
-            
-            # Width adjustment
-            width_frame = ctk.CTkFrame(panel_adjustment_frame)
-            width_frame.pack(pady=5, fill=tk.X)
-            
-            ctk.CTkLabel(width_frame, text="Width:").pack(side=tk.LEFT, padx=5)
-            
-            self.panel_width_feet_adjust_var = tk.StringVar(value="0")
-            feet_entry = ctk.CTkEntry(width_frame, textvariable=self.panel_width_feet_adjust_var, width=40)
-            feet_entry.pack(side=tk.LEFT, padx=2)
-            ctk.CTkLabel(width_frame, text="feet").pack(side=tk.LEFT)
-            
-            self.panel_width_inches_adjust_var = tk.StringVar(value="0")
-            inches_entry = ctk.CTkEntry(width_frame, textvariable=self.panel_width_inches_adjust_var, width=40)
-            inches_entry.pack(side=tk.LEFT, padx=2)
-            ctk.CTkLabel(width_frame, text="inches").pack(side=tk.LEFT)
-            
-            # Initialize fraction_options if it doesn't exist
-            if not hasattr(self, 'fraction_options'):
-                self.fraction_options = ["0", "1/16", "1/8", "3/16", "1/4", "5/16", "3/8", "7/16", 
-                                      "1/2", "9/16", "5/8", "11/16", "3/4", "13/16", "7/8", "15/16"]
-            
-            ctk.CTkLabel(width_frame, text="+").pack(side=tk.LEFT, padx=2)
-            self.panel_width_fraction_adjust_var = tk.StringVar(value="0")
-            fraction_dropdown = ctk.CTkOptionMenu(
-                width_frame, 
-                variable=self.panel_width_fraction_adjust_var,
-                values=self.fraction_options,
-                width=70
-            )
-            fraction_dropdown.pack(side=tk.LEFT, padx=2)
-            
-            # Button to apply adjustment
-            button_frame = ctk.CTkFrame(panel_adjustment_frame)
-            button_frame.pack(pady=5)
-            
-            apply_button = ctk.CTkButton(
-                button_frame,
-                text="Apply Width Adjustment",
-                command=self.apply_panel_width_adjustment
-            )
-            apply_button.pack(side=tk.LEFT, padx=5)
-            
-            reset_button = ctk.CTkButton(
-                button_frame,
-                text="Reset All Adjustments",
-                command=self.reset_panel_adjustments
-            )
-            reset_button.pack(side=tk.LEFT, padx=5)
-            
-            # Initialize dictionary to store custom widths if it doesn't exist
-            if not hasattr(self, 'custom_panel_widths'):
-                self.custom_panel_widths = {}
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to create panel adjustment UI: {str(e)}")
-    def add_panel_adjustment_ui(self):
-        """Add UI controls for adjusting individual panel widths"""
-        adjustment_frame = ctk.CTkFrame(self.input_frame)
-        adjustment_frame.pack(pady=10, padx=10, fill=tk.X)
-        
-        ctk.CTkLabel(adjustment_frame, text="Panel Width Adjustments").pack()
-        
-        # Panel ID selection
-        id_frame = ctk.CTkFrame(adjustment_frame)
-        id_frame.pack(pady=5, fill=tk.X)
-        
-        ctk.CTkLabel(id_frame, text="Panel ID:").pack(side=tk.LEFT, padx=5)
-        self.adjust_panel_id_var = tk.StringVar(value="1")
-        id_entry = ctk.CTkEntry(id_frame, textvariable=self.adjust_panel_id_var, width=50)
-        id_entry.pack(side=tk.LEFT, padx=5)
-        
-        # Width input
-        width_frame = ctk.CTkFrame(adjustment_frame)
-        width_frame.pack(pady=5, fill=tk.X)
-        
-        ctk.CTkLabel(width_frame, text="Width:").pack(side=tk.LEFT, padx=5)
-        
-        # Feet
-        self.adjust_width_feet_var = tk.StringVar(value="0")
-        feet_entry = ctk.CTkEntry(width_frame, textvariable=self.adjust_width_feet_var, width=50)
-        feet_entry.pack(side=tk.LEFT, padx=5)
-        ctk.CTkLabel(width_frame, text="feet").pack(side=tk.LEFT)
-        
-        # Inches
-        self.adjust_width_inches_var = tk.StringVar(value="0")
-        inches_entry = ctk.CTkEntry(width_frame, textvariable=self.adjust_width_inches_var, width=50)
-        inches_entry.pack(side=tk.LEFT, padx=5)
-        ctk.CTkLabel(width_frame, text="inches").pack(side=tk.LEFT)
-        
-        # Fraction
-        ctk.CTkLabel(width_frame, text="+").pack(side=tk.LEFT, padx=2)
-        self.adjust_width_fraction_var = tk.StringVar(value="0")
-        fraction_options = ["0", "1/16", "1/8", "3/16", "1/4", "5/16", "3/8", "7/16", 
-                            "1/2", "9/16", "5/8", "11/16", "3/4", "13/16", "7/8", "15/16"]
-        fraction_dropdown = ctk.CTkOptionMenu(
-            width_frame,
-            variable=self.adjust_width_fraction_var,
-            values=fraction_options,
-            width=70
-        )
-        fraction_dropdown.pack(side=tk.LEFT, padx=5)
-        
-        # Buttons
-        button_frame = ctk.CTkFrame(adjustment_frame)
-        button_frame.pack(pady=5)
-        
-        apply_btn = ctk.CTkButton(
-            button_frame, 
-            text="Apply Width Adjustment",
-            command=self.apply_panel_width_adjustment
-        )
-        apply_btn.pack(side=tk.LEFT, padx=5)
-        
-        reset_btn = ctk.CTkButton(
-            button_frame,
-            text="Reset All Adjustments",
-            command=self.reset_panel_adjustments
-        )
-        reset_btn.pack(side=tk.LEFT, padx=5)
+            return int(value) if value.strip() else default
+        except (ValueError, AttributeError):
+            return default
 
-        # Initialize custom panel widths dictionary if needed
-        if not hasattr(self, 'custom_panel_widths'):
-            self.custom_panel_widths = {}
+    def _dim(self, feet_var, inches_var) -> Dimension:
+        """Read a feet/inches variable pair straight into a Dimension"""
+        return Dimension(self.safe_int_conversion(feet_var.get(), 0),
+                         self.safe_int_conversion(inches_var.get(), 0))
 
-        
+
+    def convert_to_feet_and_inches(self, total_inches: float) -> Dimension:
+        return Dimension(*_convert_to_feet_and_inches(total_inches))
+
+    def format_dimension(self, dimension: Dimension, fraction: str = "0") -> str:
+        """Format dimensions with dash between feet and inches - UPDATED"""
+        inches = dimension.inches
+        return _DIMENSION_FORMATS[(inches == 0) << 1 | (fraction == "0")].format(
+            f=dimension.feet, i=inches, fr=fraction)
     def apply_panel_width_adjustment(self):
         """Apply custom width to a specific panel"""
         try:
-            # Determine which panel ID variable to use based on what exists
-            if hasattr(self, 'panel_id_var'):
-                panel_id = int(self.panel_id_var.get())
-                feet_var = self.panel_width_feet_adjust_var
-                inches_var = self.panel_width_inches_adjust_var
-                fraction_var = self.panel_width_fraction_adjust_var
-            elif hasattr(self, 'adjust_panel_id_var'):
-                panel_id = int(self.adjust_panel_id_var.get())
-                feet_var = self.adjust_width_feet_var
-                inches_var = self.adjust_width_inches_var
-                fraction_var = self.adjust_width_fraction_var
-            else:
-                messagebox.showerror("Error", "Panel ID variable not found")
-                return
+            # Inputs come from the Advanced tab's panel width adjustment section
+            panel_id = int(self.adjust_panel_id_var.get())
             
             # Get width dimensions
-            feet = self.safe_int_conversion(feet_var.get(), 0)
-            inches = self.safe_int_conversion(inches_var.get(), 0)
-            fraction = fraction_var.get()
+            feet = self.safe_int_conversion(self.adjust_width_feet_var.get(), 0)
+            inches = self.safe_int_conversion(self.adjust_width_inches_var.get(), 0)
+            fraction = self.adjust_width_fraction_var.get()
             
             # Convert to total inches
             total_inches = self.convert_to_inches(feet, inches, fraction)
@@ -5762,14 +6244,12 @@ with precise measurements and customizable configurations.
                 messagebox.showerror("Error", "Invalid panel ID. Please use 1-10.")
                 return
             
-            # Initialize custom panel widths dictionary if needed
-            if not hasattr(self, 'custom_panel_widths'):
-                self.custom_panel_widths = {}
-            
             # Store custom width
             self.custom_panel_widths[panel_id] = total_inches
-            print(f"Applied width adjustment for panel {panel_id}: {total_inches} inches")
-            print(f"Custom panel widths: {self.custom_panel_widths}")
+            self._scene_version += 1
+            self._panels_dirty = True
+            logger.debug("Applied width adjustment for panel %s: %s inches", panel_id, total_inches)
+            logger.debug("Custom panel widths: %s", self.custom_panel_widths)
             
             # Important: Turn off center panels and equal panels to avoid conflicts
             if self.center_panels_var.get():
@@ -5778,8 +6258,9 @@ with precise measurements and customizable configurations.
             if self.use_equal_panels:
                 self.equal_panels_var.set(False)
             
-            # Recalculate and redraw
-            self.calculate()
+            # Recalculate and redraw - debounced on the single recalculation timer,
+            # so adjusting several panels in a row costs one redraw
+            self._schedule_calc(self._min_redraw_interval_ms)
             
             # Format dimension for display
             dim, frac = self.convert_to_feet_inches_fraction(total_inches)
@@ -5792,18 +6273,14 @@ with precise measurements and customizable configurations.
     def reset_panel_adjustments(self):
         """Clear all panel width adjustments and split information"""
         try:
-            # Initialize dictionaries if they don't exist
-            if not hasattr(self, 'custom_panel_widths'):
-                self.custom_panel_widths = {}
-            if not hasattr(self, 'split_panels'):
-                self.split_panels = {}
-            
             # Clear dictionaries
             self.custom_panel_widths.clear()
             self.split_panels.clear()
+            self._scene_version += 1
+            self._panels_dirty = True
             
-            # Recalculate and redraw
-            self.calculate()
+            # Recalculate and redraw on the single debounced recalculation timer
+            self._schedule_calc(self._min_redraw_interval_ms)
             
             messagebox.showinfo("Success", "All panel width adjustments have been reset")
         except Exception as e:
@@ -5812,11 +6289,47 @@ with precise measurements and customizable configurations.
             import traceback
             traceback.print_exc()
         
+    def _mark_panels_dirty(self, *args):
+        """Invalidate the cached panel layout (also usable as a Tk variable trace)"""
+        self._panels_dirty = True
+        self._dim_cache_dirty = True
+
+    def _ensure_dim_cache(self):
+        """Refresh the cached wall, panel and baseboard sizes in inches if they changed"""
+        if not self._dim_cache_dirty:
+            return
+        wall_width = self.wall_dimensions["width"]
+        wall_height = self.wall_dimensions["height"]
+        panel_height = self.panel_dimensions["height"]
+        self._wall_w_in = self.convert_to_inches(
+            wall_width.feet, wall_width.inches, self.wall_dimensions.get("width_fraction", "0"))
+        self._wall_h_in = self.convert_to_inches(
+            wall_height.feet, wall_height.inches, self.wall_dimensions.get("height_fraction", "0"))
+        self._panel_h_in = self.convert_to_inches(
+            panel_height.feet, panel_height.inches, self.panel_dimensions.get("height_fraction", "0"))
+        
+        # Baseboard height only counts when the baseboard is shown
+        self._baseboard_in = 0
+        if self.use_baseboard:
+            self._baseboard_in = self.baseboard_height
+            if self._has_baseboard_frac:
+                self._baseboard_in += self.fraction_to_decimal(self.baseboard_fraction_var.get())
+        self._dim_cache_dirty = False
+
     def calculate_panels(self) -> List[Panel]:
+        """Return the current panel layout, recomputing it only after its inputs changed"""
+        if self._panels_dirty:
+            self._panels_cache = self._calculate_panels_impl()
+            self._panels_generation += 1
+            self._panels_dirty = False
+        # Callers get their own list; the Panel objects themselves are never mutated
+        return list(self._panels_cache)
+
+    def _calculate_panels_impl(self) -> List[Panel]:
             # Add debugging
         current_wall = self.get_current_wall()
         if current_wall:
-            print(f"Calculating panels for: {current_wall.name} with height {current_wall.dimensions['height'].feet}'{current_wall.dimensions['height'].inches}\"")
+            logger.debug("Calculating panels for: %s with height %s'%s\"", current_wall.name, current_wall.dimensions['height'].feet, current_wall.dimensions['height'].inches)
         
         # Update dimensions from UI with safe conversion
         wall_width_feet = self.safe_int_conversion(self.wall_width_feet_var.get(), 0)
@@ -5835,25 +6348,17 @@ with precise measurements and customizable configurations.
         panel_height_inches = self.safe_int_conversion(self.panel_height_inches_var.get(), 0)
         panel_height_fraction = self.panel_height_fraction_var.get()
         
-        self.wall_dimensions = {
-            "width": Dimension(wall_width_feet, wall_width_inches),
-            "width_fraction": wall_width_fraction,
-            "height": Dimension(wall_height_feet, wall_height_inches),
-            "height_fraction": wall_height_fraction
-        }
-        
-        self.panel_dimensions = {
-            "width": Dimension(panel_width_feet, panel_width_inches),
-            "width_fraction": panel_width_fraction,
-            "height": Dimension(panel_height_feet, panel_height_inches),
-            "height_fraction": panel_height_fraction
-        }
+        # Update the shared dimension dicts in place rather than rebuilding them
+        self._update_dimensions(self.wall_dimensions, wall_width_feet, wall_width_inches, wall_width_fraction,
+                                wall_height_feet, wall_height_inches, wall_height_fraction)
+        self._update_dimensions(self.panel_dimensions, panel_width_feet, panel_width_inches, panel_width_fraction,
+                                panel_height_feet, panel_height_inches, panel_height_fraction)
         
         self.use_equal_panels = self.equal_panels_var.get()
         self.panel_count = max(1, self.safe_int_conversion(self.panel_count_var.get(), 2))
         self.use_baseboard = self.baseboard_var.get()
         self.baseboard_height = self.safe_int_conversion(self.baseboard_height_var.get(), 4)
-        self.baseboard_fraction = self.baseboard_fraction_var.get() if hasattr(self, 'baseboard_fraction_var') else "0"
+        self.baseboard_fraction = self.baseboard_fraction_var.get() if self._has_baseboard_frac else "0"
         floor_mounted = self.floor_mounted_var.get()
         height_offset_feet = self.safe_int_conversion(self.height_offset_feet_var.get(), 0)
         height_offset_inches = self.safe_int_conversion(self.height_offset_inches_var.get(), 0)
@@ -5876,9 +6381,12 @@ with precise measurements and customizable configurations.
         if wall_width_inches_total <= 0 or wall_height_inches_total <= 0:
             return []
 
+        # Percent of wall width per inch, so positions and widths below are one multiply
+        pct_per_inch = 100.0 / wall_width_inches_total
+
         # Calculate baseboard height with fraction
         baseboard_inches_total = self.baseboard_height
-        if hasattr(self, 'baseboard_fraction_var'):
+        if self._has_baseboard_frac:
             baseboard_inches_total += self.fraction_to_decimal(self.baseboard_fraction_var.get())
 
         # Calculate usable height
@@ -5901,7 +6409,7 @@ with precise measurements and customizable configurations.
         
         # Check if we have custom widths that should override everything else
         use_custom_panels = False
-        if hasattr(self, 'custom_panel_widths') and self.custom_panel_widths:
+        if self.custom_panel_widths:
             # Only use custom panels if we have a reasonable number of widths defined
             custom_panel_ids = sorted(self.custom_panel_widths.keys())
             if len(custom_panel_ids) > 0 and max(custom_panel_ids) <= 10:  # Reasonable limit
@@ -5912,42 +6420,42 @@ with precise measurements and customizable configurations.
         
         if use_custom_panels:
             # Use purely custom panels based on stored widths
-            print("Using custom panel widths")
-            # Sort panel IDs to ensure consistent ordering
-            panel_ids = sorted(self.custom_panel_widths.keys())
+            logger.debug("Using custom panel widths")
+            # Panel IDs were sorted (and the widths summed) by the check above
+            panel_ids = custom_panel_ids
             
             # Scale widths if they exceed wall width
-            total_width = sum(self.custom_panel_widths.values())
             scale_factor = 1.0
             if total_width > wall_width_inches_total:
                 scale_factor = wall_width_inches_total / total_width
-                print(f"Scaling panel widths by factor {scale_factor}")
+                logger.debug("Scaling panel widths by factor %s", scale_factor)
             
             # Create panels with custom widths
-            current_x_percent = 0
-            for panel_id in panel_ids:
-                # Get scaled width
-                panel_width = self.custom_panel_widths[panel_id] * scale_factor
-                panel_width_percent = (panel_width / wall_width_inches_total * 100)
-                panel_dim, panel_frac = self.convert_to_feet_inches_fraction(panel_width)
-                
-                # Create panel
-                panel = Panel(
+            panel_widths = [self.custom_panel_widths[panel_id] * scale_factor for panel_id in panel_ids]
+            panel_width_percents = [panel_width * pct_per_inch for panel_width in panel_widths]
+            panel_sizes = self.convert_widths_to_feet_inches_fraction(panel_widths)
+            panel_height_offset = height_offset_dim if not floor_mounted else None
+            panel_height_offset_fraction = height_offset_fraction if not floor_mounted else "0"
+
+            # Each panel starts where the previous one ended (as a percentage)
+            panels = [
+                Panel(
                     id=panel_id,
-                    x=current_x_percent,  # Position as percentage
-                    width=panel_width_percent,  # Width as percentage
-                    actual_width=panel_dim, 
+                    x=x_percent,
+                    width=panel_width_percent,
+                    actual_width=panel_dim,
                     actual_width_fraction=panel_frac,
                     height=panel_height_dim,
                     height_fraction=panel_height_frac,
                     color=self.panel_color,
                     border_color=self.panel_border_color,
                     floor_mounted=floor_mounted,
-                    height_offset=height_offset_dim if not floor_mounted else None,
-                    height_offset_fraction=height_offset_fraction if not floor_mounted else "0"
+                    height_offset=panel_height_offset,
+                    height_offset_fraction=panel_height_offset_fraction
                 )
-                panels.append(panel)
-                current_x_percent += panel_width_percent  # Update x position for next panel
+                for panel_id, x_percent, panel_width_percent, (panel_dim, panel_frac) in zip(
+                    panel_ids, accumulate(panel_width_percents, initial=0), panel_width_percents, panel_sizes)
+            ]
                 
         # If we're not using custom panels, apply standard panel layouts
         else:
@@ -5970,7 +6478,7 @@ with precise measurements and customizable configurations.
                     panels.append(Panel(
                         id=1,
                         x=0,
-                        width=(side_panel_width / wall_width_inches_total * 100),
+                        width=(side_panel_width * pct_per_inch),
                         actual_width=side_panel_dim,
                         actual_width_fraction=side_panel_frac,
                         height=panel_height_dim,
@@ -5987,8 +6495,8 @@ with precise measurements and customizable configurations.
                     center_panel_dim, center_panel_frac = self.convert_to_feet_inches_fraction(center_panel_width)
                     panels.append(Panel(
                         id=len(panels) + 1,
-                        x=(side_panel_width + i * center_panel_width) / wall_width_inches_total * 100,
-                        width=(center_panel_width / wall_width_inches_total * 100),
+                        x=(side_panel_width + i * center_panel_width) * pct_per_inch,
+                        width=(center_panel_width * pct_per_inch),
                         actual_width=center_panel_dim,
                         actual_width_fraction=center_panel_frac,
                         height=panel_height_dim,
@@ -6005,8 +6513,8 @@ with precise measurements and customizable configurations.
                     side_panel_dim, side_panel_frac = self.convert_to_feet_inches_fraction(side_panel_width)
                     panels.append(Panel(
                         id=len(panels) + 1,
-                        x=((wall_width_inches_total - side_panel_width) / wall_width_inches_total * 100),
-                        width=(side_panel_width / wall_width_inches_total * 100),
+                        x=((wall_width_inches_total - side_panel_width) * pct_per_inch),
+                        width=(side_panel_width * pct_per_inch),
                         actual_width=side_panel_dim,
                         actual_width_fraction=side_panel_frac,
                         height=panel_height_dim,
@@ -6028,13 +6536,18 @@ with precise measurements and customizable configurations.
             elif self.use_equal_panels:
                 base_panel_width = wall_width_inches_total / self.panel_count
                 
-                current_x = 0
-                for i in range(self.panel_count):
-                    panel_dim, panel_frac = self.convert_to_feet_inches_fraction(base_panel_width)
-                    panels.append(Panel(
+                # Every panel is identical apart from its position, so the width,
+                # its feet/inches form and the offset are worked out once
+                panel_dim, panel_frac = self.convert_to_feet_inches_fraction(base_panel_width)
+                panel_width_percent = base_panel_width * pct_per_inch
+                panel_height_offset = height_offset_dim if not floor_mounted else None
+                panel_height_offset_fraction = height_offset_fraction if not floor_mounted else "0"
+                
+                panels = [
+                    Panel(
                         id=i+1,  # Start IDs from 1 for better user understanding
-                        x=(current_x / wall_width_inches_total * 100),
-                        width=(base_panel_width / wall_width_inches_total * 100),
+                        x=(i * base_panel_width * pct_per_inch),
+                        width=panel_width_percent,
                         actual_width=panel_dim,
                         actual_width_fraction=panel_frac,
                         height=panel_height_dim,
@@ -6042,10 +6555,11 @@ with precise measurements and customizable configurations.
                         color=self.panel_color,
                         border_color=self.panel_border_color,
                         floor_mounted=floor_mounted,
-                        height_offset=height_offset_dim if not floor_mounted else None,
-                        height_offset_fraction=height_offset_fraction if not floor_mounted else "0"
-                    ))
-                    current_x += base_panel_width
+                        height_offset=panel_height_offset,
+                        height_offset_fraction=panel_height_offset_fraction
+                    )
+                    for i in range(self.panel_count)
+                ]
                     
             # Fixed Width Panels Logic
             else:
@@ -6058,16 +6572,41 @@ with precise measurements and customizable configurations.
                 if panel_width_inches_total <= 0:
                     return []
 
-                current_x = 0
-                panel_id = 1
-                while current_x < wall_width_inches_total:
-                    current_panel_width = min(panel_width_inches_total, wall_width_inches_total - current_x)
-                    panel_dim, panel_frac = self.convert_to_feet_inches_fraction(current_panel_width)
-                    
+                # All panels but the last (remainder) one share the full width
+                full_width_percent = panel_width_inches_total * pct_per_inch
+                full_dim, full_frac = self.convert_to_feet_inches_fraction(panel_width_inches_total)
+
+                panel_height_offset = height_offset_dim if not floor_mounted else None
+                panel_height_offset_fraction = height_offset_fraction if not floor_mounted else "0"
+
+                # Count the full-width panels up front instead of walking the wall
+                n_full = int(wall_width_inches_total // panel_width_inches_total)
+                remainder = wall_width_inches_total - n_full * panel_width_inches_total
+
+                panels = [
+                    Panel(
+                        id=i+1,
+                        x=(i * panel_width_inches_total * pct_per_inch),
+                        width=full_width_percent,
+                        actual_width=full_dim,
+                        actual_width_fraction=full_frac,
+                        height=panel_height_dim,
+                        height_fraction=panel_height_frac,
+                        color=self.panel_color,
+                        border_color=self.panel_border_color,
+                        floor_mounted=floor_mounted,
+                        height_offset=panel_height_offset,
+                        height_offset_fraction=panel_height_offset_fraction
+                    )
+                    for i in range(n_full)
+                ]
+
+                if remainder > 0:
+                    panel_dim, panel_frac = self.convert_to_feet_inches_fraction(remainder)
                     panels.append(Panel(
-                        id=panel_id,
-                        x=(current_x / wall_width_inches_total * 100),
-                        width=(current_panel_width / wall_width_inches_total * 100),
+                        id=n_full + 1,
+                        x=(n_full * panel_width_inches_total * pct_per_inch),
+                        width=(remainder * pct_per_inch),
                         actual_width=panel_dim,
                         actual_width_fraction=panel_frac,
                         height=panel_height_dim,
@@ -6075,25 +6614,24 @@ with precise measurements and customizable configurations.
                         color=self.panel_color,
                         border_color=self.panel_border_color,
                         floor_mounted=floor_mounted,
-                        height_offset=height_offset_dim if not floor_mounted else None,
-                        height_offset_fraction=height_offset_fraction if not floor_mounted else "0"
+                        height_offset=panel_height_offset,
+                        height_offset_fraction=panel_height_offset_fraction
                     ))
-                    current_x += panel_width_inches_total
-                    panel_id += 1
         
         # Process split panels
         # Inside calculate_panels, replace the split panel handling section:
         # Process split panels
-        if hasattr(self, 'split_panels') and self.split_panels:
-            # Create a mapping of original panels by ID
-            panel_map = {p.id: p for p in panels}
-            
+        if self.split_panels:
             # Create the final panel list
             final_panels = []
             processed_ids = set()
             
             # Sort panels by their x position for consistent ordering
-            sorted_panels = sorted(panels, key=lambda p: p.x)
+            sorted_panels = sorted(panels, key=_BY_X)
+            
+            # Split info by left panel id (reversed so the first split wins,
+            # as the old linear scan did)
+            split_by_left_id = {info['left_id']: info for info in reversed(self.split_panels.values())}
             
             for panel in sorted_panels:
                 # Skip if we've already processed this panel
@@ -6101,16 +6639,9 @@ with precise measurements and customizable configurations.
                     continue
                 
                 # Check if this panel is the left side of a split
-                is_left_panel = False
-                split_info = None
+                split_info = split_by_left_id.get(panel.id)
                 
-                for orig_id, info in self.split_panels.items():
-                    if panel.id == info['left_id']:
-                        is_left_panel = True
-                        split_info = info
-                        break
-                
-                if not is_left_panel:
+                if split_info is None:
                     # This is not a split panel's left side, add as-is
                     final_panels.append(panel)
                     processed_ids.add(panel.id)
@@ -6124,7 +6655,7 @@ with precise measurements and customizable configurations.
                 half_dim, half_frac = self.convert_to_feet_inches_fraction(half_width_inches)
                 
                 # Calculate percentages
-                half_width_percent = (half_width_inches / wall_width_inches_total) * 100
+                half_width_percent = (half_width_inches * pct_per_inch)
                 
                 # Add left panel
                 left_panel = Panel(
@@ -6166,7 +6697,7 @@ with precise measurements and customizable configurations.
                 final_panels.append(right_panel)
                 processed_ids.add(right_id)
             
-            return final_panels
+            panels = final_panels
         
         return panels
 
@@ -6175,16 +6706,10 @@ with precise measurements and customizable configurations.
         print("\n=== PANEL STATE DEBUG ===")
         
         # Print custom panel widths
-        if hasattr(self, 'custom_panel_widths'):
-            print(f"Custom Panel Widths: {self.custom_panel_widths}")
-        else:
-            print("No custom panel widths")
+        print(f"Custom Panel Widths: {self.custom_panel_widths}")
         
         # Print split panels
-        if hasattr(self, 'split_panels'):
-            print(f"Split Panels: {self.split_panels}")
-        else:
-            print("No split panels")
+        print(f"Split Panels: {self.split_panels}")
         
         # Print current panels
         panels = self.calculate_panels()
@@ -6207,14 +6732,14 @@ with precise measurements and customizable configurations.
     def on_canvas_click(self, event):
         """Handle canvas click based on current mode"""
         if self.annotation_mode:
-            print(f"Click in annotation mode: ({event.x}, {event.y})")
+            logger.debug("Click in annotation mode: (%s, %s)", event.x, event.y)
             self.debug_line_drawing_state()
             
             # Check if clicked on an existing annotation
             annotation = self.find_annotation_at_position(event.x, event.y)
             
             if annotation:
-                print(f"Found annotation {annotation.id}")
+                logger.debug("Found annotation %s", annotation.id)
                 # Start moving the annotation
                 self.moving_annotation = True
                 self.current_annotation = annotation
@@ -6222,14 +6747,14 @@ with precise measurements and customizable configurations.
             
             # If line drawing is enabled and we have an annotation selected
             if self.line_drawing_var.get() and self.current_annotation:
-                print(f"Starting line from annotation {self.current_annotation.id}")
+                logger.debug("Starting line from annotation %s", self.current_annotation.id)
                 # Start drawing a line from the current annotation
                 self.line_drawing = True
                 self.annotation_line_start = self.current_annotation
                 return
             
             # Create a new annotation circle at click position
-            print("Adding new annotation")
+            logger.debug("Adding new annotation")
             self.manual_add_circle(event.x, event.y)
         elif self.selection_mode:
             # Handle panel selection (existing code)
@@ -6240,7 +6765,7 @@ with precise measurements and customizable configurations.
                     self.selected_panels.remove(clicked_panel.id)
                 else:
                     # Select the panel
-                    self.selected_panels.append(clicked_panel.id)
+                    self.selected_panels.add(clicked_panel.id)
                 
                 # Update the selected panels display
                 self.update_selected_panels_display()
@@ -6261,17 +6786,9 @@ with precise measurements and customizable configurations.
         margin = 100
         
         # Calculate wall dimensions
-        wall_width_inches = self.convert_to_inches(
-            self.wall_dimensions["width"].feet,
-            self.wall_dimensions["width"].inches,
-            self.wall_dimensions.get("width_fraction", "0")
-        )
-        
-        wall_height_inches = self.convert_to_inches(
-            self.wall_dimensions["height"].feet,
-            self.wall_dimensions["height"].inches,
-            self.wall_dimensions.get("height_fraction", "0")
-        )
+        self._ensure_dim_cache()
+        wall_width_inches = self._wall_w_in
+        wall_height_inches = self._wall_h_in
         
         # Calculate scaling factor
         wall_aspect_ratio = wall_width_inches / wall_height_inches
@@ -6290,53 +6807,56 @@ with precise measurements and customizable configurations.
         x_offset = (canvas_width - scaled_width) / 2
         y_offset = (canvas_height - scaled_height) / 2
         
-        # Check each panel
-        for panel in panels:
-            panel_x = x_offset + (panel.x / 100 * scaled_width)
-            panel_width = (panel.width / 100 * scaled_width)
-            
-            # Calculate baseboard height
-            baseboard_height_inches = 0
-            if self.use_baseboard:
-                baseboard_height_inches = self.baseboard_height
-                if hasattr(self, 'baseboard_fraction_var'):
-                    baseboard_height_inches += self.fraction_to_decimal(self.baseboard_fraction_var.get())
-            
-            baseboard_height = baseboard_height_inches * scale if self.use_baseboard else 0
-            
-            # Calculate panel height
-            panel_height_inches = self.convert_to_inches(
-                panel.height.feet, 
-                panel.height.inches, 
-                panel.height_fraction
-            )
-            
-            # Calculate panel y position
-            if self.use_baseboard:
-                panel_bottom = y_offset + scaled_height - baseboard_height
-            else:
-                panel_bottom = y_offset + scaled_height
-                
-            panel_top = panel_bottom - (panel_height_inches * scale)
-            
-            # Check if click is inside this panel
-            if (panel_x <= x <= panel_x + panel_width and
-                panel_top <= y <= panel_bottom):
-                return panel
+        # Baseboard height is the same for every panel
+        baseboard_height_inches = self._baseboard_in
+        
+        # Panel extents in canvas space, sorted by left edge. They only change with
+        # the layout (tracked by _panels_generation), the canvas size or the
+        # baseboard, so reuse them per click
+        hit_key = (canvas_width, canvas_height, baseboard_height_inches)
+        hit_cache = self._panel_hit_cache
+        if hit_cache is None or hit_cache[0] != self._panels_generation or hit_cache[1] != hit_key:
+            panel_bottom = y_offset + scaled_height - baseboard_height_inches * scale
+            sorted_panels = sorted(panels, key=_BY_X)
+            lefts = [x_offset + (panel.x / 100 * scaled_width) for panel in sorted_panels]
+            rights = [left + (panel.width / 100 * scaled_width) for left, panel in zip(lefts, sorted_panels)]
+            # One conversion per distinct panel height
+            heights = {}
+            for panel in sorted_panels:
+                key = (panel.height.feet, panel.height.inches, panel.height_fraction)
+                if key not in heights:
+                    heights[key] = self.convert_to_inches(*key) * scale
+            tops = [
+                panel_bottom - heights[panel.height.feet, panel.height.inches, panel.height_fraction]
+                for panel in sorted_panels
+            ]
+            hit_cache = (self._panels_generation, hit_key, sorted_panels, lefts, rights, tops, panel_bottom)
+            self._panel_hit_cache = hit_cache
+        _, _, sorted_panels, lefts, rights, tops, panel_bottom = hit_cache
+        
+        # Jump straight to the panel whose left edge is at or before x; on a shared
+        # edge the panel to the left wins, as the old linear scan did
+        i = bisect.bisect_right(lefts, x) - 1
+        for j in (i - 1, i):
+            if (0 <= j and lefts[j] <= x <= rights[j] and
+                    tops[j] <= y <= panel_bottom):
+                return sorted_panels[j]
         
         return None
 
     def update_selected_panels_display(self):
         """Update the label showing selected panels"""
         if not self.selected_panels:
-            self.selected_panels_label.configure(text="None")
+            text = "None"
         else:
-            sorted_ids = sorted(self.selected_panels)
-            self.selected_panels_label.configure(text=", ".join(map(str, sorted_ids)))
+            text = ", ".join(map(str, sorted(self.selected_panels)))
+        # Only touch the widget when the text actually changes
+        if self.selected_panels_label.cget("text") != text:
+            self.selected_panels_label.configure(text=text)
 
     def clear_panel_selection(self):
         """Clear all selected panels"""
-        self.selected_panels = []
+        self.selected_panels = set()
         self.update_selected_panels_display()
         self.calculate()  # Redraw everything
 
@@ -6371,32 +6891,12 @@ with precise measurements and customizable configurations.
         object_width_inches = self.convert_to_inches(width_feet, width_inches, width_fraction)
         object_height_inches = self.convert_to_inches(height_feet, height_inches, height_fraction)
         
-        # Get wall and panel dimensions
-        wall_width_inches = self.convert_to_inches(
-            self.wall_dimensions["width"].feet,
-            self.wall_dimensions["width"].inches,
-            self.wall_dimensions.get("width_fraction", "0")
-        )
-        
-        wall_height_inches = self.convert_to_inches(
-            self.wall_dimensions["height"].feet,
-            self.wall_dimensions["height"].inches,
-            self.wall_dimensions.get("height_fraction", "0")
-        )
-        
-        # Calculate panel height
-        panel_height_inches = self.convert_to_inches(
-            self.panel_dimensions["height"].feet,
-            self.panel_dimensions["height"].inches,
-            self.panel_dimensions.get("height_fraction", "0")
-        )
-        
-        # Calculate baseboard height if used
-        baseboard_height_inches = 0
-        if self.use_baseboard:
-            baseboard_height_inches = self.baseboard_height
-            if hasattr(self, 'baseboard_fraction_var'):
-                baseboard_height_inches += self.fraction_to_decimal(self.baseboard_fraction_var.get())
+        # Get wall, panel and baseboard dimensions
+        self._ensure_dim_cache()
+        wall_width_inches = self._wall_w_in
+        wall_height_inches = self._wall_h_in
+        panel_height_inches = self._panel_h_in
+        baseboard_height_inches = self._baseboard_in
         
         usable_height_inches = wall_height_inches - baseboard_height_inches
         
@@ -6474,18 +6974,27 @@ with precise measurements and customizable configurations.
             # Using alignment (same as existing code)
             panels = self.calculate_panels()
             selected_panels = [p for p in panels if p.id in self.selected_panels]
+            if not selected_panels:
+                messagebox.showerror("Error", "Please select at least one panel first")
+                return
             alignment = self.object_alignment_var.get()
             
+            # Left and right extent of the selection in one pass
+            min_x = float('inf')
+            max_x = float('-inf')
+            for p in selected_panels:
+                if p.x < min_x:
+                    min_x = p.x
+                right = p.x + p.width
+                if right > max_x:
+                    max_x = right
+            
             if alignment == "Center":
-                min_x = min(p.x for p in selected_panels)
-                max_x = max(p.x + p.width for p in selected_panels)
                 x_position = (min_x + max_x) / 2
             elif alignment == "Left Edge":
-                min_x = min(p.x for p in selected_panels)
                 object_half_width_pct = (object_width_inches / wall_width_inches * 100) / 2
                 x_position = min_x + object_half_width_pct
             elif alignment == "Right Edge":
-                max_x = max(p.x + p.width for p in selected_panels)
                 object_half_width_pct = (object_width_inches / wall_width_inches * 100) / 2
                 x_position = max_x - object_half_width_pct
                 
@@ -6506,7 +7015,7 @@ with precise measurements and customizable configurations.
             height_fraction=height_fraction,
             x_position=x_position,
             y_position=y_position,
-            affected_panels=self.selected_panels.copy(),
+            affected_panels=sorted(self.selected_panels),
             color=self.object_color_preview["background"],
             border_color=self.object_border_color_preview["background"],
             border_width=int(self.object_border_width_var.get()),
@@ -6540,6 +7049,8 @@ with precise measurements and customizable configurations.
             
         if messagebox.askyesno("Confirm", "Remove all objects from the wall?"):
             self.wall_objects = []
+            self.canvas.delete("wallobj")
+            self._obj_canvas_ids.clear()
             self.calculate()  # Redraw everything
 
     def draw_wall_objects(self, canvas_width, canvas_height, x_offset, y_offset, 
@@ -6555,34 +7066,13 @@ with precise measurements and customizable configurations.
         # Determine if baseboard is being shown
         is_baseboard_shown = self.use_baseboard  # This is True if baseboard is shown, False otherwise
         
-        # Get wall dimensions
-        wall_width_inches = self.convert_to_inches(
-            self.wall_dimensions["width"].feet,
-            self.wall_dimensions["width"].inches,
-            self.wall_dimensions.get("width_fraction", "0")
-        )
-        
-        wall_height_inches = self.convert_to_inches(
-            self.wall_dimensions["height"].feet,
-            self.wall_dimensions["height"].inches,
-            self.wall_dimensions.get("height_fraction", "0")
-        )
-        
-        # Calculate panel height
-        panel_height_inches = self.convert_to_inches(
-            self.panel_dimensions["height"].feet,
-            self.panel_dimensions["height"].inches,
-            self.panel_dimensions.get("height_fraction", "0")
-        )
+        # Get wall, panel and baseboard dimensions
+        self._ensure_dim_cache()
+        wall_height_inches = self._wall_h_in
+        panel_height_inches = self._panel_h_in
         
         # Calculate usable wall height (accounting for baseboard)
-        usable_height_inches = wall_height_inches
-        baseboard_height_inches = 0
-        if self.use_baseboard:
-            baseboard_height_inches = self.baseboard_height
-            if hasattr(self, 'baseboard_fraction_var'):
-                baseboard_height_inches += self.fraction_to_decimal(self.baseboard_fraction_var.get())
-            usable_height_inches -= baseboard_height_inches
+        usable_height_inches = wall_height_inches - self._baseboard_in
         
         # Calculate actual wall positions on canvas
         wall_top = y_offset
@@ -6622,69 +7112,132 @@ with precise measurements and customizable configurations.
                     dash=(5, 3)      # Dashed line
                 )
         
+        # Display options and distance constants are the same for every object
+        show_dimensions = self.show_dimensions_var.get()
+        show_object_distances = self.show_object_distances_var.get()
+        show_horizontal_distances = self.show_horizontal_distances_var.get()
+        
+        # Add a small epsilon to avoid floating point errors
+        epsilon = 0.001
+        
+        # When determining reference points, use the effective boundaries
+        reference_top = panel_top if distance_reference == "Panel Top" else wall_top_effective
+        
+        # IMPORTANT: Use different correction factors and account for baseboard visibility
+        # Only for top distance - different correction factors based on reference and baseboard
+        top_correction = _TOP_DISTANCE_CORRECTIONS[distance_reference == "Panel Top", bool(is_baseboard_shown)]
+        
+        # Define a consistent reference point for the bottom of the panel
+        # This ensures bottom measurements are consistent regardless of baseboard visibility
+        if self.use_baseboard:
+            baseboard_scaled_height = baseboard_height  # This is already scaled for canvas
+        else:
+            # If baseboard is not showing, we still need to account for what would be the baseboard area
+            baseboard_inches = self.baseboard_height
+            if self._has_baseboard_frac:
+                baseboard_inches += self.fraction_to_decimal(self.baseboard_fraction_var.get())
+            baseboard_scaled_height = baseboard_inches * scale
+        
+        # Always use the panel bottom without baseboard as our consistent reference
+        consistent_panel_bottom = wall_bottom_effective - baseboard_scaled_height
+        
+        # For drawing the dimension line, use the visual panel bottom
+        visual_panel_bottom = wall_bottom_effective
+        if self.use_baseboard:
+            visual_panel_bottom -= baseboard_scaled_height
+        
+        # Calculate the usable wall height (total minus baseboard if used)
+        if self.use_baseboard:
+            usable_canvas_height = scaled_height - baseboard_height
+        else:
+            usable_canvas_height = scaled_height
+        
+        # Canvas geometry for every object at once; the loop below only issues draw calls
+        objects = self.wall_objects
+        width_inches = [
+            self.convert_to_inches(obj.width.feet, obj.width.inches, obj.width_fraction)
+            for obj in objects
+        ]
+        height_inches = [
+            self.convert_to_inches(obj.height.feet, obj.height.inches, obj.height_fraction)
+            for obj in objects
+        ]
+        # Tkinter draws the border centered on the boundary, so half extends outside
+        border_offsets = [(obj.border_width if obj.show_border else 0) / 2 for obj in objects]
+        obj_widths = [w * scale for w in width_inches]
+        obj_heights = [h * scale for h in height_inches]
+        obj_xs = [
+            x_offset + (obj.x_position * scaled_width / 100) - (obj_width / 2)
+            for obj, obj_width in zip(objects, obj_widths)
+        ]
+        obj_ys = [
+            y_offset + ((obj.y_position / 100) * usable_canvas_height) - (obj_height / 2)
+            for obj, obj_height in zip(objects, obj_heights)
+        ]
+        top_distances = [
+            max(abs(obj_y - offset - reference_top) / scale + epsilon + top_correction, 0)
+            for obj_y, offset in zip(obj_ys, border_offsets)
+        ]
+        bottom_distances = [
+            abs(consistent_panel_bottom - (obj_y + obj_height + offset)) / scale + epsilon
+            for obj_y, obj_height, offset in zip(obj_ys, obj_heights, border_offsets)
+        ]
+        
+        # Each object's rectangle and label survive from the last draw (draw_wall
+        # keeps the "wallobj" items), so move and restyle them instead of recreating
+        object_items = self._obj_canvas_ids
+        live_items = set(self.canvas.find_withtag("wallobj"))
+        kept_items = set()
+        
         # Draw all objects
-        for obj in self.wall_objects:
-            # Calculate object dimensions in inches
-            width_inches = self.convert_to_inches(
-                obj.width.feet,
-                obj.width.inches,
-                obj.width_fraction
-            )
-            
-            height_inches = self.convert_to_inches(
-                obj.height.feet,
-                obj.height.inches,
-                obj.height_fraction
-            )
-            
-            # Calculate border thickness in pixels
+        for obj, obj_x, obj_y, obj_width, obj_height, border_offset, top_distance_inches, bottom_distance_inches in zip(
+                objects, obj_xs, obj_ys, obj_widths, obj_heights, border_offsets, top_distances, bottom_distances):
             border_width = obj.border_width if obj.show_border else 0
-            
-            # Calculate position and size on canvas
-            obj_width = width_inches * scale
-            obj_height = height_inches * scale
-            
-            # Calculate horizontal position based on percentage
-            obj_x = x_offset + (obj.x_position * scaled_width / 100) - (obj_width / 2)
-            
-            # Calculate the usable wall height (total minus baseboard if used)
-            if self.use_baseboard:
-                usable_canvas_height = scaled_height - baseboard_height
-            else:
-                usable_canvas_height = scaled_height
-            
-            # Calculate Y position from top of wall (adjust for object centering)
-            obj_y = y_offset + ((obj.y_position / 100) * usable_canvas_height) - (obj_height / 2)
-            
-            # Calculate effective boundaries including border
-            # For Tkinter, the border is drawn centered on the boundary
-            # So half extends outside, half inside
-            border_offset = border_width / 2
             effective_top = obj_y - border_offset
             effective_bottom = obj_y + obj_height + border_offset
             effective_left = obj_x - border_offset
             effective_right = obj_x + obj_width + border_offset
-            
-            # Draw object rectangle
-            self.canvas.create_rectangle(
-                obj_x, obj_y,
-                obj_x + obj_width, obj_y + obj_height,
-                fill=obj.color,
-                outline=obj.border_color if obj.show_border else "",
-                width=border_width
-            )
-            
-            # Draw object label
-            self.canvas.create_text(
-                obj_x + obj_width / 2,
-                obj_y + obj_height / 2,
-                text=obj.name,
-                fill="black",
-                font=("Arial", 10, "bold")
-            )
+            outline = obj.border_color if obj.show_border else ""
+            style = (obj.color, outline, border_width, obj.name)
+            
+            items = object_items.get(obj.id)
+            if (items is not None and items[0] in live_items and items[1] in live_items
+                    and items[0] not in kept_items):
+                rect_item, text_item, last_style = items
+                self.canvas.coords(rect_item, obj_x, obj_y, obj_x + obj_width, obj_y + obj_height)
+                self.canvas.coords(text_item, obj_x + obj_width / 2, obj_y + obj_height / 2)
+                # Lift the reused pair back above the panels drawn since the last
+                # frame, in draw order so later dimension lines still sit on top
+                self.canvas.tag_raise(rect_item)
+                self.canvas.tag_raise(text_item)
+                if style != last_style:
+                    self.canvas.itemconfigure(rect_item, fill=obj.color, outline=outline, width=border_width)
+                    self.canvas.itemconfigure(text_item, text=obj.name)
+            else:
+                # Draw object rectangle
+                rect_item = self.canvas.create_rectangle(
+                    obj_x, obj_y,
+                    obj_x + obj_width, obj_y + obj_height,
+                    fill=obj.color,
+                    outline=outline,
+                    width=border_width,
+                    tags=("wallobj",)
+                )
+                
+                # Draw object label
+                text_item = self.canvas.create_text(
+                    obj_x + obj_width / 2,
+                    obj_y + obj_height / 2,
+                    text=obj.name,
+                    fill="black",
+                    font=("Arial", 10, "bold"),
+                    tags=("wallobj",)
+                )
+            object_items[obj.id] = (rect_item, text_item, style)
+            kept_items.update((rect_item, text_item))
             
             # Show position information
-            if self.show_dimensions_var.get():
+            if show_dimensions:
                 # Draw width and height dimensions
                 self.draw_dimension_line(
                     obj_x, obj_y - 10,
@@ -6705,78 +7258,11 @@ with precise measurements and customizable configurations.
                 )
             
             # Show vertical object distances if that option is enabled
-            if self.show_object_distances_var.get():
-                # When determining reference points, use the effective boundaries
-                reference_top = panel_top if distance_reference == "Panel Top" else wall_top_effective
-                
-                # Add a small epsilon to avoid floating point errors
-                epsilon = 0.001
-                
-                # IMPORTANT: Use different correction factors and account for baseboard visibility
-                # Only for top distance - different correction factors based on reference and baseboard
-                if distance_reference == "Panel Top":
-                    if is_baseboard_shown:
-                        # Panel Top WITH baseboard: 7'3 11/16" vs 8'0" → need to add 8 5/16"
-                        panel_top_correction = -8.3125  # Negative to add 8 5/16 inches (8.3125)
-                    else:
-                        # Panel Top WITHOUT baseboard: 8'0 1/2" vs 8'0" → need to subtract 1/2"
-                        panel_top_correction = 0.5  # Positive to subtract 1/2 inch
-                        
-                    # TOP DISTANCE calculation for Panel Top reference
-                    top_distance_pixels = abs(effective_top - reference_top)
-                    top_distance_inches = (top_distance_pixels / scale) + epsilon + panel_top_correction
-                    if top_distance_inches < 0:
-                        top_distance_inches = 0
-                else:
-                    # For Wall Top reference:
-                    if is_baseboard_shown:
-                        # Wall Top WITH baseboard: 9'1 13/16" vs 9'8" → need to add 6 3/16"
-                        wall_top_correction = -6.1875  # Negative to add 6 3/16 inches (6.1875)
-                    else:
-                        # Wall Top WITHOUT baseboard: 9'5" vs 10'0" → need to add 7 inches
-                        wall_top_correction = -7.0  # Negative to add 7 inches
-                        
-                    # TOP DISTANCE calculation for Wall Top reference
-                    top_distance_pixels = abs(effective_top - reference_top)
-                    top_distance_inches = (top_distance_pixels / scale) + epsilon + wall_top_correction
-                    if top_distance_inches < 0:
-                        top_distance_inches = 0
-                
+            if show_object_distances:
                 # Convert to feet/inches with proper rounding
                 top_dim, top_frac = self.convert_to_feet_inches_fraction(top_distance_inches)
-                
-                # Define a consistent reference point for the bottom of the panel
-                # This ensures bottom measurements are consistent regardless of baseboard visibility
-                
-                # Calculate the baseboard height in scaled canvas units
-                if self.use_baseboard:
-                    baseboard_scaled_height = baseboard_height  # This is already scaled for canvas
-                else:
-                    # If baseboard is not showing, we still need to account for what would be the baseboard area
-                    baseboard_inches = self.baseboard_height
-                    if hasattr(self, 'baseboard_fraction_var'):
-                        baseboard_inches += self.fraction_to_decimal(self.baseboard_fraction_var.get())
-                    baseboard_scaled_height = baseboard_inches * scale
-                
-                # Always use the panel bottom without baseboard as our consistent reference
-                consistent_panel_bottom = wall_bottom_effective - baseboard_scaled_height
-                
-                # BOTTOM DISTANCE - from bottom of object to bottom of panels (NOT including baseboard)
-                bottom_distance_pixels = abs(consistent_panel_bottom - effective_bottom)
-                bottom_distance_inches = (bottom_distance_pixels / scale) + epsilon
-                
-                # Apply a consistent correction for bottom measurements
-                bottom_correction = 0.0  # Adjust if needed based on testing
-                bottom_distance_inches += bottom_correction
-                
-                # No additional correction needed if we're using a consistent reference point
                 bottom_dim, bottom_frac = self.convert_to_feet_inches_fraction(bottom_distance_inches)
                 
-                # For drawing the dimension line, use the visual panel bottom
-                visual_panel_bottom = wall_bottom_effective
-                if self.use_baseboard:
-                    visual_panel_bottom -= baseboard_scaled_height
-                
                 # Use precise coordinates for dimension lines
                 top_line_x = obj_x + obj_width + 20
                 self.draw_dimension_line(
@@ -6798,10 +7284,7 @@ with precise measurements and customizable configurations.
                 )
             
             # Show horizontal distances independently if that option is enabled
-            if self.show_horizontal_distances_var.get():
-                # Apply the same precise measurement approach for horizontal distances
-                epsilon = 0.001
-                
+            if show_horizontal_distances:
                 # Left distance - distance from object left to wall left
                 left_distance_pixels = abs(effective_left - wall_left_effective)
                 left_distance_inches = (left_distance_pixels / scale) + epsilon
@@ -6815,7 +7298,7 @@ with precise measurements and customizable configurations.
                 # Determine vertical position for horizontal measurements
                 # If vertical dimensions are shown, place these a bit higher
                 vertical_offset = -20
-                if self.show_object_distances_var.get():
+                if show_object_distances:
                     vertical_offset -= 25  # Move up further to avoid overlap
                 
                 # For horizontal distances
@@ -6834,6 +7317,13 @@ with precise measurements and customizable configurations.
                     offset=15,
                     side="top"
                 )
+        
+        # Drop items of objects that are gone
+        stale_items = live_items - kept_items
+        if stale_items:
+            self.canvas.delete(*stale_items)
+        for obj_id in [obj_id for obj_id, items in object_items.items() if items[0] not in kept_items]:
+            del object_items[obj_id]
                 
     def add_panel_splitting_feature(self):
         """Add UI for splitting a panel into two equal panels"""
@@ -6879,7 +7369,7 @@ with precise measurements and customizable configurations.
             messagebox.showerror("Error", "Please select exactly one panel to split")
             return
         
-        panel_id = self.selected_panels[0]
+        panel_id = next(iter(self.selected_panels))
         
         # Get original panel configuration - make sure we have the latest panels
         panels = self.calculate_panels()
@@ -6912,10 +7402,6 @@ with precise measurements and customizable configurations.
         highest_id = max([p.id for p in panels])
         new_right_id = highest_id + 1
         
-        # Initialize custom panel widths dictionary if needed
-        if not hasattr(self, 'custom_panel_widths'):
-            self.custom_panel_widths = {}
-        
         # Get current x position in inches from the left edge
         current_x_inches = (selected_panel.x / 100) * wall_width_inches
         
@@ -6936,14 +7422,10 @@ with precise measurements and customizable configurations.
             del self.custom_panel_widths[panel_id]
         
         # Clear any existing split panel relationships for this panel
-        if hasattr(self, 'split_panels'):
-            # Remove any existing split relationships for this panel
-            for orig_id in list(self.split_panels.keys()):
-                if (self.split_panels[orig_id]['left_id'] == panel_id or 
-                    self.split_panels[orig_id]['right_id'] == panel_id):
-                    del self.split_panels[orig_id]
-        else:
-            self.split_panels = {}
+        for orig_id in list(self.split_panels.keys()):
+            if (self.split_panels[orig_id]['left_id'] == panel_id or 
+                self.split_panels[orig_id]['right_id'] == panel_id):
+                del self.split_panels[orig_id]
         
         # Store the split information
         self.split_panels[panel_id] = {
@@ -6958,6 +7440,7 @@ with precise measurements and customizable configurations.
         # Store custom width for both panels
         self.custom_panel_widths[panel_id] = half_width_inches
         self.custom_panel_widths[new_right_id] = half_width_inches
+        self._panels_dirty = True
         
         # Temporarily turn off center panels mode if active
         center_was_active = self.center_panels_var.get()
@@ -6968,7 +7451,7 @@ with precise measurements and customizable configurations.
         self.calculate()
         
         # Select both new panels
-        self.selected_panels = [panel_id, new_right_id]
+        self.selected_panels = {panel_id, new_right_id}
         self.update_selected_panels_display()
         
         messagebox.showinfo("Success", f"Panel {panel_id} split into two equal panels (IDs: {panel_id} and {new_right_id})")
@@ -7040,12 +7523,10 @@ with precise measurements and customizable configurations.
         # Fraction
         ctk.CTkLabel(width_frame, text="+").pack(side=tk.LEFT, padx=2)
         self.object_width_fraction_var = tk.StringVar(value="0")
-        fraction_options = ["0", "1/16", "1/8", "3/16", "1/4", "5/16", "3/8", "7/16", 
-                          "1/2", "9/16", "5/8", "11/16", "3/4", "13/16", "7/8", "15/16"]
         fraction_dropdown = ctk.CTkOptionMenu(
             width_frame, 
             variable=self.object_width_fraction_var,
-            values=fraction_options,
+            values=list(_FRACTION_OPTIONS),
             width=70
         )
         fraction_dropdown.pack(side=tk.LEFT, padx=2)
@@ -7073,7 +7554,7 @@ with precise measurements and customizable configurations.
         fraction_dropdown = ctk.CTkOptionMenu(
             height_frame, 
             variable=self.object_height_fraction_var,
-            values=fraction_options,
+            values=list(_FRACTION_OPTIONS),
             width=70
         )
         fraction_dropdown.pack(side=tk.LEFT, padx=2)
@@ -7174,7 +7655,7 @@ with precise measurements and customizable configurations.
         fraction_dropdown = ctk.CTkOptionMenu(
             vertical_pos_frame, 
             variable=self.object_y_fraction_var,
-            values=fraction_options,  # Use the same fraction options defined elsewhere
+            values=list(_FRACTION_OPTIONS),  # Use the same fraction options defined elsewhere
             width=70
         )
         fraction_dropdown.pack(side=tk.LEFT, padx=2)
@@ -7207,8 +7688,9 @@ with precise measurements and customizable configurations.
     def add_panel_selection_system(self):
         """Add panel selection and object placement functionality"""
         # Initialize properties for panel selection
-        self.selected_panels = []  # List of selected panel IDs
+        self.selected_panels = set()  # IDs of the selected panels
         self.wall_objects = []     # List of WallObject instances
+        self._obj_canvas_ids = {}  # Object id -> (rectangle id, label id, style) from the last draw
         self.next_object_id = 1    # ID counter for wall objects
         self.selection_mode = False  # If True, clicks will select panels
         
@@ -7270,10 +7752,21 @@ with precise measurements and customizable configurations.
 
     def draw_wall(self, panels: List[Panel]):
         """Draw wall with panels and baseboard if enabled"""
-        self.canvas.delete("all")
-        
-        # Add debug output to track baseboard state at drawing time
-        print(f"DRAW_WALL: baseboard_enabled={self.baseboard_var.get()}, use_baseboard={self.use_baseboard}")
+        # Keep the panel rectangles from the last draw and move them into place
+        # below instead of deleting and recreating them; everything else is redrawn
+        panel_item_pool = self.canvas.find_withtag("panel_rect")
+        self.canvas.addtag_all("stale")
+        self.canvas.dtag("panel_rect", "stale")
+        if getattr(self, 'wall_objects', None):
+            # draw_wall_objects reuses these too
+            self.canvas.dtag("wallobj", "stale")
+        self.canvas.delete("stale")
+        self._border_item_ids = []  # (item id, option) pairs drawn in the panel border color
+        
+        # Add debug output to track baseboard state at drawing time (guarded, as
+        # reading the Tk variable costs a Tcl call on every redraw)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DRAW_WALL: baseboard_enabled=%s, use_baseboard=%s", self.baseboard_var.get(), self.use_baseboard)
         
         # Calculate scaling factors
         canvas_width = self.canvas.winfo_width()
@@ -7299,7 +7792,7 @@ with precise measurements and customizable configurations.
         
         # Calculate baseboard height including fraction
         baseboard_height_inches = self.baseboard_height
-        if hasattr(self, 'baseboard_fraction_var'):
+        if self._has_baseboard_frac:
             baseboard_height_inches += self.fraction_to_decimal(self.baseboard_fraction_var.get())
             
         # CRITICAL: Direct check of baseboard_var state, not instance variable
@@ -7337,7 +7830,7 @@ with precise measurements and customizable configurations.
         )
 
         # Sort panels by x position to ensure proper drawing order
-        sorted_panels = sorted(panels, key=lambda p: p.x)
+        sorted_panels = sorted(panels, key=_BY_X)
         
         # Fix any overlapping panels
         fixed_panels = []
@@ -7366,7 +7859,7 @@ with precise measurements and customizable configurations.
         # CRITICAL: Draw baseboard BEFORE panels to ensure panels are on top
         # Draw baseboard if enabled - directly check baseboard_var
         if use_baseboard:
-            print(f"  Drawing baseboard: height={baseboard_height_inches} inches, {baseboard_height} pixels")
+            logger.debug("  Drawing baseboard: height=%s inches, %s pixels", baseboard_height_inches, baseboard_height)
             self.canvas.create_rectangle(
                 x_offset,
                 y_offset + scaled_height - baseboard_height,
@@ -7378,18 +7871,23 @@ with precise measurements and customizable configurations.
                 tags=["baseboard"]  # Add a tag for identification
             )
         
+        # Panels mostly share one height, so convert each distinct height once
+        # and reuse it in the drawing, label and selection loops below
+        visual_heights = {}
+        def visual_height(panel):
+            key = (panel.height.feet, panel.height.inches, panel.height_fraction)
+            height = visual_heights.get(key)
+            if height is None:
+                height = min(self.convert_to_inches(*key), visual_usable_height) * scale
+                visual_heights[key] = height
+            return height
+        
         # Now draw the fixed panels
-        for panel in fixed_panels:
+        for panel_index, panel in enumerate(fixed_panels):
             panel_x = x_offset + (panel.x / 100 * scaled_width)
             panel_width = (panel.width / 100 * scaled_width)
             
-            # Calculate constrained panel height for visualization
-            panel_height_inches = self.convert_to_inches(
-                panel.height.feet, 
-                panel.height.inches, 
-                panel.height_fraction
-            )
-            visual_panel_height = min(panel_height_inches, visual_usable_height) * scale
+            visual_panel_height = visual_height(panel)
             
             # Calculate panel y position based on floor mounting
             floor_mounted = True
@@ -7425,28 +7923,43 @@ with precise measurements and customizable configurations.
                 
             panel_top = panel_bottom - visual_panel_height
             
-            # Draw panel
-            self.canvas.create_rectangle(
-                panel_x,
-                panel_top,
-                panel_x + panel_width,
-                panel_bottom,
-                fill=panel.color,
-                outline=panel.border_color,
-                width=1
-            )
+            # Draw panel, reusing a rectangle from the last draw when there is one
+            if panel_index < len(panel_item_pool):
+                panel_item = panel_item_pool[panel_index]
+                self.canvas.coords(panel_item, panel_x, panel_top, panel_x + panel_width, panel_bottom)
+                self.canvas.itemconfigure(panel_item, fill=panel.color, outline=panel.border_color)
+            else:
+                panel_item = self.canvas.create_rectangle(
+                    panel_x,
+                    panel_top,
+                    panel_x + panel_width,
+                    panel_bottom,
+                    fill=panel.color,
+                    outline=panel.border_color,
+                    width=1,
+                    tags=("panel_rect",)
+                )
+            self._border_item_ids.append((panel_item, 'outline'))
+        
+        # Drop rectangles left over from a draw with more panels, and lift the
+        # reused ones above the wall outline and baseboard drawn before them
+        if len(panel_item_pool) > len(fixed_panels):
+            self.canvas.delete(*panel_item_pool[len(fixed_panels):])
+        if fixed_panels:
+            self.canvas.tag_raise("panel_rect")
 
         # Draw vertical lines between panels using fixed panel positions
         for panel in fixed_panels:
             panel_x = x_offset + (panel.x / 100 * scaled_width)
             if panel.x > 0:  # Don't draw at left edge of wall
-                self.canvas.create_line(
+                divider_item = self.canvas.create_line(
                     panel_x, y_offset,
                     panel_x, y_offset + scaled_height,
                     fill=panel.border_color,  
                     width=1,
                     dash=(4, 4)
                 )
+                self._border_item_ids.append((divider_item, 'fill'))
             
         # Draw custom name for panels
         custom_name = self.custom_name_var.get()
@@ -7454,13 +7967,7 @@ with precise measurements and customizable configurations.
             panel_x = x_offset + (panel.x / 100 * scaled_width)
             panel_width = (panel.width / 100 * scaled_width)
             
-            # Calculate constrained panel height for visualization
-            panel_height_inches = self.convert_to_inches(
-                panel.height.feet, 
-                panel.height.inches, 
-                panel.height_fraction
-            )
-            visual_panel_height = min(panel_height_inches, visual_usable_height) * scale
+            visual_panel_height = visual_height(panel)
             
             # Calculate panel y position based on floor mounting
             floor_mounted = True
@@ -7510,62 +8017,55 @@ with precise measurements and customizable configurations.
         
         # Highlight selected panels (using the original panel IDs but fixed positions)
         if hasattr(self, 'selected_panels') and self.selected_panels:
-            for panel_id in self.selected_panels:
-                for panel in fixed_panels:  # Use fixed panels for display
-                    if panel.id == panel_id:
-                        panel_x = x_offset + (panel.x / 100 * scaled_width)
-                        panel_width = (panel.width / 100 * scaled_width)
-                        
-                        # Calculate panel height for visualization
-                        panel_height_inches = self.convert_to_inches(
-                            panel.height.feet, 
-                            panel.height.inches, 
-                            panel.height_fraction
-                        )
-                        visual_panel_height = min(panel_height_inches, visual_usable_height) * scale
+            for panel in fixed_panels:  # Use fixed panels for display
+                if panel.id in self.selected_panels:
+                    panel_x = x_offset + (panel.x / 100 * scaled_width)
+                    panel_width = (panel.width / 100 * scaled_width)
+                    
+                    visual_panel_height = visual_height(panel)
+                    
+                    # Calculate panel y position based on floor mounting
+                    floor_mounted = True
+                    if hasattr(panel, 'floor_mounted'):
+                        floor_mounted = panel.floor_mounted
                         
-                        # Calculate panel y position based on floor mounting
-                        floor_mounted = True
-                        if hasattr(panel, 'floor_mounted'):
-                            floor_mounted = panel.floor_mounted
-                            
-                        if floor_mounted:
-                            # Floor mounted panels start from bottom (minus baseboard if used)
-                            if use_baseboard:
-                                panel_bottom = y_offset + scaled_height - baseboard_height
-                            else:
-                                panel_bottom = y_offset + scaled_height
+                    if floor_mounted:
+                        # Floor mounted panels start from bottom (minus baseboard if used)
+                        if use_baseboard:
+                            panel_bottom = y_offset + scaled_height - baseboard_height
                         else:
-                            # Calculate height offset in inches
-                            height_offset_inches = 0
-                            if hasattr(panel, 'height_offset') and panel.height_offset:
-                                height_offset_inches = self.convert_to_inches(
-                                    panel.height_offset.feet,
-                                    panel.height_offset.inches,
-                                    panel.height_offset_fraction
-                                )
-                            
-                            # For non-floor mounted panels, position from bottom with offset
-                            height_offset_scaled = height_offset_inches * scale
-                            
-                            # Calculate bottom position considering offset from floor
-                            panel_bottom = y_offset + scaled_height - height_offset_scaled
-                            
-                            # If there's a baseboard, make sure the panel is above it
-                            if use_baseboard:
-                                min_bottom = y_offset + scaled_height - baseboard_height
-                                panel_bottom = min(panel_bottom, min_bottom)
-                            
-                        panel_top = panel_bottom - visual_panel_height
+                            panel_bottom = y_offset + scaled_height
+                    else:
+                        # Calculate height offset in inches
+                        height_offset_inches = 0
+                        if hasattr(panel, 'height_offset') and panel.height_offset:
+                            height_offset_inches = self.convert_to_inches(
+                                panel.height_offset.feet,
+                                panel.height_offset.inches,
+                                panel.height_offset_fraction
+                            )
                         
-                        # Draw selection border
-                        self.canvas.create_rectangle(
-                            panel_x, panel_top,
-                            panel_x + panel_width, panel_bottom,
-                            outline="blue",
-                            width=3,
-                            dash=(5, 3)
-                        )
+                        # For non-floor mounted panels, position from bottom with offset
+                        height_offset_scaled = height_offset_inches * scale
+                        
+                        # Calculate bottom position considering offset from floor
+                        panel_bottom = y_offset + scaled_height - height_offset_scaled
+                        
+                        # If there's a baseboard, make sure the panel is above it
+                        if use_baseboard:
+                            min_bottom = y_offset + scaled_height - baseboard_height
+                            panel_bottom = min(panel_bottom, min_bottom)
+                        
+                    panel_top = panel_bottom - visual_panel_height
+                    
+                    # Draw selection border
+                    self.canvas.create_rectangle(
+                        panel_x, panel_top,
+                        panel_x + panel_width, panel_bottom,
+                        outline="blue",
+                        width=3,
+                        dash=(5, 3)
+                    )
 
         # Draw wall objects
         if hasattr(self, 'wall_objects') and self.wall_objects:
@@ -7792,7 +8292,6 @@ with precise measurements and customizable configurations.
         """Print the summary text"""
         try:
             import tempfile
-            import os
             import webbrowser
             
             # Create a temporary HTML file
@@ -7977,6 +8476,18 @@ with precise measurements and customizable configurations.
 
         
     def calculate(self):
+        """Request a recalculation - bursts of requests are coalesced into one redraw"""
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        self.after(self._min_redraw_interval_ms, self._flush_calculate)
+
+    def _flush_calculate(self):
+        """Run the recalculation scheduled by calculate()"""
+        self._redraw_pending = False
+        self._do_calculate()
+
+    def _do_calculate(self):
         """Complete optimized calculate method to prevent excessive recalculations"""
         
         # Prevent recursive calculations
@@ -7986,11 +8497,12 @@ with precise measurements and customizable configurations.
         
         # Skip unnecessary calculations during wall switching
         if hasattr(self, 'switching_walls') and self.switching_walls:
-            print("Skipping calculation during wall switching")
+            logger.debug("Skipping calculation during wall switching")
             return
         
         # Set flag to prevent recursive calls
         self.calculation_in_progress = True
+        self._scene_version += 1
         
         try:
             # COMPLETE CALCULATION LOGIC FROM YOUR ORIGINAL METHOD
@@ -7998,7 +8510,7 @@ with precise measurements and customizable configurations.
             # Add debugging
             current_wall = self.get_current_wall()
             if current_wall:
-                print(f"Calculating panels for: {current_wall.name} with height {current_wall.dimensions['height'].feet}'{current_wall.dimensions['height'].inches}\"")
+                logger.debug("Calculating panels for: %s with height %s'%s\"", current_wall.name, current_wall.dimensions['height'].feet, current_wall.dimensions['height'].inches)
             
             # Update dimensions from UI with safe conversion
             wall_width_feet = self.safe_int_conversion(self.wall_width_feet_var.get(), 0)
@@ -8019,21 +8531,13 @@ with precise measurements and customizable configurations.
             
             # CRITICAL FIX: Validate before updating dimensions
             if (wall_width_feet > 0 or wall_width_inches > 0) and (wall_height_feet > 0 or wall_height_inches > 0):
-                self.wall_dimensions = {
-                    "width": Dimension(wall_width_feet, wall_width_inches),
-                    "width_fraction": wall_width_fraction,
-                    "height": Dimension(wall_height_feet, wall_height_inches),
-                    "height_fraction": wall_height_fraction
-                }
-                
-                self.panel_dimensions = {
-                    "width": Dimension(panel_width_feet, panel_width_inches),
-                    "width_fraction": panel_width_fraction,
-                    "height": Dimension(panel_height_feet, panel_height_inches),
-                    "height_fraction": panel_height_fraction
-                }
+                # Update the shared dimension dicts in place rather than rebuilding them
+                self._update_dimensions(self.wall_dimensions, wall_width_feet, wall_width_inches, wall_width_fraction,
+                                        wall_height_feet, wall_height_inches, wall_height_fraction)
+                self._update_dimensions(self.panel_dimensions, panel_width_feet, panel_width_inches, panel_width_fraction,
+                                        panel_height_feet, panel_height_inches, panel_height_fraction)
             else:
-                print(f"CALC: Skipping dimension update - invalid values")
+                logger.debug("CALC: Skipping dimension update - invalid values")
                 return  # Don't proceed with invalid dimensions
             
             # Update other variables
@@ -8041,7 +8545,7 @@ with precise measurements and customizable configurations.
             self.panel_count = max(1, self.safe_int_conversion(self.panel_count_var.get(), 2))
             self.use_baseboard = self.baseboard_var.get()
             self.baseboard_height = self.safe_int_conversion(self.baseboard_height_var.get(), 4)
-            self.baseboard_fraction = self.baseboard_fraction_var.get() if hasattr(self, 'baseboard_fraction_var') else "0"
+            self.baseboard_fraction = self.baseboard_fraction_var.get() if self._has_baseboard_frac else "0"
             floor_mounted = self.floor_mounted_var.get()
             height_offset_feet = self.safe_int_conversion(self.height_offset_feet_var.get(), 0)
             height_offset_inches = self.safe_int_conversion(self.height_offset_inches_var.get(), 0)
@@ -8065,9 +8569,12 @@ with precise measurements and customizable configurations.
             if wall_width_inches_total <= 0 or wall_height_inches_total <= 0:
                 return
 
+            # Percent of wall width per inch, so positions and widths below are one multiply
+            pct_per_inch = 100.0 / wall_width_inches_total
+
             # Calculate baseboard height with fraction
             baseboard_inches_total = self.baseboard_height
-            if hasattr(self, 'baseboard_fraction_var'):
+            if self._has_baseboard_frac:
                 baseboard_inches_total += self.fraction_to_decimal(self.baseboard_fraction_var.get())
 
             # Calculate usable height
@@ -8090,7 +8597,7 @@ with precise measurements and customizable configurations.
             
             # Check if we have custom widths that should override everything else
             use_custom_panels = False
-            if hasattr(self, 'custom_panel_widths') and self.custom_panel_widths:
+            if self.custom_panel_widths:
                 custom_panel_ids = sorted(self.custom_panel_widths.keys())
                 if len(custom_panel_ids) > 0 and max(custom_panel_ids) <= 10:
                     total_width = sum(self.custom_panel_widths.values())
@@ -8099,37 +8606,41 @@ with precise measurements and customizable configurations.
             
             if use_custom_panels:
                 # Use purely custom panels based on stored widths
-                print("Using custom panel widths")
-                panel_ids = sorted(self.custom_panel_widths.keys())
+                logger.debug("Using custom panel widths")
+                # Panel IDs were sorted (and the widths summed) by the check above
+                panel_ids = custom_panel_ids
                 
-                total_width = sum(self.custom_panel_widths.values())
                 scale_factor = 1.0
                 if total_width > wall_width_inches_total:
                     scale_factor = wall_width_inches_total / total_width
-                    print(f"Scaling panel widths by factor {scale_factor}")
-                
-                current_x_percent = 0
-                for panel_id in panel_ids:
-                    panel_width = self.custom_panel_widths[panel_id] * scale_factor
-                    panel_width_percent = (panel_width / wall_width_inches_total * 100)
-                    panel_dim, panel_frac = self.convert_to_feet_inches_fraction(panel_width)
-                    
-                    panel = Panel(
+                    logger.debug("Scaling panel widths by factor %s", scale_factor)
+                
+                # Create panels with custom widths
+                panel_widths = [self.custom_panel_widths[panel_id] * scale_factor for panel_id in panel_ids]
+                panel_width_percents = [panel_width * pct_per_inch for panel_width in panel_widths]
+                panel_sizes = self.convert_widths_to_feet_inches_fraction(panel_widths)
+                panel_height_offset = height_offset_dim if not floor_mounted else None
+                panel_height_offset_fraction = height_offset_fraction if not floor_mounted else "0"
+
+                # Each panel starts where the previous one ended (as a percentage)
+                panels = [
+                    Panel(
                         id=panel_id,
-                        x=current_x_percent,
+                        x=x_percent,
                         width=panel_width_percent,
-                        actual_width=panel_dim, 
+                        actual_width=panel_dim,
                         actual_width_fraction=panel_frac,
                         height=panel_height_dim,
                         height_fraction=panel_height_frac,
                         color=self.panel_color,
                         border_color=self.panel_border_color,
                         floor_mounted=floor_mounted,
-                        height_offset=height_offset_dim if not floor_mounted else None,
-                        height_offset_fraction=height_offset_fraction if not floor_mounted else "0"
+                        height_offset=panel_height_offset,
+                        height_offset_fraction=panel_height_offset_fraction
                     )
-                    panels.append(panel)
-                    current_x_percent += panel_width_percent
+                    for panel_id, x_percent, panel_width_percent, (panel_dim, panel_frac) in zip(
+                        panel_ids, accumulate(panel_width_percents, initial=0), panel_width_percents, panel_sizes)
+                ]
                     
             # ADD START SEAM LOGIC HERE (if you implemented it)
             elif hasattr(self, 'use_start_seam_var') and self.use_start_seam_var.get():
@@ -8157,7 +8668,7 @@ with precise measurements and customizable configurations.
                     panels.append(Panel(
                         id=1,
                         x=0,
-                        width=(side_panel_width / wall_width_inches_total * 100),
+                        width=(side_panel_width * pct_per_inch),
                         actual_width=side_panel_dim,
                         actual_width_fraction=side_panel_frac,
                         height=panel_height_dim,
@@ -8174,8 +8685,8 @@ with precise measurements and customizable configurations.
                     center_panel_dim, center_panel_frac = self.convert_to_feet_inches_fraction(center_panel_width)
                     panels.append(Panel(
                         id=len(panels) + 1,
-                        x=(side_panel_width + i * center_panel_width) / wall_width_inches_total * 100,
-                        width=(center_panel_width / wall_width_inches_total * 100),
+                        x=(side_panel_width + i * center_panel_width) * pct_per_inch,
+                        width=(center_panel_width * pct_per_inch),
                         actual_width=center_panel_dim,
                         actual_width_fraction=center_panel_frac,
                         height=panel_height_dim,
@@ -8192,8 +8703,8 @@ with precise measurements and customizable configurations.
                     side_panel_dim, side_panel_frac = self.convert_to_feet_inches_fraction(side_panel_width)
                     panels.append(Panel(
                         id=len(panels) + 1,
-                        x=((wall_width_inches_total - side_panel_width) / wall_width_inches_total * 100),
-                        width=(side_panel_width / wall_width_inches_total * 100),
+                        x=((wall_width_inches_total - side_panel_width) * pct_per_inch),
+                        width=(side_panel_width * pct_per_inch),
                         actual_width=side_panel_dim,
                         actual_width_fraction=side_panel_frac,
                         height=panel_height_dim,
@@ -8209,13 +8720,18 @@ with precise measurements and customizable configurations.
             elif self.use_equal_panels:
                 base_panel_width = wall_width_inches_total / self.panel_count
                 
-                current_x = 0
-                for i in range(self.panel_count):
-                    panel_dim, panel_frac = self.convert_to_feet_inches_fraction(base_panel_width)
-                    panels.append(Panel(
+                # Every panel is identical apart from its position, so the width,
+                # its feet/inches form and the offset are worked out once
+                panel_dim, panel_frac = self.convert_to_feet_inches_fraction(base_panel_width)
+                panel_width_percent = base_panel_width * pct_per_inch
+                panel_height_offset = height_offset_dim if not floor_mounted else None
+                panel_height_offset_fraction = height_offset_fraction if not floor_mounted else "0"
+                
+                panels = [
+                    Panel(
                         id=i+1,
-                        x=(current_x / wall_width_inches_total * 100),
-                        width=(base_panel_width / wall_width_inches_total * 100),
+                        x=(i * base_panel_width * pct_per_inch),
+                        width=panel_width_percent,
                         actual_width=panel_dim,
                         actual_width_fraction=panel_frac,
                         height=panel_height_dim,
@@ -8223,10 +8739,11 @@ with precise measurements and customizable configurations.
                         color=self.panel_color,
                         border_color=self.panel_border_color,
                         floor_mounted=floor_mounted,
-                        height_offset=height_offset_dim if not floor_mounted else None,
-                        height_offset_fraction=height_offset_fraction if not floor_mounted else "0"
-                    ))
-                    current_x += base_panel_width
+                        height_offset=panel_height_offset,
+                        height_offset_fraction=panel_height_offset_fraction
+                    )
+                    for i in range(self.panel_count)
+                ]
                     
             # Fixed Width Panels Logic
             else:
@@ -8239,16 +8756,41 @@ with precise measurements and customizable configurations.
                 if panel_width_inches_total <= 0:
                     return
 
-                current_x = 0
-                panel_id = 1
-                while current_x < wall_width_inches_total:
-                    current_panel_width = min(panel_width_inches_total, wall_width_inches_total - current_x)
-                    panel_dim, panel_frac = self.convert_to_feet_inches_fraction(current_panel_width)
-                    
+                # All panels but the last (remainder) one share the full width
+                full_width_percent = panel_width_inches_total * pct_per_inch
+                full_dim, full_frac = self.convert_to_feet_inches_fraction(panel_width_inches_total)
+
+                panel_height_offset = height_offset_dim if not floor_mounted else None
+                panel_height_offset_fraction = height_offset_fraction if not floor_mounted else "0"
+
+                # Count the full-width panels up front instead of walking the wall
+                n_full = int(wall_width_inches_total // panel_width_inches_total)
+                remainder = wall_width_inches_total - n_full * panel_width_inches_total
+
+                panels = [
+                    Panel(
+                        id=i+1,
+                        x=(i * panel_width_inches_total * pct_per_inch),
+                        width=full_width_percent,
+                        actual_width=full_dim,
+                        actual_width_fraction=full_frac,
+                        height=panel_height_dim,
+                        height_fraction=panel_height_frac,
+                        color=self.panel_color,
+                        border_color=self.panel_border_color,
+                        floor_mounted=floor_mounted,
+                        height_offset=panel_height_offset,
+                        height_offset_fraction=panel_height_offset_fraction
+                    )
+                    for i in range(n_full)
+                ]
+
+                if remainder > 0:
+                    panel_dim, panel_frac = self.convert_to_feet_inches_fraction(remainder)
                     panels.append(Panel(
-                        id=panel_id,
-                        x=(current_x / wall_width_inches_total * 100),
-                        width=(current_panel_width / wall_width_inches_total * 100),
+                        id=n_full + 1,
+                        x=(n_full * panel_width_inches_total * pct_per_inch),
+                        width=(remainder * pct_per_inch),
                         actual_width=panel_dim,
                         actual_width_fraction=panel_frac,
                         height=panel_height_dim,
@@ -8256,23 +8798,22 @@ with precise measurements and customizable configurations.
                         color=self.panel_color,
                         border_color=self.panel_border_color,
                         floor_mounted=floor_mounted,
-                        height_offset=height_offset_dim if not floor_mounted else None,
-                        height_offset_fraction=height_offset_fraction if not floor_mounted else "0"
+                        height_offset=panel_height_offset,
+                        height_offset_fraction=panel_height_offset_fraction
                     ))
-                    current_x += panel_width_inches_total
-                    panel_id += 1
             
             # Process split panels (your existing logic)
-            if hasattr(self, 'split_panels') and self.split_panels:
-                # Create a mapping of original panels by ID
-                panel_map = {p.id: p for p in panels}
-                
+            if self.split_panels:
                 # Create the final panel list
                 final_panels = []
                 processed_ids = set()
                 
                 # Sort panels by their x position for consistent ordering
-                sorted_panels = sorted(panels, key=lambda p: p.x)
+                sorted_panels = sorted(panels, key=_BY_X)
+                
+                # Split info by left panel id (reversed so the first split wins,
+                # as the old linear scan did)
+                split_by_left_id = {info['left_id']: info for info in reversed(self.split_panels.values())}
                 
                 for panel in sorted_panels:
                     # Skip if we've already processed this panel
@@ -8280,16 +8821,9 @@ with precise measurements and customizable configurations.
                         continue
                     
                     # Check if this panel is the left side of a split
-                    is_left_panel = False
-                    split_info = None
-                    
-                    for orig_id, info in self.split_panels.items():
-                        if panel.id == info['left_id']:
-                            is_left_panel = True
-                            split_info = info
-                            break
+                    split_info = split_by_left_id.get(panel.id)
                     
-                    if not is_left_panel:
+                    if split_info is None:
                         # This is not a split panel's left side, add as-is
                         final_panels.append(panel)
                         processed_ids.add(panel.id)
@@ -8298,7 +8832,7 @@ with precise measurements and customizable configurations.
                     # This is a left panel in a split
                     half_width_inches = split_info['half_width']
                     half_dim, half_frac = self.convert_to_feet_inches_fraction(half_width_inches)
-                    half_width_percent = (half_width_inches / wall_width_inches_total) * 100
+                    half_width_percent = (half_width_inches * pct_per_inch)
                     
                     # Add left panel
                     left_panel = Panel(
@@ -8354,7 +8888,7 @@ with precise measurements and customizable configurations.
                 current_wall.panels = copy.deepcopy(panels)
                 if hasattr(self, 'wall_dimensions'):
                     current_wall.dimensions = copy.deepcopy(self.wall_dimensions)
-                print(f"Updated {current_wall.name} panels: {len(panels)}")
+                logger.debug("Updated %s panels: %s", current_wall.name, len(panels))
             
         finally:
             # Always reset the flag
@@ -8381,7 +8915,7 @@ with precise measurements and customizable configurations.
             baseboard_height_inches = self.baseboard_height
             baseboard_fraction = "0"
             
-            if hasattr(self, 'baseboard_fraction_var'):
+            if self._has_baseboard_frac:
                 baseboard_fraction = self.baseboard_fraction_var.get()
                 baseboard_height_inches += self.fraction_to_decimal(baseboard_fraction)
                 
@@ -8432,5 +8966,6 @@ with precise measurements and customizable configurations.
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     app = WallcoveringCalculatorUI()
     app.mainloop()